@@ -13,9 +13,15 @@ import json
 import csv
 from typing import List, Dict, Optional
 import logging
+import os
 import unicodedata
+from collections import deque
 from io import BytesIO
 
+from email_scanner import find_emails
+from parse_supervisor import SupervisedPool, ParseTimeout, ParseMemoryExceeded
+from pdf_sources import iter_pdf_sources, acl_id_from_name
+
 # Prioritize PyMuPDF for font-size based title extraction
 try:
     import fitz  # PyMuPDF
@@ -240,9 +246,9 @@ def extract_emails(text: str, title: str = '') -> List[str]:
     # Extract text from author section only
     author_section_text = '\n'.join(lines[author_section_start:author_section_end])
     
-    # Email regex pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, author_section_text)
+    # Brace groups, [at]/[dot] obfuscations and wrapped lines are handled by
+    # the shared scanner; results are unique, in order of appearance
+    emails = find_emails(author_section_text)
     
     # Filter out placeholder/template emails
     placeholder_patterns = [
@@ -256,28 +262,7 @@ def extract_emails(text: str, title: str = '') -> List[str]:
         'your.email@',
         'youremail@'
     ]
-    emails = [e for e in emails if not any(p in e.lower() for p in placeholder_patterns)]
-    
-    # Also handle emails in curly braces: {email1,email2,email3}@domain.com
-    # Pattern: {word1,word2,word3}@domain.com
-    brace_pattern = r'\{([^}]+)\}@([A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
-    brace_matches = re.findall(brace_pattern, author_section_text)
-    for usernames, domain in brace_matches:
-        # Split by comma and create full emails
-        for username in usernames.split(','):
-            username = username.strip()
-            if username:
-                emails.append(f"{username}@{domain}")
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_emails = []
-    for email in emails:
-        email_lower = email.lower()
-        if email_lower not in seen:
-            seen.add(email_lower)
-            unique_emails.append(email)
-    return unique_emails
+    return [e for e in emails if not any(p in e.lower() for p in placeholder_patterns)]
 
 
 def extract_title_from_layout(text_blocks: list) -> Optional[str]:
@@ -668,7 +653,7 @@ def extract_authors(text: str, title: str = '') -> List[str]:
                 # If >=80% of line's significant words are in title, it's a title fragment
                 match_ratio = len(common_words) / len(line_words)
                 if match_ratio >= 0.8 or len(common_words) >= 3:
-            continue
+                    continue
         
         # Skip if it's mostly institution text
         if sum(1 for word in line_lower.split() if word in false_positives) > 2:
@@ -884,36 +869,64 @@ def extract_authors(text: str, title: str = '') -> List[str]:
     return unique_authors
 
 
-def parse_acl_pdf(url: str) -> Dict[str, any]:
+# Per-paper statuses recorded in the output manifest
+STATUS_OK = 'ok'
+STATUS_NOT_FOUND = 'not-found'
+STATUS_HTTP_ERROR = 'http-error'
+STATUS_NO_RESULT = 'no-result'  # Parsed, but no usable authors / author section
+STATUS_PARSE_ERROR = 'parse-error'
+STATUS_PARSE_TIMEOUT = 'parse-timeout'  # Parse worker killed: over --parse-timeout or --parse-max-rss-mb
+
+
+def download_acl_pdf(url: str) -> tuple[Optional[bytes], str]:
     """
-    Download and parse ACL PDF to extract paper information.
-    
-    Args:
-        url: URL to ACL PDF (e.g., https://aclanthology.org/2024.acl-long.1.pdf)
+    Download an ACL PDF.
     
     Returns:
-        Dictionary with title, authors, emails, and author_email_pairs, or None if 404
+        (pdf_content, status) - pdf_content is None with status not-found / http-error on failure
     """
-    logger.info(f"Processing: {url}")
-    
-    # Download PDF
     try:
         response = requests.get(url, timeout=30)
         if response.status_code == 404:
             logger.info(f"Paper not found (404): {url}")
-            return None
+            return (None, STATUS_NOT_FOUND)
         response.raise_for_status()
-        pdf_content = response.content
+        return (response.content, STATUS_OK)
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
             logger.info(f"Paper not found (404): {url}")
-            return None
+            return (None, STATUS_NOT_FOUND)
         logger.error(f"Failed to download PDF: {e}")
-        return None
+        return (None, STATUS_HTTP_ERROR)
     except Exception as e:
         logger.error(f"Failed to download PDF: {e}")
+        return (None, STATUS_HTTP_ERROR)
+
+
+def parse_acl_pdf(url: str) -> Dict[str, any]:
+    """
+    Download and parse ACL PDF to extract paper information.
+    
+    Args:
+        url: URL to ACL PDF (e.g., https://aclanthology.org/2024.acl-long.1.pdf)
+    
+    Returns:
+        Dictionary with title, authors, emails, and author_email_pairs, or None if 404
+    """
+    logger.info(f"Processing: {url}")
+    pdf_content, _ = download_acl_pdf(url)
+    if pdf_content is None:
         return None
+    return parse_acl_content(pdf_content, url)
+
+
+def parse_acl_content(pdf_content: bytes, url: str) -> Dict[str, any]:
+    """
+    Parse a downloaded ACL PDF (runs in a supervised parse worker from main()).
     
+    Returns:
+        Dictionary with title, authors, emails, and author_email_pairs, or None if unusable
+    """
     # Extract text - PRIMARY METHOD: PyMuPDF with font-size based title extraction
     try:
         if PDF_LIB == 'pymupdf':
@@ -1118,10 +1131,10 @@ def parse_acl_pdf(url: str) -> Dict[str, any]:
         while remaining_line:
             # Try to match numbered institution at start of remaining text
             num_match = re.match(r'^\s*([0-9]+)[\s\.]+(.+)', remaining_line)
-        if not num_match:
-            # Try without space (number directly before text)
+            if not num_match:
+                # Try without space (number directly before text)
                 num_match = re.match(r'^\s*([0-9]+)([A-Z].+)', remaining_line)
-        
+            
             if not num_match:
                 break  # No more numbered institutions on this line
             
@@ -1341,9 +1354,9 @@ def parse_acl_pdf(url: str) -> Dict[str, any]:
         # If affiliation_map is empty, all authors are from the same institution
         # (Superscripts on author names in this case are footnotes, not affiliation markers)
         if not affiliation_map or not institutions:
-                # Look for single institution in author section
+            # Look for single institution in author section
             # When no superscripts, all authors are from the same institution
-                for line in author_section_lines:
+            for line in author_section_lines:
                 line_stripped = line.strip()
                 if not line_stripped:
                     continue
@@ -1959,7 +1972,7 @@ def parse_acl_pdf(url: str) -> Dict[str, any]:
         author_sups = author_superscripts.get(author, [])
         author_domains = set()
         for sup in author_sups:
-                for other_author in authors:
+            for other_author in authors:
                 if other_author != author and other_author in author_to_email:
                     other_email = author_to_email[other_author]
                     other_sups = author_superscripts.get(other_author, [])
@@ -2048,13 +2061,13 @@ def parse_acl_pdf(url: str) -> Dict[str, any]:
             # Also check if any other candidate has same first name and similar score
             elif best_first == second_first:
                 for other_author, other_score, other_conf in email_candidates[1:]:
-                        other_first = other_author.split()[0].lower()
+                    other_first = other_author.split()[0].lower()
                     if other_first == best_first and abs(other_score - best_score) <= 2.0 and abs(other_conf - best_confidence) <= 0.15:
                         is_ambiguous = True
                         break
         
         if is_ambiguous:
-                                ambiguous_emails.add(email)
+            ambiguous_emails.add(email)
         else:
             # Assign email to the best matching author
             author_to_email[best_author] = email
@@ -2103,6 +2116,20 @@ def parse_acl_pdf(url: str) -> Dict[str, any]:
     return result
 
 
+def get_manifest_path(output_file: str) -> Path:
+    """Manifest sidecar next to the output: acl_papers_info.csv -> acl_papers_info.manifest.jsonl"""
+    return Path(output_file).with_suffix('.manifest.jsonl')
+
+
+def record_status(manifest_path: Path, url: str, status: str, error: str = ''):
+    """Append one paper's outcome to the output manifest."""
+    entry = {'url': url, 'status': status}
+    if error:
+        entry['error'] = error
+    with open(manifest_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry) + '\n')
+
+
 def save_results(results: List[Dict], output_file: str = 'acl_papers_info.csv', append: bool = False):
     """Save results to CSV file."""
     if not results:
@@ -2189,6 +2216,9 @@ Examples:
   
   # From file
   python extract_acl_info.py --urls-file urls.txt
+  
+  # Offline, from a local Anthology dump (directory or tar/zip, files named by Anthology ID)
+  python extract_acl_info.py --pdf-source acl_2024_pdfs.tar.gz
         """
     )
     parser.add_argument('url', nargs='?', help='ACL PDF URL to process')
@@ -2204,6 +2234,15 @@ Examples:
     parser.add_argument('--json', type=str, help='Also save as JSON file')
     parser.add_argument('--auto-detect', action='store_true', 
                        help='Auto-detect paper range by trying papers until 404 error')
+    parser.add_argument('--pdf-source', action='append',
+                       help='Read PDFs from a local directory or tar/zip archive instead of downloading '
+                            '(files named by Anthology ID, e.g. 2024.acl-long.1.pdf). Repeatable')
+    parser.add_argument('--parse-workers', type=int,
+                       help='Parse worker processes (default: 1 when downloading, CPU count - 1 with --pdf-source)')
+    parser.add_argument('--parse-timeout', type=float, default=60,
+                       help='Seconds a PDF may take to parse before its worker is killed (default: 60, 0 = no limit)')
+    parser.add_argument('--parse-max-rss-mb', type=float, default=1024,
+                       help='Memory (MB) a parse worker may use before it is killed (default: 1024, 0 = no limit)')
     
     args = parser.parse_args()
     
@@ -2227,7 +2266,7 @@ Examples:
                 return f"https://aclanthology.org/{year}.findings-acl.{paper_num}.pdf"
             else:
                 # Regular tracks: {year}.acl-{track}.{num}.pdf
-            return f"https://aclanthology.org/{year}.acl-{track}.{paper_num}.pdf"
+                return f"https://aclanthology.org/{year}.acl-{track}.{paper_num}.pdf"
         elif year == 2020:
             # 2020: {year}.acl-main.{num}.pdf (no track differentiation, starts from 1)
             return f"https://aclanthology.org/{year}.acl-main.{paper_num}.pdf"
@@ -2251,7 +2290,9 @@ Examples:
     # Get URLs to process
     urls = []
     
-    if args.range:
+    if args.pdf_source:
+        pass  # PDFs come from the local sources, see below
+    elif args.range:
         # Generate URLs from range
         if len(args.range) == 2:
             # Range: --range 1 10
@@ -2328,26 +2369,75 @@ Examples:
     
     # Process URLs with progress tracking and real-time saving
     results = []
-    total_urls = len(urls)
-    
-    for idx, url in enumerate(urls, 1):
-        # Print progress
-        print(f"\n[{idx}/{total_urls}] Processing: {url}")
+    manifest_path = get_manifest_path(args.output)
+    
+    # (url, pdf_content, status) per paper, downloaded lazily or read from local sources
+    if args.pdf_source:
+        papers = ((f"https://aclanthology.org/{acl_id_from_name(name)}.pdf",
+                   pdf.read_bytes() if isinstance(pdf, Path) else pdf, STATUS_OK)
+                  for name, pdf in iter_pdf_sources(args.pdf_source))
+        total_urls = '?'
+        parse_workers = args.parse_workers or max(1, (os.cpu_count() or 2) - 1)
+    else:
+        papers = ((url,) + download_acl_pdf(url) for url in urls)
+        total_urls = len(urls)
+        parse_workers = args.parse_workers or 1
+    
+    # Parsing runs in supervised workers: a PDF that hangs MuPDF or blows up memory is
+    # killed after --parse-timeout / --parse-max-rss-mb and recorded as parse-timeout
+    parse_pool = SupervisedPool(parse_workers, task_timeout=args.parse_timeout or None,
+                                max_rss_mb=args.parse_max_rss_mb or None)
+    pending = deque()
+    attempted = 0
+    
+    def collect(idx, url, future, status):
+        result = None
+        if future is not None:
+            try:
+                result = future.result()
+                status = STATUS_OK if result else STATUS_NO_RESULT
+            except (ParseTimeout, ParseMemoryExceeded) as e:
+                logger.error(f"⏱️  Parse worker killed for {url}: {e}")
+                status = STATUS_PARSE_TIMEOUT
+            except Exception as e:
+                logger.error(f"Failed to parse PDF {url}: {e}")
+                status = STATUS_PARSE_ERROR
+        record_status(manifest_path, url, status)
         
-        result = parse_acl_pdf(url)
         if result:
             results.append(result)
             # Save incrementally after each paper
             # Append after first paper (idx > 0) or if --append flag is set
             save_results([result], args.output, append=(idx > 0 or args.append))
-            print(f"  ✓ Saved to {args.output}")
+            print(f"  ✓ [{idx}] Saved to {args.output}")
+        elif status == STATUS_PARSE_TIMEOUT:
+            print(f"  ✗ [{idx}] Parse timed out or ran out of memory (see {manifest_path})")
+        elif status == STATUS_NO_RESULT:
+            print(f"  ✗ [{idx}] No usable authors found")
         else:
-            print(f"  ✗ Failed or not found (404)")
+            print(f"  ✗ [{idx}] Failed or not found (404)")
+    
+    try:
+        for idx, (url, pdf_content, status) in enumerate(papers, 1):
+            # Print progress
+            print(f"\n[{idx}/{total_urls}] Processing: {url}")
+            logger.info(f"Processing: {url}")
+            attempted = idx
+            
+            future = parse_pool.submit(parse_acl_content, pdf_content, url) if pdf_content is not None else None
+            pending.append((idx, url, future, status))
+            # Keep up to two parses per worker in flight; results are saved in input order
+            while len(pending) > 2 * parse_workers - 1 or (pending and pending[0][2] is None):
+                collect(*pending.popleft())
+        while pending:
+            collect(*pending.popleft())
+    finally:
+        parse_pool.shutdown(wait=True, cancel_futures=True)
     
     # Final summary
     if results:
         print(f"\n{'='*60}")
-        print(f"Summary: Processed {len(results)}/{total_urls} papers successfully")
+        print(f"Summary: Processed {len(results)}/{attempted} papers successfully")
         print(f"Results saved to: {args.output}")
         
         total_authors = sum(len(r['authors']) for r in results)
@@ -7,6 +7,12 @@ Configuration is loaded from arxiv_collection_config.json.
 
 Usage:
     python3.9 2.1-collect_arxiv_papers.py
+    
+    # Re-fetch only windows that failed or came back short (see *_windows.json)
+    python3.9 2.1-collect_arxiv_papers.py --repair
+    
+    # Sharded mode: start any number of workers (same machine or shared filesystem)
+    python3.9 2.1-collect_arxiv_papers.py --worker
 
 The script reads collection parameters from arxiv_collection_config.json:
 - Round number
@@ -21,8 +27,13 @@ import csv
 import time
 import logging
 import json
+import os
+import socket
+import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -38,7 +49,107 @@ def get_month_days(year: int, month: int) -> int:
     else:
         return 31
 
-def query_month_papers(category: str, year: int, month: int, batch_size: int = 1000, rate_limit_delay: float = 3.0) -> List[Dict]:
+# arXiv API namespace
+ARXIV_NS = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'arxiv': 'http://arxiv.org/schemas/atom',
+    'opensearch': 'http://a9.com/-/spec/opensearch/1.1/'
+}
+
+def build_month_query(category: str, year: int, month: int) -> str:
+    """Build the arXiv search query for one category/year/month date slice."""
+    last_day = get_month_days(year, month)
+    date_start = f"{year}{month:02d}01"
+    date_end = f"{year}{month:02d}{last_day}"
+    return f"cat:{category}+AND+submittedDate:[{date_start}+TO+{date_end}]"
+
+def parse_entry(entry, category: str, year: int) -> Optional[Dict]:
+    """Convert one Atom <entry> into a paper dict (None if it has no ID)."""
+    ns = ARXIV_NS
+    
+    # Get paper ID
+    paper_id_elem = entry.find('atom:id', ns)
+    if paper_id_elem is None:
+        return None
+    
+    # Extract arXiv ID
+    paper_url = paper_id_elem.text
+    arxiv_id = paper_url.split('/')[-1]
+    arxiv_id_clean = arxiv_id.split('v')[0] if 'v' in arxiv_id else arxiv_id
+    version = arxiv_id[len(arxiv_id_clean):]  # e.g. 'v2' (latest version at query time)
+    
+    # Construct PDF URL
+    pdf_url = f"https://arxiv.org/pdf/{arxiv_id_clean}.pdf"
+    
+    # Get title
+    title_elem = entry.find('atom:title', ns)
+    title = title_elem.text.strip() if title_elem is not None else ""
+    title = ' '.join(title.split())
+    
+    # Get authors
+    author_elems = entry.findall('atom:author', ns)
+    authors = []
+    for author_elem in author_elems:
+        name_elem = author_elem.find('atom:name', ns)
+        if name_elem is not None:
+            authors.append(name_elem.text.strip())
+    
+    authors_str = '; '.join(authors)
+    
+    # Get publication info
+    journal_ref_elem = entry.find('arxiv:journal_ref', ns)
+    journal_ref = journal_ref_elem.text.strip() if journal_ref_elem is not None else ""
+    
+    doi_elem = entry.find('arxiv:doi', ns)
+    doi = doi_elem.text.strip() if doi_elem is not None else ""
+    
+    comment_elem = entry.find('arxiv:comment', ns)
+    comment = comment_elem.text.strip() if comment_elem is not None else ""
+    
+    return {
+        'arxiv_id': arxiv_id_clean,
+        'pdf_url': pdf_url,
+        'title': title,
+        'authors': authors_str,
+        'journal_ref': journal_ref,
+        'doi': doi,
+        'comment': comment,
+        'category': category,
+        'year': year,
+        'version': version
+    }
+
+def fetch_window(query: str, start: int, batch_size: int, category: str, year: int) -> Tuple[List[Dict], int]:
+    """
+    Fetch one result window (start..start+batch_size) for a query.
+    
+    Returns:
+        (papers, entries_received) - raises on HTTP/XML errors so the caller can record the gap
+    """
+    url = f"http://export.arxiv.org/api/query?search_query={query}&start={start}&max_results={batch_size}&sortBy=submittedDate&sortOrder=descending"
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    root = ET.fromstring(response.content)
+    
+    entries = root.findall('atom:entry', ARXIV_NS)
+    papers = []
+    for entry in entries:
+        paper = parse_entry(entry, category, year)
+        if paper is not None:
+            papers.append(paper)
+    return papers, len(entries)
+
+def record_window(month_log: Optional[Dict], start: int, expected: int, received: int, status: str, error: str = ''):
+    """Append a fetched (or skipped) window to the month's log."""
+    if month_log is None:
+        return
+    window = {'start': start, 'expected': expected, 'received': received, 'status': status}
+    if error:
+        window['error'] = error
+    month_log['windows'].append(window)
+
+def query_month_papers(category: str, year: int, month: int, batch_size: int = 1000, rate_limit_delay: float = 3.0,
+                       month_log: Optional[Dict] = None, limiter: Optional['SharedRateLimiter'] = None) -> List[Dict]:
     """
     Query arXiv API for all papers in a specific category/year/month.
     
@@ -47,6 +158,9 @@ def query_month_papers(category: str, year: int, month: int, batch_size: int = 1
         year: Year to query
         month: Month (1-12)
         batch_size: Results per API call (max 2000, default 1000)
+        month_log: Optional dict filled with total_available and one entry per
+                   window (start, expected, received, status) for gap repair
+        limiter: Optional shared limiter (sharded mode); replaces the fixed per-request sleep
     
     Returns:
         List of papers for that month
@@ -54,30 +168,26 @@ def query_month_papers(category: str, year: int, month: int, batch_size: int = 1
     papers = []
     start = 0
     
-    # arXiv API namespace
-    ns = {
-        'atom': 'http://www.w3.org/2005/Atom',
-        'arxiv': 'http://arxiv.org/schemas/atom',
-        'opensearch': 'http://a9.com/-/spec/opensearch/1.1/'
-    }
+    if month_log is not None:
+        month_log.update({'total_available': 0, 'status': 'ok', 'windows': []})
     
-    # Date range for the month
-    last_day = get_month_days(year, month)
-    date_start = f"{year}{month:02d}01"
-    date_end = f"{year}{month:02d}{last_day}"
-    
-    query = f"cat:{category}+AND+submittedDate:[{date_start}+TO+{date_end}]"
+    query = build_month_query(category, year, month)
     
     # First call to get total count
     url = f"http://export.arxiv.org/api/query?search_query={query}&start=0&max_results=1"
     try:
+        if limiter is not None:
+            limiter.wait()
         response = requests.get(url, timeout=30)
         response.raise_for_status()
         root = ET.fromstring(response.content)
         
-        total_elem = root.find('opensearch:totalResults', ns)
+        total_elem = root.find('opensearch:totalResults', ARXIV_NS)
         total_available = int(total_elem.text) if total_elem is not None else 0
         
+        if month_log is not None:
+            month_log['total_available'] = total_available
+        
         if total_available == 0:
             return []
         
@@ -89,6 +199,10 @@ def query_month_papers(category: str, year: int, month: int, batch_size: int = 1
         
     except Exception as e:
         logger.error(f"    Error getting count for month {month}: {e}")
+        if month_log is not None:
+            # Whole date slice is unknown - repair re-runs the full month
+            month_log['status'] = 'count-error'
+            month_log['error'] = str(e)
         return []
     
     # Now collect all papers for this month
@@ -96,101 +210,61 @@ def query_month_papers(category: str, year: int, month: int, batch_size: int = 1
     max_consecutive_empty = 3
     
     while start < total_available:
-        url = f"http://export.arxiv.org/api/query?search_query={query}&start={start}&max_results={batch_size}&sortBy=submittedDate&sortOrder=descending"
+        expected = min(batch_size, total_available - start)
         
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            root = ET.fromstring(response.content)
-            
-            entries = root.findall('atom:entry', ns)
+            if limiter is not None:
+                limiter.wait()
+            window_papers, received = fetch_window(query, start, batch_size, category, year)
             
-            if not entries:
+            if not received:
+                record_window(month_log, start, expected, 0, 'empty')
                 consecutive_empty += 1
+                start += batch_size
                 if consecutive_empty >= max_consecutive_empty:
                     break
-                start += batch_size
-                time.sleep(3)
+                if limiter is None:
+                    time.sleep(3)
                 continue
             
             consecutive_empty = 0
-            
-            for entry in entries:
-                # Get paper ID
-                paper_id_elem = entry.find('atom:id', ns)
-                if paper_id_elem is None:
-                    continue
-                
-                # Extract arXiv ID
-                paper_url = paper_id_elem.text
-                arxiv_id = paper_url.split('/')[-1]
-                arxiv_id_clean = arxiv_id.split('v')[0] if 'v' in arxiv_id else arxiv_id
-                
-                # Construct PDF URL
-                pdf_url = f"https://arxiv.org/pdf/{arxiv_id_clean}.pdf"
-                
-                # Get title
-                title_elem = entry.find('atom:title', ns)
-                title = title_elem.text.strip() if title_elem is not None else ""
-                title = ' '.join(title.split())
-                
-                # Get authors
-                author_elems = entry.findall('atom:author', ns)
-                authors = []
-                for author_elem in author_elems:
-                    name_elem = author_elem.find('atom:name', ns)
-                    if name_elem is not None:
-                        authors.append(name_elem.text.strip())
-                
-                authors_str = '; '.join(authors)
-                
-                # Get publication info
-                journal_ref_elem = entry.find('arxiv:journal_ref', ns)
-                journal_ref = journal_ref_elem.text.strip() if journal_ref_elem is not None else ""
-                
-                doi_elem = entry.find('arxiv:doi', ns)
-                doi = doi_elem.text.strip() if doi_elem is not None else ""
-                
-                comment_elem = entry.find('arxiv:comment', ns)
-                comment = comment_elem.text.strip() if comment_elem is not None else ""
-                
-                papers.append({
-                    'arxiv_id': arxiv_id_clean,
-                    'pdf_url': pdf_url,
-                    'title': title,
-                    'authors': authors_str,
-                    'journal_ref': journal_ref,
-                    'doi': doi,
-                    'comment': comment,
-                    'category': category,
-                    'year': year
-                })
+            papers.extend(window_papers)
+            record_window(month_log, start, expected, received, 'ok' if received >= expected else 'short')
             
             # Move to next batch
             start += batch_size
             
-            # Rate limiting (configurable delay per arXiv policy)
-            time.sleep(rate_limit_delay)
+            # Rate limiting (configurable delay per arXiv policy; the shared limiter paces sharded workers)
+            if limiter is None:
+                time.sleep(rate_limit_delay)
             
         except Exception as e:
             logger.error(f"    Error at offset {start} for month {month}: {e}")
+            record_window(month_log, start, expected, 0, 'error', str(e))
             consecutive_empty += 1
+            start += batch_size
             if consecutive_empty >= max_consecutive_empty:
                 break
             time.sleep(10)
-            start += batch_size
             continue
     
+    # Anything left after giving up is recorded so --repair can fetch it later
+    while start < total_available:
+        record_window(month_log, start, min(batch_size, total_available - start), 0, 'abandoned')
+        start += batch_size
+    
     logger.info(f"    ✓ Month {month:02d}/{year}: Collected {len(papers):,} papers")
     return papers
 
-def query_year_by_months(category: str, year: int, batch_size: int = 1000, rate_limit_delay: float = 3.0) -> List[Dict]:
+def query_year_by_months(category: str, year: int, batch_size: int = 1000, rate_limit_delay: float = 3.0,
+                         window_manifest: Optional[Dict] = None) -> List[Dict]:
     """
     Query all papers for a year by breaking into monthly queries.
     
     Args:
         category: arXiv category (e.g., 'cs.LG')
         year: Year to query
+        window_manifest: Optional manifest dict; each month's window log is stored under ['months']['MM']
     
     Returns:
         List of all papers for that year
@@ -203,7 +277,10 @@ def query_year_by_months(category: str, year: int, batch_size: int = 1000, rate_
     
     # Query each month
     for month in range(1, 13):
-        month_papers = query_month_papers(category, year, month, batch_size, rate_limit_delay)
+        month_log = None
+        if window_manifest is not None:
+            month_log = window_manifest['months'].setdefault(f"{month:02d}", {})
+        month_papers = query_month_papers(category, year, month, batch_size, rate_limit_delay, month_log)
         all_papers.extend(month_papers)
         logger.info(f"    Progress: {len(all_papers):,} papers collected so far")
     
@@ -243,7 +320,7 @@ def save_papers_to_csv(papers: List[Dict], output_file: str):
     papers = deduplicate_papers(papers)
     
     # Write to CSV
-    fieldnames = ['arxiv_id', 'pdf_url', 'title', 'authors', 'num_authors', 'journal_ref', 'doi', 'comment', 'category', 'year']
+    fieldnames = ['arxiv_id', 'pdf_url', 'title', 'authors', 'num_authors', 'journal_ref', 'doi', 'comment', 'category', 'year', 'version']
     
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -335,6 +412,154 @@ def update_collection_history(history_file: str, category_short: str, year: int,
     
     logger.info(f"✓ Updated collection history: {category_short} {year} (Round {round_num})")
 
+# ============================================================================
+# Window Manifest (gap detection / repair)
+# ============================================================================
+
+def get_window_manifest_path(output_file: str) -> Path:
+    """Window manifest lives next to the CSV: cs_lg_2023.csv -> cs_lg_2023_windows.json"""
+    output_path = Path(output_file)
+    return output_path.with_name(f"{output_path.stem}_windows.json")
+
+def new_window_manifest(category: str, year: int, batch_size: int) -> Dict:
+    """Create an empty window manifest for one category/year."""
+    return {
+        'category': category,
+        'year': year,
+        'batch_size': batch_size,
+        'created': datetime.now().isoformat(),
+        'months': {}
+    }
+
+def load_window_manifest(manifest_file: Path) -> Optional[Dict]:
+    """Load a window manifest (None if missing or unreadable)."""
+    if not manifest_file.exists():
+        return None
+    
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Could not load window manifest {manifest_file}: {e}")
+        return None
+
+def save_window_manifest(manifest: Dict, manifest_file: Path):
+    """Save a window manifest (written to a temp file first so a crash never truncates it)."""
+    manifest['updated'] = datetime.now().isoformat()
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = manifest_file.with_suffix('.json.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    tmp_file.replace(manifest_file)
+
+def find_gaps(manifest: Dict) -> Tuple[List[str], List[Tuple[str, Dict]]]:
+    """
+    Find what is missing from a harvest.
+    
+    Returns:
+        (failed_months, incomplete_windows):
+            - failed_months: months whose count query failed (whole date slice must be re-queried)
+            - incomplete_windows: (month, window) pairs where received < expected
+    """
+    failed_months = []
+    incomplete_windows = []
+    for month_key, month_log in sorted(manifest.get('months', {}).items()):
+        if month_log.get('status') == 'count-error':
+            failed_months.append(month_key)
+            continue
+        for window in month_log.get('windows', []):
+            if window['received'] < window['expected']:
+                incomplete_windows.append((month_key, window))
+    return failed_months, incomplete_windows
+
+def log_gap_summary(manifest: Dict, label: str):
+    """Log how many windows/papers are missing from a harvest."""
+    failed_months, incomplete_windows = find_gaps(manifest)
+    if not failed_months and not incomplete_windows:
+        logger.info(f"✓ {label}: all windows complete")
+        return
+    
+    missing = sum(w['expected'] - w['received'] for _, w in incomplete_windows)
+    logger.warning(f"⚠️  {label}: {len(incomplete_windows)} incomplete windows (~{missing:,} papers missing), "
+                   f"{len(failed_months)} months without a count")
+    logger.warning(f"   Run: python3.9 2.1-collect_arxiv_papers.py --repair")
+
+def load_papers_csv(csv_file: str) -> List[Dict]:
+    """Load papers from an existing collection CSV."""
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+def repair_category_year(category: str, category_short: str, year: int, output_dir: str,
+                         batch_size: int = 1000, rate_limit_delay: float = 3.0,
+                         round_num: int = None, history_file: str = 'arxiv_collection_history.json') -> int:
+    """
+    Re-query only the windows (or whole months) recorded as incomplete and
+    merge the recovered papers into the existing CSV.
+    
+    Returns:
+        Number of new unique papers added
+    """
+    output_file = f"{output_dir}/{category_short}_{year}.csv"
+    manifest_file = get_window_manifest_path(output_file)
+    manifest = load_window_manifest(manifest_file)
+    
+    if manifest is None:
+        logger.warning(f"⏭️  No window manifest for {category} {year} ({manifest_file}) - nothing to repair")
+        return 0
+    
+    failed_months, incomplete_windows = find_gaps(manifest)
+    if not failed_months and not incomplete_windows:
+        logger.info(f"✓ {category} {year}: no gaps recorded")
+        return 0
+    
+    logger.info(f"\n{'='*80}")
+    logger.info(f"Repairing {category} {year}: {len(failed_months)} months, {len(incomplete_windows)} windows")
+    logger.info(f"{'='*80}")
+    
+    # Windows must be re-fetched with the batch size they were recorded with
+    window_size = manifest.get('batch_size', batch_size)
+    recovered = []
+    
+    # Months whose count query failed: re-run the whole date slice
+    for month_key in failed_months:
+        month_log = {}
+        recovered.extend(query_month_papers(category, year, int(month_key), window_size, rate_limit_delay, month_log))
+        manifest['months'][month_key] = month_log
+    
+    # Individual windows: re-query only the missing offsets
+    for month_key, window in incomplete_windows:
+        query = build_month_query(category, year, int(month_key))
+        try:
+            window_papers, received = fetch_window(query, window['start'], window_size, category, year)
+            window['received'] = max(window['received'], received)
+            window['status'] = 'ok' if window['received'] >= window['expected'] else 'short'
+            window.pop('error', None)
+            recovered.extend(window_papers)
+            logger.info(f"    Month {month_key} offset {window['start']}: {received:,}/{window['expected']:,} papers")
+        except Exception as e:
+            window['status'] = 'error'
+            window['error'] = str(e)
+            logger.error(f"    Month {month_key} offset {window['start']}: still failing ({e})")
+        window['repaired_at'] = datetime.now().isoformat()
+        time.sleep(rate_limit_delay)
+    
+    # Merge into the existing CSV (existing rows win on duplicate arxiv_id)
+    existing = load_papers_csv(output_file) if Path(output_file).exists() else []
+    existing_ids = {p['arxiv_id'] for p in existing}
+    new_papers = deduplicate_papers([p for p in recovered if p['arxiv_id'] not in existing_ids])
+    
+    if new_papers:
+        save_papers_to_csv(existing + new_papers, output_file)
+        if round_num is not None:
+            author_count = sum(int(p.get('num_authors', 0) or 0) for p in new_papers)
+            update_collection_history(history_file, category_short, year, round_num,
+                                      len(new_papers), author_count, Path(output_file).name)
+    
+    save_window_manifest(manifest, manifest_file)
+    logger.info(f"✓ Repair {category} {year}: recovered {len(new_papers):,} new papers")
+    log_gap_summary(manifest, f"{category} {year}")
+    return len(new_papers)
+
 def collect_category_year(category: str, category_short: str, year: int, output_dir: str, 
                          batch_size: int = 1000, rate_limit_delay: float = 3.0,
                          round_num: int = None, history_file: str = 'arxiv_collection_history.json'):
@@ -349,8 +574,11 @@ def collect_category_year(category: str, category_short: str, year: int, output_
     
     output_file = f"{output_dir}/{category_short}_{year}.csv"
     
-    # Query all papers month-by-month
-    papers = query_year_by_months(category, year, batch_size, rate_limit_delay)
+    # Query all papers month-by-month, recording every fetched window
+    window_manifest = new_window_manifest(category, year, batch_size)
+    papers = query_year_by_months(category, year, batch_size, rate_limit_delay, window_manifest)
+    save_window_manifest(window_manifest, get_window_manifest_path(output_file))
+    log_gap_summary(window_manifest, f"{category} {year}")
     
     # Save to CSV (with deduplication)
     if papers:
@@ -371,6 +599,392 @@ def collect_category_year(category: str, category_short: str, year: int, output_
     
     return len(papers)
 
+# ============================================================================
+# Sharded Mode (shared work manifest)
+# ============================================================================
+
+class SharedRateLimiter:
+    """
+    Rate limiter shared by every worker that opens the same manifest database.
+    
+    The next free request slot is stored in SQLite, so the arXiv politeness budget
+    (one request per rate_limit_delay seconds) holds across processes and machines.
+    Workers on different machines need reasonably synchronized clocks (NTP).
+    """
+    
+    def __init__(self, manifest: 'WorkManifest', rate_limit_delay: float, name: str = 'arxiv_api'):
+        self.manifest = manifest
+        self.rate_limit_delay = rate_limit_delay
+        self.name = name
+    
+    def wait(self):
+        """Reserve the next request slot and sleep until it arrives."""
+        with self.manifest.transaction() as conn:
+            row = conn.execute("SELECT next_slot FROM rate_limiter WHERE name = ?", (self.name,)).fetchone()
+            now = time.time()
+            slot = max(now, row[0]) if row else now
+            conn.execute("INSERT OR REPLACE INTO rate_limiter (name, next_slot) VALUES (?, ?)",
+                         (self.name, slot + self.rate_limit_delay))
+        delay = slot - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+class WorkManifest:
+    """
+    SQLite work manifest of (category, year, month) units for sharded collection.
+    
+    Any number of workers (on this or other machines sharing the filesystem) claim
+    units with time-limited leases, renewed while the unit is worked on (see
+    LeaseHeartbeat). A lease that is neither renewed nor completed before it expires
+    is considered abandoned and can be claimed by another worker; a unit abandoned
+    MAX_ATTEMPTS times is marked failed. Merging a category/year is leased the same way.
+    """
+    
+    MAX_ATTEMPTS = 3
+    
+    def __init__(self, db_file: str, lease_seconds: float = 900):
+        self.db_file = Path(db_file)
+        self.lease_seconds = lease_seconds
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+    
+    def _connect(self):
+        # isolation_level=None: transactions are managed explicitly with BEGIN IMMEDIATE
+        return sqlite3.connect(str(self.db_file), timeout=60, isolation_level=None)
+    
+    @contextmanager
+    def transaction(self):
+        """Exclusive write transaction - serializes claims across all workers."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+    
+    def _init_schema(self):
+        with self.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS work_units (
+                    category TEXT NOT NULL,
+                    category_short TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    month INTEGER NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    paper_count INTEGER,
+                    part_file TEXT,
+                    window_log TEXT,
+                    updated TEXT,
+                    PRIMARY KEY (category, year, month)
+                )""")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS targets (
+                    category TEXT NOT NULL,
+                    category_short TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    output_file TEXT NOT NULL,
+                    merged INTEGER NOT NULL DEFAULT 0,
+                    merge_lease_expires REAL,
+                    PRIMARY KEY (category, year)
+                )""")
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(targets)")]
+            if 'merge_lease_expires' not in columns:  # Manifests created before merge leases
+                conn.execute("ALTER TABLE targets ADD COLUMN merge_lease_expires REAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limiter (
+                    name TEXT PRIMARY KEY,
+                    next_slot REAL NOT NULL
+                )""")
+    
+    def add_target(self, category: str, category_short: str, year: int, output_file: str):
+        """Register a category/year and its 12 monthly units (no-op if already present)."""
+        with self.transaction() as conn:
+            conn.execute("INSERT OR IGNORE INTO targets (category, category_short, year, output_file) VALUES (?, ?, ?, ?)",
+                         (category, category_short, year, output_file))
+            conn.executemany(
+                "INSERT OR IGNORE INTO work_units (category, category_short, year, month) VALUES (?, ?, ?, ?)",
+                [(category, category_short, year, month) for month in range(1, 13)])
+    
+    def claim(self, worker_id: str) -> Optional[Dict]:
+        """Lease the next pending (or abandoned) unit, or return None if nothing is claimable."""
+        now = time.time()
+        with self.transaction() as conn:
+            failed = conn.execute("""
+                UPDATE work_units SET status = 'failed', lease_owner = NULL, lease_expires = NULL, updated = ?
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?""",
+                                  (datetime.now().isoformat(), now, self.MAX_ATTEMPTS)).rowcount
+            if failed:
+                logger.error(f"    {failed} unit(s) abandoned {self.MAX_ATTEMPTS} times - marked failed")
+            row = conn.execute("""
+                SELECT category, category_short, year, month, attempts, status FROM work_units
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY category, year, month LIMIT 1""", (now,)).fetchone()
+            if row is None:
+                return None
+            category, category_short, year, month, attempts, status = row
+            conn.execute("""
+                UPDATE work_units SET status = 'leased', lease_owner = ?, lease_expires = ?,
+                       attempts = attempts + 1, updated = ?
+                WHERE category = ? AND year = ? AND month = ?""",
+                         (worker_id, now + self.lease_seconds, datetime.now().isoformat(), category, year, month))
+        if status == 'leased':
+            logger.warning(f"    Reclaimed abandoned lease: {category} {year}-{month:02d}")
+        return {'category': category, 'category_short': category_short, 'year': year,
+                'month': month, 'attempts': attempts + 1}
+    
+    def renew(self, unit: Dict, worker_id: str) -> bool:
+        """Extend a lease this worker still holds. Returns False if it was lost to another worker."""
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE work_units SET lease_expires = ?
+                WHERE category = ? AND year = ? AND month = ? AND status = 'leased' AND lease_owner = ?""",
+                                  (time.time() + self.lease_seconds, unit['category'], unit['year'],
+                                   unit['month'], worker_id))
+            return cursor.rowcount == 1
+    
+    def complete(self, unit: Dict, worker_id: str, paper_count: int, part_file: str, month_log: Dict,
+                 staged_file: Optional[str] = None) -> bool:
+        """
+        Mark a leased unit done. Returns False if the lease was lost to another worker.
+        
+        staged_file (this worker's temporary copy of the part) is moved onto part_file
+        inside the same transaction, so only the lease holder ever writes the part.
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE work_units SET status = 'done', lease_owner = NULL, lease_expires = NULL,
+                       paper_count = ?, part_file = ?, window_log = ?, updated = ?
+                WHERE category = ? AND year = ? AND month = ? AND status = 'leased' AND lease_owner = ?""",
+                                  (paper_count, part_file, json.dumps(month_log), datetime.now().isoformat(),
+                                   unit['category'], unit['year'], unit['month'], worker_id))
+            if cursor.rowcount != 1:
+                return False
+            if staged_file:
+                os.replace(staged_file, part_file)
+            return True
+    
+    def release(self, unit: Dict, worker_id: str):
+        """Give a unit back (e.g. the count query failed) so it can be retried by any worker."""
+        with self.transaction() as conn:
+            conn.execute("""
+                UPDATE work_units SET status = 'pending', lease_owner = NULL, lease_expires = NULL, updated = ?
+                WHERE category = ? AND year = ? AND month = ? AND lease_owner = ?""",
+                         (datetime.now().isoformat(), unit['category'], unit['year'], unit['month'], worker_id))
+    
+    def claim_merge(self) -> Optional[Dict]:
+        """
+        Lease a category/year whose 12 months are all done and that has not been merged yet.
+        
+        It is only marked merged by finish_merge(); if the merging worker dies, the merge
+        lease expires and another worker merges it.
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            row = conn.execute("""
+                SELECT t.category, t.category_short, t.year, t.output_file FROM targets t
+                WHERE t.merged = 0 AND (t.merge_lease_expires IS NULL OR t.merge_lease_expires < ?)
+                AND NOT EXISTS (
+                    SELECT 1 FROM work_units u
+                    WHERE u.category = t.category AND u.year = t.year AND u.status != 'done')
+                ORDER BY t.category, t.year LIMIT 1""", (now,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE targets SET merge_lease_expires = ? WHERE category = ? AND year = ?",
+                         (now + self.lease_seconds, row[0], row[2]))
+        return {'category': row[0], 'category_short': row[1], 'year': row[2], 'output_file': row[3]}
+    
+    def finish_merge(self, target: Dict):
+        """Mark a category/year merged (after merge_sharded_target succeeded)."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE targets SET merged = 1, merge_lease_expires = NULL WHERE category = ? AND year = ?",
+                         (target['category'], target['year']))
+    
+    def open_units(self) -> int:
+        """Units still pending or leased (done and failed units are closed)."""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM work_units WHERE status IN ('pending', 'leased')").fetchone()[0]
+        finally:
+            conn.close()
+    
+    def done_units(self, category: str, year: int) -> List[Dict]:
+        """All completed units for a category/year, in month order."""
+        conn = self._connect()
+        try:
+            rows = conn.execute("""
+                SELECT month, paper_count, part_file, window_log FROM work_units
+                WHERE category = ? AND year = ? AND status = 'done' ORDER BY month""", (category, year)).fetchall()
+        finally:
+            conn.close()
+        return [{'month': r[0], 'paper_count': r[1], 'part_file': r[2],
+                 'window_log': json.loads(r[3]) if r[3] else {}} for r in rows]
+    
+    def status_counts(self) -> Dict[str, int]:
+        """Number of units per status (for progress logging)."""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, COUNT(*) FROM work_units GROUP BY status").fetchall()
+        finally:
+            conn.close()
+        return dict(rows)
+
+class LeaseHeartbeat:
+    """Renews a unit's lease every lease_seconds / 3 while the unit is being collected."""
+    
+    def __init__(self, manifest: WorkManifest, unit: Dict, worker_id: str):
+        self.manifest = manifest
+        self.unit = unit
+        self.worker_id = worker_id
+        self.lost = False
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _run(self):
+        while not self.stop.wait(self.manifest.lease_seconds / 3):
+            try:
+                if not self.manifest.renew(self.unit, self.worker_id):
+                    self.lost = True
+                    return
+            except sqlite3.Error as e:
+                logger.warning(f"    Could not renew lease: {e}")
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.stop.set()
+        self.thread.join()
+
+def merge_sharded_target(manifest: WorkManifest, target: Dict, batch_size: int,
+                         round_num: int = None, history_file: str = 'arxiv_collection_history.json') -> int:
+    """Combine the monthly part files of a finished category/year into the final CSV + window manifest."""
+    category, category_short, year = target['category'], target['category_short'], target['year']
+    output_file = target['output_file']
+    
+    window_manifest = new_window_manifest(category, year, batch_size)
+    papers = []
+    for unit in manifest.done_units(category, year):
+        window_manifest['months'][f"{unit['month']:02d}"] = unit['window_log']
+        if unit['part_file'] and Path(unit['part_file']).exists():
+            papers.extend(load_papers_csv(unit['part_file']))
+    
+    save_window_manifest(window_manifest, get_window_manifest_path(output_file))
+    log_gap_summary(window_manifest, f"{category} {year}")
+    
+    if not papers:
+        logger.warning(f"No papers collected for {category} {year}")
+        return 0
+    
+    save_papers_to_csv(papers, output_file)
+    
+    if round_num is not None:
+        author_count = sum(int(p.get('num_authors', 0) or 0) for p in papers)
+        # History is a shared JSON file - hold the manifest lock so concurrent merges don't clobber it
+        with manifest.transaction():
+            update_collection_history(history_file, category_short, year, round_num,
+                                      len(papers), author_count, Path(output_file).name)
+    return len(papers)
+
+def run_shard_worker(categories: List[Tuple[str, str, int]], output_dir: str, manifest_file: str,
+                     batch_size: int = 1000, rate_limit_delay: float = 3.0, round_num: int = None,
+                     history_file: str = 'arxiv_collection_history.json', lease_seconds: float = 900,
+                     worker_id: Optional[str] = None) -> int:
+    """
+    Run one sharded worker: claim monthly units from the shared manifest until every unit
+    is done or failed (waiting for other workers' leases, which are reclaimed if they
+    expire), then merge every category/year whose months are all done.
+    
+    Start as many workers as you like (same command, same manifest); they coordinate through SQLite.
+    
+    Returns:
+        Number of papers this worker collected
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    manifest = WorkManifest(manifest_file, lease_seconds)
+    limiter = SharedRateLimiter(manifest, rate_limit_delay)
+    parts_dir = Path(output_dir) / 'parts'
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Register work (idempotent, so every worker can do it on startup)
+    history = load_collection_history(history_file)
+    for category, category_short, year in categories:
+        if is_already_collected(history, category_short, year):
+            logger.info(f"⏭️  SKIPPING {category} {year} - already collected in previous round(s)")
+            continue
+        manifest.add_target(category, category_short, year, f"{output_dir}/{category_short}_{year}.csv")
+    
+    logger.info(f"Worker {worker_id} started (manifest: {manifest_file}, lease: {lease_seconds:.0f}s)")
+    
+    collected = 0
+    poll_seconds = min(30.0, lease_seconds / 10)
+    while True:
+        unit = manifest.claim(worker_id)
+        if unit is None:
+            if not manifest.open_units():
+                break
+            # Other workers still hold leases: wait, and take over any that expire
+            time.sleep(poll_seconds)
+            continue
+        
+        category, category_short, year, month = unit['category'], unit['category_short'], unit['year'], unit['month']
+        logger.info(f"[{worker_id}] Claimed {category} {year}-{month:02d} (attempt {unit['attempts']})")
+        
+        month_log = {}
+        with LeaseHeartbeat(manifest, unit, worker_id) as heartbeat:
+            papers = query_month_papers(category, year, month, batch_size, rate_limit_delay, month_log, limiter)
+        if heartbeat.lost:
+            logger.warning(f"[{worker_id}] Lease on {category} {year}-{month:02d} was lost - result discarded")
+            continue
+        
+        # Count query failed: hand the unit back unless it has used up its attempts
+        # (after that it is completed with the gap recorded, for --repair)
+        if month_log.get('status') == 'count-error' and unit['attempts'] < WorkManifest.MAX_ATTEMPTS:
+            manifest.release(unit, worker_id)
+            continue
+        
+        # Written under a worker-unique name; complete() moves it into place only if the lease is still ours
+        part_file = parts_dir / f"{category_short}_{year}_{month:02d}.csv"
+        staged_file = parts_dir / f"{part_file.name}.{worker_id}.tmp"
+        if papers:
+            save_papers_to_csv(papers, str(staged_file))
+        
+        if manifest.complete(unit, worker_id, len(papers), str(part_file) if papers else '', month_log,
+                             str(staged_file) if papers else None):
+            collected += len(papers)
+        else:
+            staged_file.unlink(missing_ok=True)
+            logger.warning(f"[{worker_id}] Lease on {category} {year}-{month:02d} expired before completion - result discarded")
+        logger.info(f"[{worker_id}] Units: {manifest.status_counts()}")
+    
+    # Merge any category/year that is now complete (marked merged only once the merge succeeded)
+    while True:
+        target = manifest.claim_merge()
+        if target is None:
+            break
+        try:
+            merge_sharded_target(manifest, target, batch_size, round_num, history_file)
+        except Exception as e:
+            # The merge lease expires and the next worker (or run) retries it
+            logger.error(f"[{worker_id}] Merging {target['category']} {target['year']} failed: {e}")
+            continue
+        manifest.finish_merge(target)
+    
+    failed = manifest.status_counts().get('failed', 0)
+    if failed:
+        logger.error(f"[{worker_id}] {failed} unit(s) failed after {WorkManifest.MAX_ATTEMPTS} attempts - "
+                     f"their category/year is not merged")
+    
+    logger.info(f"Worker {worker_id} finished: {collected:,} papers collected")
+    return collected
+
 def load_config(config_file: str = 'arxiv_collection_config.json'):
     """Load configuration from JSON file."""
     import json
@@ -389,6 +1003,18 @@ def load_config(config_file: str = 'arxiv_collection_config.json'):
 
 def main():
     """Main function for collection using monthly queries."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Collect arXiv papers by category/year (monthly queries).')
+    parser.add_argument('--repair', action='store_true',
+                        help='Re-query only the windows/months recorded as incomplete and merge them into existing CSVs')
+    parser.add_argument('--worker', action='store_true',
+                        help='Sharded mode: claim (category, year, month) units from the shared manifest; run any number of these')
+    parser.add_argument('--manifest', type=str, default=None,
+                        help='Shared work manifest for --worker (default: {output_dir}/harvest_manifest.sqlite)')
+    parser.add_argument('--worker-id', type=str, default=None,
+                        help='Worker name recorded on leases (default: hostname-pid)')
+    args = parser.parse_args()
     
     # Load configuration
     config = load_config()
@@ -413,13 +1039,13 @@ def main():
     else:
         # Default configuration (backward compatibility)
         logger.warning("Using default configuration (no config file found)")
-    CATEGORIES = [
-        ('cs.LG', 'cs_lg', 2024),
-        ('cs.LG', 'cs_lg', 2025),
-        ('cs.CV', 'cs_cv', 2024),
-        ('cs.CV', 'cs_cv', 2025),
-    ]
-    output_dir = 'data/arxiv/round2'
+        CATEGORIES = [
+            ('cs.LG', 'cs_lg', 2024),
+            ('cs.LG', 'cs_lg', 2025),
+            ('cs.CV', 'cs_cv', 2024),
+            ('cs.CV', 'cs_cv', 2025),
+        ]
+        output_dir = 'data/arxiv/round2'
         round_num = 2
         batch_size = 1000
     
@@ -448,6 +1074,26 @@ def main():
     
     rate_limit_delay = coll_config.get('rate_limit_delay_seconds', 3.0) if config and 'collection' in config else 3.0
     history_file = coll_config.get('history_file', 'arxiv_collection_history.json') if config and 'collection' in config else 'arxiv_collection_history.json'
+    lease_seconds = coll_config.get('lease_seconds', 900) if config and 'collection' in config else 900
+    
+    if args.worker:
+        manifest_file = args.manifest
+        if manifest_file is None and config and 'collection' in config:
+            manifest_file = coll_config.get('manifest_file')
+        manifest_file = manifest_file or f"{output_dir}/harvest_manifest.sqlite"
+        run_shard_worker(CATEGORIES, output_dir, manifest_file, batch_size, rate_limit_delay,
+                         round_num, history_file, lease_seconds, args.worker_id)
+        return
+    
+    if args.repair:
+        total_recovered = 0
+        for category, category_short, year in CATEGORIES:
+            total_recovered += repair_category_year(category, category_short, year, output_dir,
+                                                    batch_size, rate_limit_delay, round_num, history_file)
+        logger.info("\n" + "="*80)
+        logger.info(f"ROUND {round_num} REPAIR COMPLETE - {total_recovered:,} papers recovered")
+        logger.info("="*80)
+        return
     
     for category, category_short, year in CATEGORIES:
         papers_collected = collect_category_year(category, category_short, year, output_dir, 
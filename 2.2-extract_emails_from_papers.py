@@ -12,10 +12,23 @@ import fitz  # PyMuPDF
 import re
 import unicodedata
 import requests
+import os
 import time
+import threading
+import sqlite3
+import heapq
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Iterable, Iterator, Set, Union
 from http.cookiejar import MozillaCookieJar
+from requests.adapters import HTTPAdapter
+
+from email_scanner import find_emails
+from parse_supervisor import SupervisedPool, ParseTimeout, ParseMemoryExceeded
+from pdf_sources import iter_pdf_sources, arxiv_id_from_name
+from progress_events import FileProgress, get_emitter, DEFAULT_EVENTS_FILE
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -70,59 +83,34 @@ COOKIES = load_cookies()
 # ============================================================================
 
 def find_emails_in_text(text: str) -> List[str]:
-    """Find all email addresses in text using regex."""
-    emails = []
-    
-    # First, handle LaTeX multi-name format: {name1, name2}@domain.com
-    # This represents multiple emails: name1@domain.com, name2@domain.com
-    multi_name_pattern = r'\{([^}]+)\}@([A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
-    for match in re.finditer(multi_name_pattern, text):
-        names = match.group(1)  # e.g., "ashay, njk"
-        domain = match.group(2)  # e.g., "mit.edu"
-        
-        # Split by comma and create individual emails
-        for name in names.split(','):
-            name = name.strip()
-            if name:
-                emails.append(f"{name}@{domain}")
-    
-    # Now clean up LaTeX artifacts for regular email detection
-    text_cleaned = text.replace('{', ' ').replace('}', ' ').replace('\\', ' ')
-    
-    # Remove spaces around @ symbol (e.g., "name @domain.com" -> "name@domain.com")
-    text_cleaned = re.sub(r'\s+@\s*', '@', text_cleaned)
-    text_cleaned = re.sub(r'\s*@\s+', '@', text_cleaned)
-    
-    # Standard email pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails.extend(re.findall(email_pattern, text_cleaned))
-    
-    return list(set(emails))  # Remove duplicates
+    """Find all email addresses in text (shared single-pass scanner, see email_scanner.py)."""
+    return find_emails(text)
 
-def extract_emails_from_pdf(pdf_path: str) -> List[str]:
-    """Extract all emails from the first page of a PDF."""
+def first_page_text(pdf: Union[bytes, str, Path]) -> Optional[str]:
+    """Text of the first page of a PDF (raw bytes or a file path); None if it cannot be parsed."""
     try:
-        doc = fitz.open(pdf_path)
-        if len(doc) == 0:
-            return []
-        
-        # Get text from first page
-        first_page = doc[0]
-        text = first_page.get_text("text")
-        
-        # Find all emails
-        emails = find_emails_in_text(text)
-        
-        doc.close()
-        return emails
+        if isinstance(pdf, (bytes, bytearray, memoryview)):
+            doc = fitz.open(stream=pdf, filetype="pdf")
+        else:
+            doc = fitz.open(pdf)
+        try:
+            if len(doc) == 0:
+                return ""
+            return doc[0].get_text("text")
+        finally:
+            doc.close()
     except Exception as e:
         logger.error(f"Error extracting emails from PDF: {e}")
-        return []
+        return None
 
 # ============================================================================
 # Email-Author Matching (Copied from ACL logic)
 # ============================================================================
 
+# Bump whenever match_score / match_emails_to_authors change: cached matches stamped with
+# an older version are re-matched from their cached email lists (no re-download)
+MATCHER_VERSION = 1
+
 def normalize_text(text: str) -> str:
     """Normalize text by removing accents and converting to lowercase."""
     # Normalize unicode characters (e.g., é -> e)
@@ -401,141 +389,542 @@ def match_emails_to_authors(authors: List[str], emails: List[str]) -> List[Tuple
 # Paper Processing
 # ============================================================================
 
-def download_pdf(url: str, output_path: str, max_retries: int = None, rate_limit_delay: float = None) -> Tuple[bool, bool]:
+class TokenBucket:
     """
-    Download PDF from URL with rate limiting, cookies, and retries.
+    Thread-safe token bucket limiting request *starts* to `rate` per second.
     
-    Returns:
-        (success, is_captcha): 
-            - success: True if PDF downloaded successfully
-            - is_captcha: True if CAPTCHA was detected (should stop immediately)
+    Each acquire() reserves the next start slot, so a download that already took
+    longer than the interval does not add a fixed sleep on top of it.
     """
-    import time
     
-    # Load config for defaults if not provided
-    if max_retries is None or rate_limit_delay is None:
-        config = load_config()
-        if config and 'email_extraction' in config:
-            ext_config = config['email_extraction']
-            if max_retries is None:
-                max_retries = ext_config.get('max_retries', 3)
-            if rate_limit_delay is None:
-                rate_limit_delay = ext_config.get('rate_limit_delay_seconds', 3.0)
-        else:
-            if max_retries is None:
-                max_retries = 3
-            if rate_limit_delay is None:
-                rate_limit_delay = 3.0
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may start."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1  # Reserve a slot (may go negative = queued behind other threads)
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+    
+    def set_rate(self, rate: float):
+        """Change the refill rate; slots already reserved keep their start times."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.rate = rate
+
+class AdaptivePacer:
+    """
+    AIMD pacing for PDF downloads on top of a TokenBucket.
+    
+    Every clean download adds INCREASE_PER_SUCCESS requests/s to the rate; a 429/503, an HTML
+    reply, a connection error or a slow response multiplies it by DECREASE_FACTOR (at most once
+    per request interval, so several in-flight failures count once). COOLDOWN_AFTER_FAILURES
+    failed requests in a row (or a Retry-After header) pause all downloads for cooldown_seconds,
+    doubling up to max_cooldown_seconds, after which downloads resume at the reduced rate.
+    
+    The rate is saved to state_file, so the next run starts at the last sustainable rate.
+    """
     
-    for attempt in range(max_retries):
+    INCREASE_PER_SUCCESS = 0.01  # requests/s added per clean download
+    DECREASE_FACTOR = 0.5
+    COOLDOWN_AFTER_FAILURES = 5
+    SAVE_EVERY = 25  # successes between state saves
+    
+    def __init__(self, rate_limit_delay: float, burst: float = 1.0, min_delay: float = None,
+                 max_delay: float = None, slow_response_seconds: float = 20.0,
+                 cooldown_seconds: float = 60.0, max_cooldown_seconds: float = 900.0,
+                 state_file: Optional[str] = None):
+        self.max_rate = 1.0 / (min_delay if min_delay else rate_limit_delay)
+        self.min_rate = 1.0 / (max_delay if max_delay else rate_limit_delay)
+        self.slow_response_seconds = slow_response_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.state_file = Path(state_file) if state_file else None
+        
+        rate = self._load_rate() or 1.0 / rate_limit_delay
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+        self.bucket = TokenBucket(self.rate, burst)
+        self.lock = threading.Lock()
+        self.failure_streak = 0
+        self.cooldowns_in_row = 0
+        self.cooldown_until = 0.0
+        self.last_decrease = 0.0
+        self.unsaved_successes = 0
+        self.stats = Counter()
+    
+    @property
+    def delay(self) -> float:
+        """Current interval between request starts, in seconds."""
+        return 1.0 / self.rate
+    
+    def acquire(self):
+        """Block until a request may start (waits out any cooldown, then takes a bucket slot)."""
+        self._wait_cooldown()
+        self.bucket.acquire()
+        self._wait_cooldown()  # A cooldown may have started while queued in the bucket
+    
+    def _wait_cooldown(self):
+        while True:
+            with self.lock:
+                wait = self.cooldown_until - time.monotonic()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+    
+    def on_success(self, response_seconds: float):
+        """A PDF arrived; response_seconds is the time until the server answered."""
+        if response_seconds > self.slow_response_seconds:
+            with self.lock:
+                self.stats['slow'] += 1
+                self.failure_streak = 0
+                self.cooldowns_in_row = 0
+                changed = self._decrease(f"slow response ({response_seconds:.0f}s)")
+            if changed:
+                self.save()
+            return
+        
+        with self.lock:
+            self.stats['ok'] += 1
+            self.failure_streak = 0
+            self.cooldowns_in_row = 0
+            self.rate = min(self.max_rate, self.rate + self.INCREASE_PER_SUCCESS)
+            self.bucket.set_rate(self.rate)
+            self.unsaved_successes += 1
+            save = self.unsaved_successes >= self.SAVE_EVERY
+        if save:
+            self.save()
+    
+    def on_trouble(self, reason: str, retry_after: Optional[float] = None):
+        """A request was throttled or failed in a way that suggests we are going too fast."""
+        with self.lock:
+            self.stats['trouble'] += 1
+            self.failure_streak += 1
+            self._decrease(reason)
+            duration = 0.0
+            if self.failure_streak >= self.COOLDOWN_AFTER_FAILURES:
+                duration = min(self.max_cooldown_seconds, self.cooldown_seconds * 2 ** self.cooldowns_in_row)
+                self.cooldowns_in_row += 1
+                self.failure_streak = 0
+            if retry_after:
+                duration = max(duration, min(retry_after, self.max_cooldown_seconds))
+            if duration > 0:
+                self._start_cooldown(reason, duration)
+        self.save()
+    
+    def _decrease(self, reason: str) -> bool:
+        """Multiplicative decrease, at most once per current request interval (lock held)."""
+        now = time.monotonic()
+        if now - self.last_decrease < 1.0 / self.rate:
+            return False
+        self.last_decrease = now
+        new_rate = max(self.min_rate, self.rate * self.DECREASE_FACTOR)
+        if new_rate < self.rate:
+            logger.warning(f"Slowing down after {reason}: {1.0 / self.rate:.1f}s -> {1.0 / new_rate:.1f}s per download")
+        self.rate = new_rate
+        self.bucket.set_rate(self.rate)
+        return True
+    
+    def _start_cooldown(self, reason: str, duration: float):
+        """Pause all downloads for duration seconds (lock held)."""
+        self.cooldown_until = max(self.cooldown_until, time.monotonic() + duration)
+        self.stats['cooldowns'] += 1
+        logger.warning(f"⏸  Cooling down for {duration:.0f}s ({reason}); "
+                       f"resuming at {1.0 / self.rate:.1f}s per download")
+    
+    def _load_rate(self) -> Optional[float]:
+        if self.state_file is None or not self.state_file.exists():
+            return None
         try:
-            # Add delay to respect arXiv rate limits (configurable)
-            time.sleep(rate_limit_delay)
-            
-            # Create session and use cookies if available
-            session = requests.Session()
-            if COOKIES:
-                session.cookies = COOKIES
-            
-            response = session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Check if we got a CAPTCHA page instead of a PDF
-            content_type = response.headers.get('Content-Type', '')
-            if 'text/html' in content_type or b'<!DOCTYPE html>' in response.content[:200]:
-                # Check for CAPTCHA indicators
-                content_preview = response.content[:1000].decode('utf-8', errors='ignore')
-                if 'reCAPTCHA' in content_preview or 'captcha' in content_preview.lower():
-                    logger.error("❌ CAPTCHA DETECTED - arXiv is blocking automated requests!")
-                    logger.error("   Cookies may have expired. Please refresh cookies.")
-                    logger.error("   ⛔ STOPPING ALL PROCESSING IMMEDIATELY")
-                    # Return (False, True) = failed + CAPTCHA detected
-                    return (False, True)
-                else:
-                    logger.error(f"Received HTML instead of PDF from {url}")
-                    return (False, False)
-            
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-            
-            return (True, False)  # Success, no CAPTCHA
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:  # Too Many Requests
-                wait_time = (attempt + 1) * 5  # Exponential backoff: 5s, 10s, 15s
-                logger.warning(f"Rate limited, waiting {wait_time}s before retry {attempt+1}/{max_retries}")
-                time.sleep(wait_time)
-            else:
-                logger.error(f"HTTP error downloading PDF: {e}")
-                return (False, False)
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            logger.info(f"Starting at learned pace of {state['delay_seconds']:.2f}s per download "
+                        f"(from {self.state_file})")
+            return 1.0 / state['delay_seconds']
         except Exception as e:
-            # For other exceptions, only retry if not the last attempt
-            if attempt < max_retries - 1:
-                logger.warning(f"Error downloading, retrying ({attempt+1}/{max_retries}): {e}")
-                time.sleep(2)
-            else:
-                logger.error(f"Error downloading PDF from {url}: {e}")
-                return (False, False)
-    
-    return (False, False)  # Failed after all retries, not CAPTCHA
+            logger.warning(f"Could not read pacing state {self.state_file}: {e}")
+            return None
+    
+    def save(self):
+        """Persist the current rate (written atomically)."""
+        if self.state_file is None:
+            return
+        with self.lock:
+            self.unsaved_successes = 0
+            state = {'delay_seconds': round(1.0 / self.rate, 3),
+                     'updated': time.strftime('%Y-%m-%dT%H:%M:%S')}
+            try:
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.state_file.with_suffix(self.state_file.suffix + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                tmp_path.replace(self.state_file)
+            except OSError as e:
+                logger.warning(f"Could not save pacing state {self.state_file}: {e}")
 
-def clean_author_name(name: str) -> str:
-    """Clean author name to Title Case."""
-    # Split by spaces
-    parts = name.split()
-    # Capitalize first letter of each part, keep rest lowercase
-    cleaned_parts = [p.capitalize() for p in parts]
-    return ' '.join(cleaned_parts)
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header in seconds (only the delta-seconds form is used)."""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
 
-def process_paper(paper_data: dict, temp_dir: Path, max_retries: int = None, rate_limit_delay: float = None) -> Tuple[List[Dict], bool, bool]:
+class PDFFetcher:
     """
-    Process a single paper: download PDF, extract emails, match to authors.
+    Downloads arXiv PDFs over one persistent, pooled session.
     
-    Returns:
-        (results, pdf_success, is_captcha):
-            - results: List of result dictionaries
-            - pdf_success: True if PDF downloaded successfully
-            - is_captcha: True if CAPTCHA detected (should stop immediately)
+    Request starts are paced by an AdaptivePacer (rate_limit_delay seconds apart to begin
+    with), and up to max_in_flight downloads may run concurrently from worker threads -
+    across every caller sharing the fetcher (e.g. several CSVs processed by 2.3 at once).
     """
-    arxiv_id = paper_data['arxiv_id']
-    pdf_url = paper_data['pdf_url']
-    title = paper_data['title']
-    authors_str = paper_data['authors']
     
-    # Parse authors (semicolon-separated)
-    authors = [a.strip() for a in authors_str.split(';') if a.strip()]
+    # Status codes that mean "slow down" rather than "this paper is broken"
+    THROTTLE_STATUSES = (429, 503)
+    
+    # First-page mode is abandoned if fewer than 25% of the first 20 PDFs are linearized
+    RANGE_PROBE_PAPERS = 20
+    RANGE_MIN_LINEARIZED = 0.25
+    
+    def __init__(self, rate_limit_delay: float = 3.0, max_retries: int = 3, max_in_flight: int = 3,
+                 burst: float = 1.0, cookies: Optional[MozillaCookieJar] = None,
+                 pacer: Optional[AdaptivePacer] = None):
+        self.max_retries = max_retries
+        self.range_enabled = True
+        self.range_tried = 0
+        self.range_linearized = 0
+        self.range_lock = threading.Lock()
+        self.max_in_flight = max(1, max_in_flight)
+        self.slots = threading.BoundedSemaphore(self.max_in_flight)
+        if pacer is None and rate_limit_delay > 0:
+            pacer = AdaptivePacer(rate_limit_delay, burst)  # Fixed rate: no AIMD bounds, no state file
+        self.pacer = pacer
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_in_flight)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if cookies:
+            self.session.cookies = cookies
+    
+    def fetch(self, url: str) -> Tuple[Optional[bytes], bool]:
+        """
+        Download a PDF with rate limiting and retries.
+        
+        Returns:
+            (content, is_captcha):
+                - content: PDF bytes, or None if the download failed
+                - is_captcha: True if CAPTCHA was detected (should stop immediately)
+        """
+        response, is_captcha = self._get(url)
+        return (response.content if response is not None else None, is_captcha)
+    
+    def _get(self, url: str, headers: Optional[Dict] = None) -> Tuple[Optional['requests.Response'], bool]:
+        """GET with adaptive pacing, retries and CAPTCHA detection. Returns (response or None, is_captcha)."""
+        for attempt in range(self.max_retries):
+            try:
+                # Respect arXiv rate limits (paced on request start times)
+                if self.pacer is not None:
+                    self.pacer.acquire()
+                
+                with self.slots:
+                    response = self.session.get(url, headers=headers, timeout=30)
+                if response.status_code in self.THROTTLE_STATUSES:
+                    logger.warning(f"Rate limited (HTTP {response.status_code}), retry {attempt+1}/{self.max_retries}")
+                    if self.pacer is not None:
+                        self.pacer.on_trouble(f"HTTP {response.status_code}",
+                                              parse_retry_after(response.headers.get('Retry-After')))
+                    else:
+                        time.sleep((attempt + 1) * 5)  # Unpaced fetcher: linear backoff
+                    continue
+                response.raise_for_status()
+                
+                # Check if we got a CAPTCHA page instead of a PDF
+                content_type = response.headers.get('Content-Type', '')
+                if 'text/html' in content_type or b'<!DOCTYPE html>' in response.content[:200]:
+                    # Check for CAPTCHA indicators
+                    content_preview = response.content[:1000].decode('utf-8', errors='ignore')
+                    if 'reCAPTCHA' in content_preview or 'captcha' in content_preview.lower():
+                        logger.error("❌ CAPTCHA DETECTED - arXiv is blocking automated requests!")
+                        logger.error("   Cookies may have expired. Please refresh cookies.")
+                        logger.error("   ⛔ STOPPING ALL PROCESSING IMMEDIATELY")
+                        return (None, True)
+                    else:
+                        logger.error(f"Received HTML instead of PDF from {url}")
+                        if self.pacer is not None:
+                            self.pacer.on_trouble("HTML reply")
+                        return (None, False)
+                
+                if self.pacer is not None:
+                    self.pacer.on_success(response.elapsed.total_seconds())
+                return (response, False)  # Success, no CAPTCHA
+            except requests.exceptions.HTTPError as e:
+                logger.error(f"HTTP error downloading PDF: {e}")
+                return (None, False)
+            except Exception as e:
+                if self.pacer is not None:
+                    self.pacer.on_trouble(type(e).__name__)
+                # For other exceptions, only retry if not the last attempt
+                if attempt < self.max_retries - 1:
+                    logger.warning(f"Error downloading, retrying ({attempt+1}/{self.max_retries}): {e}")
+                    if self.pacer is None:
+                        time.sleep(2)
+                else:
+                    logger.error(f"Error downloading PDF from {url}: {e}")
+                    return (None, False)
+        
+        return (None, False)  # Failed after all retries, not CAPTCHA
+    
+    def fetch_first_page(self, url: str, range_bytes: int = 131072) -> Tuple[Optional[bytes], bool, bool]:
+        """
+        Fetch only what is needed for page 0, using HTTP Range requests.
+        
+        Requests the leading range_bytes first. If the PDF is linearized, the first-page
+        section (up to /E) is turned into a standalone one-page PDF; otherwise the rest of
+        the file is fetched and appended. Servers that ignore Range just return the full file.
+        
+        Returns:
+            (content, is_captcha, partial) - partial=True if content is a first-page-only buffer
+        """
+        if not self.range_enabled:
+            content, is_captcha = self.fetch(url)
+            return (content, is_captcha, False)
+        
+        response, is_captcha = self._get(url, {'Range': f'bytes=0-{range_bytes - 1}'})
+        if response is None:
+            return (None, is_captcha, False)
+        if response.status_code != 206:
+            return (response.content, False, False)  # Range not supported - already have everything
+        
+        head = response.content
+        total = parse_content_range_total(response.headers.get('Content-Range', ''))
+        if total is not None and len(head) >= total:
+            return (head, False, False)  # Whole file fit in the first range
+        
+        lin = parse_linearization(head)
+        self._record_range_result(lin is not None and (total is None or lin['L'] == total))
+        
+        if lin is not None and (total is None or lin['L'] == total):
+            if lin['E'] > len(head):
+                more, is_captcha = self._get(url, {'Range': f'bytes={len(head)}-{lin["E"] - 1}'})
+                if more is None:
+                    return (None, is_captcha, False)
+                if more.status_code != 206:
+                    return (more.content, False, False)
+                head += more.content
+            first_page = make_first_page_pdf(head[:lin['E']], lin['O'])
+            if first_page is not None:
+                return (first_page, False, True)
+        
+        # Not linearized (or unusable): fetch the remainder and append it
+        rest, is_captcha = self._get(url, {'Range': f'bytes={len(head)}-'})
+        if rest is None:
+            return (None, is_captcha, False)
+        if rest.status_code != 206:
+            return (rest.content, False, False)
+        return (head + rest.content, False, False)
+    
+    def _record_range_result(self, linearized: bool):
+        """Turn Range mode off for this run if few PDFs are linearized (each miss costs an extra request)."""
+        with self.range_lock:
+            self.range_tried += 1
+            self.range_linearized += int(linearized)
+            if (self.range_enabled and self.range_tried >= self.RANGE_PROBE_PAPERS
+                    and self.range_linearized < self.range_tried * self.RANGE_MIN_LINEARIZED):
+                self.range_enabled = False
+                logger.warning(f"Only {self.range_linearized}/{self.range_tried} PDFs are linearized - "
+                               f"switching to full downloads for the rest of this run")
+
+def parse_content_range_total(content_range: str) -> Optional[int]:
+    """'bytes 0-131071/2345678' -> 2345678 (None if unknown)."""
+    match = re.search(r'/(\d+)\s*$', content_range)
+    return int(match.group(1)) if match else None
+
+def parse_linearization(head: bytes) -> Optional[Dict[str, int]]:
+    """Read the linearization dictionary (file length /L, first-page end /E, page object /O) if present."""
+    match = re.search(rb'<<[^>]*/Linearized\s+[\d.]+[^>]*>>', head[:1024])
+    if not match:
+        return None
+    params = {}
+    for key in ('L', 'E', 'O'):
+        value = re.search(rb'/' + key.encode() + rb'\s+(\d+)', match.group(0))
+        if not value:
+            return None
+        params[key] = int(value.group(1))
+    return params
+
+def make_first_page_pdf(prefix: bytes, first_page_obj: int) -> Optional[bytes]:
+    """
+    Make the first-page section of a linearized PDF openable on its own.
     
-    if not authors:
-        logger.warning(f"No authors found for {arxiv_id}")
-        return ([], True, False)  # No authors, but not a download failure
+    The page tree lives at the end of a linearized file, so a stub Pages node holding
+    only the first page is appended; MuPDF rebuilds the xref when it opens the buffer.
+    Returns None if the page object is not directly in the prefix (e.g. in an object stream).
+    """
+    page = re.search(rb'(?<![0-9])%d\s+0\s+obj' % first_page_obj, prefix)
+    if not page:
+        return None
+    parent = re.search(rb'/Parent\s+(\d+)\s+0\s+R', prefix[page.end():page.end() + 4096])
+    root = re.search(rb'/Root\s+(\d+)\s+0\s+R', prefix)
+    if not parent or not root:
+        return None
+    parent_obj, root_obj = int(parent.group(1)), int(root.group(1))
     
-    # Download PDF
-    pdf_path = temp_dir / f"{arxiv_id}.pdf"
-    pdf_downloaded, is_captcha = download_pdf(pdf_url, pdf_path, max_retries, rate_limit_delay)
-    if not pdf_downloaded:
-        return ([], False, is_captcha)  # PDF download FAILED, return CAPTCHA flag
+    catalog = re.search(rb'(?<![0-9])%d\s+0\s+obj' % root_obj, prefix)
+    pages = re.search(rb'/Pages\s+(\d+)\s+0\s+R', prefix[catalog.end():catalog.end() + 4096]) if catalog else None
+    if not pages:
+        return None
+    pages_obj = int(pages.group(1))
+    
+    stub = b'\n%d 0 obj\n<< /Type /Pages /Kids [ %d 0 R ] /Count 1 >>\nendobj\n' % (parent_obj, first_page_obj)
+    if pages_obj != parent_obj:
+        # Deeper page tree: hang the page's parent off a one-node root
+        stub = (b'\n%d 0 obj\n<< /Type /Pages /Kids [ %d 0 R ] /Count 1 >>\nendobj\n' % (pages_obj, parent_obj)
+                + b'\n%d 0 obj\n<< /Type /Pages /Parent %d 0 R /Kids [ %d 0 R ] /Count 1 >>\nendobj\n'
+                % (parent_obj, pages_obj, first_page_obj))
+    return prefix + stub + b'trailer\n<< /Root %d 0 R >>\n%%%%EOF\n' % root_obj
+
+# Earlier outputs the author index is built from (glob patterns, relative to the repo root)
+DEFAULT_AUTHOR_INDEX_SOURCES = [
+    'data/acl/acl_high_confidence.csv',
+    'data/arxiv/round*/arxiv_high_confidence*.csv',
+    'data/arxiv/round*/*_email.csv',
+]
+
+def load_extraction_settings() -> Dict:
+    """Read the email_extraction section of the config, filling in defaults."""
+    config = load_config()
+    ext_config = config.get('email_extraction', {}) if config else {}
+    return {
+        'pdf_cache_dir': ext_config.get('pdf_cache_dir'),
+        'max_retries': ext_config.get('max_retries', 3),
+        'rate_limit_delay': ext_config.get('rate_limit_delay_seconds', 3.0),
+        'max_concurrent_downloads': ext_config.get('max_concurrent_downloads', 3),
+        'burst': ext_config.get('burst', 1),
+        'first_page_only': ext_config.get('first_page_only', False),
+        'first_page_range_bytes': ext_config.get('first_page_range_bytes', 131072),
+        'parse_workers': ext_config.get('parse_workers'),
+        'parse_timeout_seconds': ext_config.get('parse_timeout_seconds', 60.0),
+        'parse_max_rss_mb': ext_config.get('parse_max_rss_mb', 1024),
+        'adaptive_pacing': ext_config.get('adaptive_pacing', True),
+        'min_delay_seconds': ext_config.get('min_delay_seconds', 1.0),
+        'max_delay_seconds': ext_config.get('max_delay_seconds', 30.0),
+        'slow_response_seconds': ext_config.get('slow_response_seconds', 20.0),
+        'cooldown_seconds': ext_config.get('cooldown_seconds', 60.0),
+        'max_cooldown_seconds': ext_config.get('max_cooldown_seconds', 900.0),
+        'pacing_state_file': ext_config.get('pacing_state_file', 'data/arxiv/pacing_state.json'),
+        'result_cache_file': ext_config.get('result_cache_file', 'data/arxiv/extraction_cache.sqlite'),
+        'skip_resolved_authors': ext_config.get('skip_resolved_authors', True),
+        'author_index_sources': ext_config.get('author_index_sources', DEFAULT_AUTHOR_INDEX_SOURCES),
+        'author_index_min_confidence': ext_config.get('author_index_min_confidence', 0.75),
+        'plan_downloads': ext_config.get('plan_downloads', False),
+        'plan_coverage_target': ext_config.get('plan_coverage_target', 1.0),
+        'progress_events_file': ext_config.get('progress_events_file', DEFAULT_EVENTS_FILE),
+    }
+
+_fetchers: Dict[Tuple[int, float], PDFFetcher] = {}
+_fetchers_lock = threading.Lock()
+
+def get_fetcher(max_retries: int = None, rate_limit_delay: float = None) -> PDFFetcher:
+    """Shared fetcher (one session + one rate limiter) per (max_retries, rate_limit_delay)."""
+    settings = load_extraction_settings()
+    if max_retries is None:
+        max_retries = settings['max_retries']
+    if rate_limit_delay is None:
+        rate_limit_delay = settings['rate_limit_delay']
+    
+    key = (max_retries, rate_limit_delay)
+    with _fetchers_lock:  # Files processed concurrently (2.3) must end up with the same fetcher
+        if key not in _fetchers:
+            _fetchers[key] = PDFFetcher(rate_limit_delay, max_retries, settings['max_concurrent_downloads'],
+                                        settings['burst'], COOKIES, make_pacer(settings, rate_limit_delay))
+        return _fetchers[key]
+
+def make_pacer(settings: Dict, rate_limit_delay: float) -> Optional[AdaptivePacer]:
+    """Pacer for a fetcher: adaptive (AIMD, persisted) unless adaptive_pacing is off."""
+    if rate_limit_delay <= 0:
+        return None
+    if not settings['adaptive_pacing']:
+        return AdaptivePacer(rate_limit_delay, settings['burst'],
+                             cooldown_seconds=settings['cooldown_seconds'],
+                             max_cooldown_seconds=settings['max_cooldown_seconds'])
+    return AdaptivePacer(rate_limit_delay, settings['burst'],
+                         min_delay=settings['min_delay_seconds'],
+                         max_delay=max(settings['max_delay_seconds'], rate_limit_delay),
+                         slow_response_seconds=settings['slow_response_seconds'],
+                         cooldown_seconds=settings['cooldown_seconds'],
+                         max_cooldown_seconds=settings['max_cooldown_seconds'],
+                         state_file=settings['pacing_state_file'])
+
+def load_pdf(paper_data: dict, fetcher: PDFFetcher, cache_dir: Optional[Path] = None,
+             first_page_only: bool = False, range_bytes: int = 131072) -> Tuple[Optional[Union[bytes, Path]], bool, bool]:
+    """
+    Get a paper's PDF, from the PDF cache when enabled, otherwise over HTTP.
     
-    # Extract emails
-    emails = extract_emails_from_pdf(pdf_path)
+    Nothing touches disk unless cache_dir is set; downloaded PDFs are then spilled to it for reruns
+    (first-page-only buffers are cached as {arxiv_id}.page0.pdf). Cache hits are returned as the
+    file Path so parse workers can open the file themselves.
     
-    # Clean up PDF
-    pdf_path.unlink(missing_ok=True)
+    Returns:
+        (content, is_captcha, partial) - content is PDF bytes or a cached file Path;
+        partial=True if content holds only the first page
+    """
+    arxiv_id = paper_data['arxiv_id']
+    if cache_dir is not None:
+        for cached, partial in ((cache_dir / f"{arxiv_id}.pdf", False), (cache_dir / f"{arxiv_id}.page0.pdf", True)):
+            if cached.exists():
+                return (cached, False, partial)
     
-    if not emails:
-        logger.warning(f"No emails found in {arxiv_id}")
-        # Return authors without emails
-        results = []
-        for author in authors:
-            results.append({
-                'Paper URL': pdf_url,
-                'Title': title,
-                'Author': clean_author_name(author),
-                'Email': '',
-                'Confidence': '0%'
-            })
-        return (results, True, False)  # No emails, but PDF was downloaded successfully
+    if first_page_only:
+        content, is_captcha, partial = fetcher.fetch_first_page(paper_data['pdf_url'], range_bytes)
+    else:
+        (content, is_captcha), partial = fetcher.fetch(paper_data['pdf_url']), False
     
-    # Match emails to authors
-    matches = match_emails_to_authors(authors, emails)
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = cache_dir / (f"{arxiv_id}.page0.pdf" if partial else f"{arxiv_id}.pdf")
+    if content is not None and cache_path is not None:
+        try:
+            tmp_path = cache_path.with_suffix('.pdf.part')
+            tmp_path.write_bytes(content)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache PDF for {paper_data['arxiv_id']}: {e}")
+    return (content, is_captcha, partial)
+
+def clean_author_name(name: str) -> str:
+    """Clean author name to Title Case."""
+    # Split by spaces
+    parts = name.split()
+    # Capitalize first letter of each part, keep rest lowercase
+    cleaned_parts = [p.capitalize() for p in parts]
+    return ' '.join(cleaned_parts)
+
+def parse_authors(paper_data: dict) -> List[str]:
+    """Parse the semicolon-separated author list of a paper."""
+    authors_str = paper_data['authors']
+    return [a.strip() for a in authors_str.split(';') if a.strip()]
+
+def build_results(paper_data: dict, authors: List[str], emails: List[str]) -> List[Dict]:
+    """Match emails to authors and build the output rows for one paper."""
+    if not emails:
+        logger.warning(f"No emails found in {paper_data['arxiv_id']}")
+        return rows_from_matches(paper_data, authors, [])
+    return rows_from_matches(paper_data, authors, match_emails_to_authors(authors, emails))
+
+def rows_from_matches(paper_data: dict, authors: List[str], matches: List[Tuple[str, str, float]]) -> List[Dict]:
+    """Output rows for one paper: matched authors first, then the unmatched ones with an empty email."""
+    pdf_url = paper_data['pdf_url']
+    title = paper_data['title']
     
     # Create results
     results = []
@@ -563,31 +952,657 @@ def process_paper(paper_data: dict, temp_dir: Path, max_retries: int = None, rat
                 'Confidence': '0%'
             })
     
-    return (results, True, False)  # Successfully processed, no CAPTCHA
+    return results
+
+def known_outcome(paper: Dict, result_cache: Optional['ResultCache'],
+                  author_index: Optional['AuthorIndex']) -> Optional[Tuple[List[Dict], str]]:
+    """(results, status) for a paper that needs no PDF - a result cache hit or all authors known."""
+    cached = result_cache.lookup(paper) if result_cache is not None else None
+    if cached is not None:
+        return cached
+    if author_index is not None and author_index.should_skip(paper):
+        return ([], STATUS_KNOWN_AUTHORS)
+    return None
+
+def pdf_size(content: Optional[Union[bytes, Path]]) -> int:
+    """Size in bytes of downloaded PDF content or a cached/local PDF file."""
+    if isinstance(content, Path):
+        return content.stat().st_size
+    return len(content) if content else 0
+
+def timed_load_pdf(*args) -> Tuple[Optional[Union[bytes, Path]], bool, bool, float]:
+    """load_pdf plus the wall time it took (for the progress journal)."""
+    start = time.time()
+    return load_pdf(*args) + (time.time() - start,)
+
+def prefetch_papers(papers: List[Dict], processed_urls: set, fetcher: PDFFetcher, cache_dir: Optional[Path],
+                    executor: ThreadPoolExecutor, first_page_only: bool = False, range_bytes: int = 131072,
+                    result_cache: Optional['ResultCache'] = None, author_index: Optional['AuthorIndex'] = None,
+                    progress: Optional[FileProgress] = None) -> Iterator[Tuple[int, Dict, Union[Future, Tuple, None]]]:
+    """
+    Yield (index, paper, download) in input order while keeping up to
+    2 * max_in_flight downloads queued ahead of the consumer.
+    
+    download is a Future for papers being fetched, a (results, status) tuple for
+    result cache hits and papers whose authors are all in author_index (nothing is
+    downloaded), and None for already-processed papers and papers without authors.
+    """
+    window = deque()
+    
+    def submit(index, paper):
+        if paper.get('pdf_url', '') in processed_urls or not parse_authors(paper):
+            return (index, paper, None)
+        known = known_outcome(paper, result_cache, author_index)
+        if known is not None:
+            return (index, paper, known)
+        download = executor.submit(timed_load_pdf, paper, fetcher, cache_dir, first_page_only, range_bytes)
+        if progress is not None:
+            progress.download_started()
+            # A failed download still has to leave in_flight (result() would raise in the callback)
+            download.add_done_callback(
+                lambda future: progress.download_finished(
+                    0 if future.cancelled() or future.exception() is not None else pdf_size(future.result()[0])))
+        return (index, paper, download)
+    
+    for i, paper in enumerate(papers, 1):
+        window.append(submit(i, paper))
+        if sum(1 for _, _, fut in window if isinstance(fut, Future)) >= 2 * fetcher.max_in_flight:
+            yield window.popleft()
+    while window:
+        yield window.popleft()
+
+def local_papers(papers: List[Dict], pdf_sources: List[str], processed_urls: set,
+                 result_cache: Optional['ResultCache'] = None, author_index: Optional['AuthorIndex'] = None,
+                 progress: Optional[FileProgress] = None) -> Iterator[Tuple[int, Dict, Union[Future, Tuple]]]:
+    """
+    Offline counterpart of prefetch_papers: PDFs come from local directories or tar/zip
+    archives (e.g. arXiv bulk tarballs) instead of HTTP, matched to papers by filename.
+    
+    Yields (index, paper, download) in source order, with the same download values as
+    prefetch_papers (a completed Future for PDFs read from the source). Papers with no PDF
+    in the sources are left unattempted, so a later online run still picks them up.
+    """
+    by_id = {p['arxiv_id']: p for p in papers
+             if p.get('pdf_url', '') not in processed_urls and parse_authors(p)}
+    wanted = len(by_id)
+    unmatched = 0
+    index = 0
+    read_start = time.time()
+    for filename, pdf in iter_pdf_sources(pdf_sources):
+        read_seconds = time.time() - read_start
+        arxiv_id = arxiv_id_from_name(filename) or ''
+        # Old-style IDs are stored without their archive prefix by 2.1 (hep-th/9901001 -> 9901001)
+        paper = by_id.pop(arxiv_id, None) or by_id.pop(arxiv_id.split('/')[-1], None)
+        if paper is None:
+            unmatched += 1
+        else:
+            index += 1
+            known = known_outcome(paper, result_cache, author_index)
+            if known is not None:
+                yield (index, paper, known)
+            else:
+                download = Future()
+                download.set_result((pdf, False, False, read_seconds))
+                if progress is not None:
+                    progress.download_started()
+                    progress.download_finished(pdf_size(pdf))
+                yield (index, paper, download)
+        read_start = time.time()
+    logger.info(f"📦 Local PDFs: {wanted - len(by_id):,}/{wanted:,} papers found | "
+                f"{unmatched:,} other PDFs skipped (not in the input or already done)")
+
+# ============================================================================
+# Parse Stage (supervised process pool)
+# ============================================================================
+
+# Internal status: a first-page-only buffer MuPDF could not read (needs a full download)
+STATUS_PARTIAL_UNUSABLE = 'partial-unusable'
+
+def share_pdf(content: Union[bytes, Path]) -> Tuple[Union[Path, Tuple[str, str, int]], Optional[shared_memory.SharedMemory]]:
+    """
+    Hand a PDF to a parse worker without pickling its bytes.
+    
+    Cached files are passed by path; downloaded bytes are copied once into a shared
+    memory block. Returns (pdf_ref, shm) - the caller releases shm when the task is done.
+    """
+    if isinstance(content, Path):
+        return (content, None)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(content)))
+    shm.buf[:len(content)] = content
+    return (('shm', shm.name, len(content)), shm)
+
+def release_shared_pdf(shm: Optional[shared_memory.SharedMemory]):
+    """Free a shared memory block created by share_pdf."""
+    if shm is not None:
+        shm.close()
+        shm.unlink()
+
+def read_pdf_ref(pdf_ref: Union[bytes, Path, Tuple[str, str, int]]) -> Union[bytes, Path]:
+    """Resolve a pdf_ref inside a worker (shared memory blocks are attached and copied out)."""
+    if isinstance(pdf_ref, tuple):
+        _, name, size = pdf_ref
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            return bytes(shm.buf[:size])
+        finally:
+            shm.close()
+    return pdf_ref
+
+def parse_paper_task(paper_data: dict, pdf_ref: Union[bytes, Path, Tuple[str, str, int]],
+                     partial: bool) -> Tuple[List[Dict], str, float, List[str]]:
+    """
+    Parse page 0, find emails and match them to authors (runs in a parse worker or inline).
+    
+    Returns:
+        (results, status, parse_seconds, emails)
+    """
+    start = time.time()
+    text = first_page_text(read_pdf_ref(pdf_ref))
+    if partial and not (text and text.strip()):
+        return ([], STATUS_PARTIAL_UNUSABLE, time.time() - start, [])
+    if text is None:
+        return ([], STATUS_PARSE_ERROR, time.time() - start, [])
+    
+    emails = find_emails_in_text(text)
+    results = build_results(paper_data, parse_authors(paper_data), emails)
+    return (results, STATUS_OK if emails else STATUS_NO_EMAILS, time.time() - start, emails)
+
+def make_parse_pool(settings: Dict) -> Optional[SupervisedPool]:
+    """
+    Process pool for the parse stage (None = parse inline on the main thread).
+    
+    Each parse runs under parse_timeout_seconds and parse_max_rss_mb; a worker that
+    breaches either is killed and replaced, and the paper is journaled as parse-timeout.
+    Inline parsing (parse_workers: 0) has no such protection.
+    """
+    parse_workers = settings['parse_workers']
+    if parse_workers is None:
+        parse_workers = max(1, (os.cpu_count() or 2) - 1)
+    if parse_workers <= 0:
+        return None
+    return SupervisedPool(parse_workers, task_timeout=settings['parse_timeout_seconds'] or None,
+                          max_rss_mb=settings['parse_max_rss_mb'] or None)
+
+def extract_pipeline(prefetched: Iterator[Tuple[int, Dict, Union[Future, Tuple, None]]], processed_urls: set,
+                     fetcher: PDFFetcher, parse_pool: Optional[SupervisedPool], depth: int = 8,
+                     result_cache: Optional['ResultCache'] = None, cache_dir: Optional[Path] = None) -> Iterator[Tuple[int, Dict, Optional[Tuple[List[Dict], str, float, float]]]]:
+    """
+    Feed downloaded PDFs into the parse stage and yield outcomes in input order.
+    
+    Freshly extracted papers are stored in result_cache (if given). A first-page buffer
+    that turns out unusable is replaced by the full PDF, which goes to cache_dir too.
+    
+    Yields:
+        (index, paper, outcome) - outcome is None for already-processed papers, otherwise
+        (results, status, download_seconds, parse_seconds)
+    """
+    window = deque()
+    
+    def finish_parse(paper, parsed, download_seconds):
+        results, status, parse_seconds, emails = parsed
+        if status == STATUS_PARTIAL_UNUSABLE:
+            logger.info(f"  First-page buffer unusable for {paper['arxiv_id']}, downloading full PDF")
+            if cache_dir is not None:
+                # Otherwise load_pdf (and every rerun) would hand back the same bad buffer
+                (cache_dir / f"{paper['arxiv_id']}.page0.pdf").unlink(missing_ok=True)
+            content, is_captcha, _ = load_pdf(paper, fetcher, cache_dir, False)
+            if content is None:
+                return ([], STATUS_CAPTCHA if is_captcha else STATUS_HTTP_ERROR, download_seconds, parse_seconds)
+            if parse_pool is None:
+                results, status, parse_seconds, emails = parse_paper_task(paper, content, False)
+            else:
+                pdf_ref, shm = share_pdf(content)
+                try:
+                    results, status, parse_seconds, emails = parse_pool.submit(parse_paper_task, paper, pdf_ref, False).result()
+                finally:
+                    release_shared_pdf(shm)
+        if result_cache is not None and status in (STATUS_OK, STATUS_NO_EMAILS):
+            result_cache.store(paper, emails, results, status)
+        return (results, status, download_seconds, parse_seconds)
+    
+    def start(item):
+        i, paper, download = item
+        if paper.get('pdf_url', '') in processed_urls:
+            return (i, paper, None, None)
+        if download is None:
+            return (i, paper, None, ([], STATUS_NO_AUTHORS, 0.0, 0.0))
+        if not isinstance(download, Future):
+            results, status = download  # Result cache hit / all authors already known
+            return (i, paper, None, (results, status, 0.0, 0.0))
+        
+        content, is_captcha, partial, download_seconds = download.result()
+        if content is None:
+            return (i, paper, None, ([], STATUS_CAPTCHA if is_captcha else STATUS_HTTP_ERROR, download_seconds, 0.0))
+        if parse_pool is None:
+            return (i, paper, None, finish_parse(paper, parse_paper_task(paper, content, partial), download_seconds))
+        
+        pdf_ref, shm = share_pdf(content)
+        return (i, paper, (parse_pool.submit(parse_paper_task, paper, pdf_ref, partial), shm, download_seconds), None)
+    
+    def finish(entry):
+        i, paper, pending, outcome = entry
+        if pending is not None:
+            future, shm, download_seconds = pending
+            try:
+                outcome = finish_parse(paper, future.result(), download_seconds)
+            except (ParseTimeout, ParseMemoryExceeded) as e:
+                # The worker was killed and replaced; move on to the next paper
+                logger.error(f"⏱️  Parse worker killed for {paper['arxiv_id']}: {e}")
+                outcome = ([], STATUS_PARSE_TIMEOUT, download_seconds, 0.0)
+            except Exception as e:
+                logger.error(f"Parse worker failed for {paper['arxiv_id']}: {e}")
+                outcome = ([], STATUS_PARSE_ERROR, download_seconds, 0.0)
+            finally:
+                release_shared_pdf(shm)
+        return (i, paper, outcome)
+    
+    try:
+        for item in prefetched:
+            window.append(start(item))
+            # Keep up to `depth` parses in flight; results leave in input order
+            if sum(1 for entry in window if entry[2] is not None) >= depth or window[0][2] is None:
+                yield finish(window.popleft())
+        while window:
+            yield finish(window.popleft())
+    finally:
+        # Stopped early (CAPTCHA etc.): free shared memory of parses nobody will collect
+        for _, _, pending, _ in window:
+            if pending is not None:
+                pending[0].cancel()
+                release_shared_pdf(pending[1])
+
+# ============================================================================
+# Result Cache
+# ============================================================================
+
+class ResultCache:
+    """
+    Persistent per-paper extraction results, keyed by (arxiv_id, version).
+    
+    Each entry keeps the emails found on page 0 and the matched rows (author, email,
+    confidence), stamped with MATCHER_VERSION. A hit yields the output rows without
+    downloading anything; an entry from an older matcher (or a different author list)
+    is re-matched from its cached emails and updated.
+    """
+    
+    def __init__(self, db_file: str):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_file), timeout=60)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # Several 2.2 runs may share the cache
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS papers (
+                arxiv_id TEXT NOT NULL,
+                version TEXT NOT NULL,
+                authors TEXT NOT NULL,
+                emails TEXT NOT NULL,
+                matches TEXT NOT NULL,
+                status TEXT NOT NULL,
+                matcher_version INTEGER NOT NULL,
+                updated TEXT,
+                PRIMARY KEY (arxiv_id, version)
+            )""")
+        self.conn.commit()
+        self.stats = Counter()
+    
+    def lookup(self, paper_data: dict) -> Optional[Tuple[List[Dict], str]]:
+        """(results, status) for a cached paper, or None if it has to be downloaded."""
+        row = self.conn.execute(
+            "SELECT authors, emails, matches, status, matcher_version FROM papers WHERE arxiv_id = ? AND version = ?",
+            (paper_data['arxiv_id'], paper_data.get('version', ''))).fetchone()
+        if row is None:
+            self.stats['misses'] += 1
+            return None
+        cached_authors, emails, matches, status, matcher_version = row
+        authors = parse_authors(paper_data)
+        emails = json.loads(emails)
+        
+        if matcher_version == MATCHER_VERSION and json.loads(cached_authors) == authors:
+            self.stats['hits'] += 1
+            return (rows_from_matches(paper_data, authors, [tuple(m) for m in json.loads(matches)]), status)
+        
+        # Matcher changed since this entry was written: re-match from the cached emails
+        results = build_results(paper_data, authors, emails)
+        self.store(paper_data, emails, results, status)
+        self.stats['rematched'] += 1
+        return (results, status)
+    
+    def store(self, paper_data: dict, emails: List[str], results: List[Dict], status: str):
+        """Record a paper's emails and matched rows under the current MATCHER_VERSION."""
+        authors = parse_authors(paper_data)
+        clean_to_author = {clean_author_name(a): a for a in authors}
+        matches = [(clean_to_author.get(r['Author'], r['Author']), r['Email'], float(r['Confidence'].rstrip('%')))
+                   for r in results if r['Email']]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO papers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (paper_data['arxiv_id'], paper_data.get('version', ''), json.dumps(authors), json.dumps(emails),
+             json.dumps(matches), status, MATCHER_VERSION, time.strftime('%Y-%m-%dT%H:%M:%S')))
+        self.conn.commit()
+        self.stats['stored'] += 1
+    
+    def close(self):
+        self.conn.close()
+
+def open_result_cache(settings: Dict) -> Optional[ResultCache]:
+    """The configured result cache, or None if result_cache_file is null or unusable."""
+    if not settings['result_cache_file']:
+        return None
+    try:
+        return ResultCache(settings['result_cache_file'])
+    except sqlite3.Error as e:
+        logger.warning(f"Result cache disabled - could not open {settings['result_cache_file']}: {e}")
+        return None
+
+# ============================================================================
+# Author Index (skip papers whose authors are already resolved)
+# ============================================================================
+
+def author_key(name: str) -> str:
+    """Identity key for an author name: accents stripped, lowercase, letters and spaces only."""
+    return ' '.join(re.sub(r'[^a-z ]', ' ', normalize_text(name)).split())
+
+def parse_confidence(value) -> float:
+    """'85%' / '85' / '0.85' -> 0.85 (0.0 if unparseable)."""
+    try:
+        confidence = float(str(value).strip().rstrip('%'))
+    except ValueError:
+        return 0.0
+    return confidence / 100.0 if confidence > 1 else confidence
+
+class AuthorIndex:
+    """
+    Normalized author name -> best known (email, confidence) from earlier outputs.
+    
+    Built from ACL and prior-round CSVs (any CSV with Paper URL / Author / Email / Confidence
+    columns) and updated with this run's own matches, so a paper whose authors all already
+    have an email at or above min_confidence does not need its PDF downloaded.
+    
+    Names alone collide (there are many Wei Wangs), so a known author only counts as
+    resolved on a paper that also lists one of their known co-authors - someone they
+    shared a paper with in the sources. Single-author papers are therefore never skipped.
+    One index may be shared by files running at once (2.3).
+    """
+    
+    def __init__(self, min_confidence: float = 0.75):
+        self.min_confidence = min_confidence
+        self.known: Dict[str, Tuple[str, float]] = {}
+        self.coauthors: Dict[str, Set[str]] = {}  # author key -> keys of authors they shared a paper with
+        self.stats = Counter()
+        self.lock = threading.Lock()
+    
+    def add(self, author: str, email: str, confidence: float):
+        if not author or not email or confidence < self.min_confidence:
+            return
+        key = author_key(author)
+        if key and (key not in self.known or confidence > self.known[key][1]):
+            self.known[key] = (email.strip().lower(), confidence)
+    
+    def link(self, authors: Iterable[str]):
+        """Record that these authors (names or keys) wrote a paper together."""
+        keys = {author_key(a) for a in authors} - {''}
+        for key in keys:
+            self.coauthors.setdefault(key, set()).update(keys - {key})
+    
+    def add_results(self, results: List[Dict]):
+        """Learn from output rows as they are written."""
+        papers = defaultdict(list)
+        with self.lock:
+            for row in results:
+                self.add(row['Author'], row['Email'], parse_confidence(row['Confidence']))
+                papers[row.get('Paper URL', '')].append(row['Author'])
+            for authors in papers.values():
+                self.link(authors)
+    
+    def load_sources(self, patterns: List[str]):
+        """Load every CSV matching the glob patterns (missing files and bad rows are skipped)."""
+        for pattern in patterns:
+            for path in sorted(Path('.').glob(pattern)):
+                try:
+                    with open(path, 'r', encoding='utf-8', newline='') as f:
+                        before = len(self.known)
+                        papers = defaultdict(list)
+                        for row in csv.DictReader(f):
+                            self.add(row.get('Author', ''), row.get('Email', ''),
+                                     parse_confidence(row.get('Confidence', 0)))
+                            papers[row.get('Paper URL', '')].append(row.get('Author', ''))
+                        papers.pop('', None)
+                        for authors in papers.values():
+                            self.link(authors)
+                    logger.info(f"  👥 {path}: +{len(self.known) - before:,} resolved authors")
+                except Exception as e:
+                    logger.warning(f"  ⚠️  Could not load author index source {path}: {e}")
+    
+    def resolved(self, authors: List[str]) -> Set[str]:
+        """Keys of a paper's authors that have a known email and a known co-author on the paper."""
+        keys = {author_key(a) for a in authors}
+        return {key for key in keys
+                if key in self.known and not self.coauthors.get(key, set()).isdisjoint(keys - {key})}
+    
+    def all_resolved(self, authors: List[str]) -> bool:
+        keys = {author_key(a) for a in authors}
+        return bool(authors) and self.resolved(authors) == keys
+    
+    def should_skip(self, paper_data: dict) -> bool:
+        """True (and counted) if every author of the paper already has a known email."""
+        authors = parse_authors(paper_data)
+        skip = self.all_resolved(authors)
+        with self.lock:
+            if skip:
+                self.stats['downloads_avoided'] += 1
+                self.stats['authors_covered'] += len(authors)
+            else:
+                self.stats['downloads_needed'] += 1
+        return skip
+
+def build_author_index(settings: Dict) -> Optional[AuthorIndex]:
+    """Author index from the configured sources, or None if skipping is turned off."""
+    if not settings['skip_resolved_authors']:
+        return None
+    index = AuthorIndex(settings['author_index_min_confidence'])
+    index.load_sources(settings['author_index_sources'])
+    logger.info(f"  👥 Author index: {len(index.known):,} resolved authors "
+                f"(confidence >= {index.min_confidence:.0%})")
+    return index
+
+def log_expected_yield(papers: List[Dict], processed_urls: set, author_index: AuthorIndex):
+    """Before downloading: how many papers are already fully covered by the author index."""
+    pending = [p for p in papers if p.get('pdf_url', '') not in processed_urls and parse_authors(p)]
+    covered = sum(1 for p in pending if author_index.all_resolved(parse_authors(p)))
+    unresolved = set().union(*({author_key(a) for a in parse_authors(p)} - author_index.resolved(parse_authors(p))
+                               for p in pending))
+    logger.info(f"  👥 Expected yield: {covered:,}/{len(pending):,} papers have only known authors "
+                f"(downloads avoided) | {len(unresolved):,} unresolved authors in the rest")
+
+# ============================================================================
+# Download Planner (greedy set cover over unresolved authors)
+# ============================================================================
+
+def plan_downloads(papers: List[Dict], author_index: Optional[AuthorIndex] = None,
+                   coverage_target: float = 1.0) -> List[Dict]:
+    """
+    Choose an approximately minimal set of papers covering every unresolved author.
+    
+    Builds author -> papers over the CSV and greedily picks the paper that covers the most
+    still-uncovered unresolved authors (ties go to the paper with fewer authors, whose
+    emails are more likely all printed, then to input order), until coverage_target of
+    the unresolved authors is covered. Returns the chosen papers in pick order.
+    
+    Papers left out are not journaled, so a later run re-plans them for any author
+    whose email was not found in the chosen paper.
+    """
+    paper_authors = [{author_key(a) for a in parse_authors(p)} for p in papers]
+    if author_index is not None:
+        paper_authors = [authors - author_index.resolved(parse_authors(p)) for p, authors in zip(papers, paper_authors)]
+    to_cover = set().union(*paper_authors) if paper_authors else set()
+    if not to_cover:
+        return []
+    
+    # Lazy greedy: a paper's gain only shrinks, so a popped entry whose gain is still
+    # current is the best choice
+    heap = [(-len(authors), len(parse_authors(p)), i) for i, (p, authors) in enumerate(zip(papers, paper_authors)) if authors]
+    heapq.heapify(heap)
+    covered = set()
+    plan = []
+    target = coverage_target * len(to_cover)
+    while heap and len(covered) < target:
+        neg_gain, size, i = heapq.heappop(heap)
+        gain = len(paper_authors[i] - covered)
+        if gain == 0:
+            continue
+        if gain < -neg_gain:
+            heapq.heappush(heap, (-gain, size, i))
+            continue
+        plan.append(papers[i])
+        covered |= paper_authors[i]
+    
+    logger.info(f"  🗺  Download plan: {len(plan):,} of {len(papers):,} papers cover "
+                f"{len(covered):,}/{len(to_cover):,} unresolved authors ({len(covered) / len(to_cover):.0%}); "
+                f"{len(papers) - len(plan):,} downloads not needed")
+    return plan
+
+# ============================================================================
+# Progress Journal
+# ============================================================================
+
+# Per-paper statuses recorded in the journal
+STATUS_OK = 'ok'
+STATUS_NO_EMAILS = 'no-emails'
+STATUS_NO_AUTHORS = 'no-authors'
+STATUS_HTTP_ERROR = 'http-error'
+STATUS_CAPTCHA = 'captcha'
+STATUS_PARSE_ERROR = 'parse-error'
+STATUS_PARSE_TIMEOUT = 'parse-timeout'  # Parse worker killed: over parse_timeout_seconds or parse_max_rss_mb
+STATUS_KNOWN_AUTHORS = 'known-authors'  # Skipped: every author already has a known email
+
+# Papers with these statuses are finished; the rest can be retried with --retry-failed
+DONE_STATUSES = {STATUS_OK, STATUS_NO_EMAILS, STATUS_NO_AUTHORS, STATUS_KNOWN_AUTHORS}
+FAILED_STATUSES = {STATUS_HTTP_ERROR, STATUS_CAPTCHA, STATUS_PARSE_ERROR, STATUS_PARSE_TIMEOUT}
+
+def get_journal_path(output_csv: str) -> Path:
+    """Journal sidecar next to the output: cs_lg_2023_email.csv -> cs_lg_2023_email.journal.jsonl"""
+    return Path(output_csv).with_suffix('.journal.jsonl')
+
+def load_journal(journal_path: Path) -> Dict[str, Dict]:
+    """Load the journal as {paper_url: latest entry} (later lines override earlier ones)."""
+    entries = {}
+    if not journal_path.exists():
+        return entries
+    
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn last line from a crash
+            entries[entry['url']] = entry
+    return entries
+
+def count_pending(input_csv: str, output_csv: str) -> int:
+    """Papers in input_csv the journal does not mark finished (2.3's todo estimate for queued files)."""
+    finished = {url for url, entry in load_journal(get_journal_path(output_csv)).items()
+                if entry['status'] in DONE_STATUSES}
+    with open(input_csv, 'r', encoding='utf-8') as f:
+        return sum(1 for paper in csv.DictReader(f) if paper.get('pdf_url', '') not in finished)
+
+class ProgressJournal:
+    """Append-only JSONL log with one line per attempted paper (status + timing)."""
+    
+    def __init__(self, journal_path: Path):
+        self.journal_path = journal_path
+        self.file = open(journal_path, 'a', encoding='utf-8')
+    
+    def record(self, paper_data: dict, status: str, records: int = 0,
+               download_seconds: float = 0.0, parse_seconds: float = 0.0):
+        """Append one paper's outcome and flush it to disk."""
+        entry = {
+            'url': paper_data.get('pdf_url', ''),
+            'arxiv_id': paper_data.get('arxiv_id', ''),
+            'status': status,
+            'records': records,
+            'download_s': round(download_seconds, 3),
+            'parse_s': round(parse_seconds, 3),
+            'ts': time.time(),
+        }
+        self.file.write(json.dumps(entry) + '\n')
+        self.file.flush()
+    
+    def close(self):
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+def seed_journal_from_output(output_csv: str, journal: ProgressJournal) -> Dict[str, Dict]:
+    """
+    One-time migration for outputs written before the journal existed:
+    every paper URL already in the output CSV is recorded as done.
+    """
+    entries = {}
+    with open(output_csv, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            url = row.get('Paper URL')
+            if url and url not in entries:
+                entries[url] = {'url': url, 'status': STATUS_OK}
+                journal.record({'pdf_url': url}, STATUS_OK)
+    return entries
 
 # ============================================================================
 # Main Processing
 # ============================================================================
 
-def process_csv_file(input_csv: str, output_csv: str):
-    """Process a CSV file of papers and extract email information."""
+# Outcomes of a process_csv_file run (its returned summary['outcome'])
+RUN_COMPLETED = 'completed'
+RUN_CAPTCHA = 'captcha'   # Stopped: arXiv served a CAPTCHA, cookies need refreshing
+RUN_STOPPED = 'stopped'   # Stopped early via stop_event (another file in the batch hit a CAPTCHA)
+RUN_ERROR = 'error'
+
+def process_csv_file(input_csv: str, output_csv: str, first_page_only: Optional[bool] = None,
+                     retry_failed: bool = False, plan: Optional[bool] = None,
+                     coverage_target: Optional[float] = None, pdf_sources: Optional[List[str]] = None,
+                     parse_pool: Optional[SupervisedPool] = None, author_index: Optional[AuthorIndex] = None,
+                     stop_event: Optional[threading.Event] = None, batch_id: Optional[str] = None) -> Dict:
+    """
+    Process a CSV file of papers and extract email information.
+    
+    Every attempted paper is recorded in a journal next to the output, so a rerun skips
+    finished papers and retry_failed=True reprocesses only failed ones. With plan=True
+    only a greedy covering set of papers for the unresolved authors is downloaded,
+    stopping once coverage_target of them is covered. With pdf_sources (directories or
+    tar/zip archives) PDFs are read locally instead of downloaded, and nothing is planned.
+    
+    Several files may run at once in one process (2.3): they share the fetcher, so one
+    download rate and in-flight budget, and may share a parse_pool and an author_index
+    (built from the configured sources when not given). Setting stop_event
+    makes the run stop after the paper in hand. Progress events (see progress_events.py)
+    go to progress_events_file, tagged with batch_id.
+    
+    Returns:
+        Run summary dict: input, output, outcome (completed / captcha / stopped / error),
+        papers, processed, skipped, records, statuses (journal status counts for this run),
+        throttled and cooldowns (pacer events while it ran), elapsed_seconds, error
+    """
     logger.info(f"Processing {input_csv}...")
+    summary = {'input': input_csv, 'output': output_csv, 'outcome': RUN_COMPLETED, 'papers': 0,
+               'processed': 0, 'skipped': 0, 'records': 0, 'statuses': Counter(),
+               'throttled': 0, 'cooldowns': 0, 'elapsed_seconds': 0.0, 'error': ''}
     
     # Load config for email extraction parameters
-    config = load_config()
-    if config and 'email_extraction' in config:
-        ext_config = config['email_extraction']
-        temp_dir_name = ext_config.get('temp_dir', 'temp_pdfs')
-        max_retries = ext_config.get('max_retries', 3)
-        rate_limit_delay = ext_config.get('rate_limit_delay_seconds', 3.0)
-    else:
-        temp_dir_name = 'temp_pdfs'
-        max_retries = 3
-        rate_limit_delay = 3.0
-    
-    # Create temp directory for PDFs
-    temp_dir = Path(temp_dir_name)
-    temp_dir.mkdir(exist_ok=True)
+    settings = load_extraction_settings()
+    if first_page_only is None:
+        first_page_only = settings['first_page_only']
+    if plan is None:
+        plan = settings['plan_downloads']
+    if coverage_target is None:
+        coverage_target = settings['plan_coverage_target']
+    fetcher = get_fetcher(settings['max_retries'], settings['rate_limit_delay'])
+    
+    # PDFs are parsed straight from memory; only spill to disk if a PDF cache is configured
+    cache_dir = Path(settings['pdf_cache_dir']) if settings['pdf_cache_dir'] else None
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
     
     # Read input CSV
     papers = []
@@ -597,29 +1612,47 @@ def process_csv_file(input_csv: str, output_csv: str):
             papers = list(reader)
     except Exception as e:
         logger.error(f"Error reading {input_csv}: {e}")
-        return
+        summary.update(outcome=RUN_ERROR, error=f"Error reading {input_csv}: {e}")
+        return summary
     
     logger.info(f"  Found {len(papers)} papers to process")
     
-    # Check if output CSV already exists and read already-processed papers
-    processed_urls = set()
+    # Check if output CSV already exists and load per-paper status from the journal
     output_path = Path(output_csv)
+    journal_path = get_journal_path(output_csv)
     resume_mode = output_path.exists()
+    journal_entries = {}
     
     if resume_mode:
         try:
-            with open(output_csv, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('Paper URL'):
-                        processed_urls.add(row['Paper URL'])
-            logger.info(f"  📁 RESUME MODE: Found {len(processed_urls)} already-processed paper URLs")
-            logger.info(f"  📁 Will skip these and continue from where we left off")
+            journal_entries = load_journal(journal_path)
+            if not journal_entries:
+                # Output from before the journal existed: seed it from the CSV once
+                with ProgressJournal(journal_path) as seed_journal:
+                    journal_entries = seed_journal_from_output(output_csv, seed_journal)
+            logger.info(f"  📁 RESUME MODE: Journal has {len(journal_entries)} attempted papers")
         except Exception as e:
             logger.warning(f"  ⚠️  Could not read existing output file: {e}")
             logger.warning(f"  ⚠️  Starting from scratch")
-            processed_urls = set()
+            journal_entries = {}
             resume_mode = False
+    elif journal_path.exists():
+        journal_path.unlink()  # Stale journal without its output
+    
+    status_counts = Counter(entry['status'] for entry in journal_entries.values())
+    if status_counts:
+        logger.info(f"  📁 Status: {dict(status_counts)}")
+    
+    if retry_failed:
+        # Only replay papers whose latest attempt failed
+        failed_urls = {url for url, entry in journal_entries.items() if entry['status'] in FAILED_STATUSES}
+        papers = [p for p in papers if p.get('pdf_url', '') in failed_urls]
+        processed_urls = set()
+        logger.info(f"  🔁 RETRY-FAILED MODE: {len(papers)} failed papers to retry")
+    else:
+        processed_urls = {url for url, entry in journal_entries.items() if entry['status'] in DONE_STATUSES}
+        if resume_mode:
+            logger.info(f"  📁 Will skip {len(processed_urls)} finished papers and continue from where we left off")
     
     # Open output CSV for writing (append if resume, overwrite if new)
     fieldnames = ['Paper URL', 'Title', 'Author', 'Email', 'Confidence']
@@ -629,36 +1662,76 @@ def process_csv_file(input_csv: str, output_csv: str):
     if not resume_mode:
         writer.writeheader()
     output_file.flush()
+    journal = ProgressJournal(journal_path)
     
     # Process each paper and write results immediately
     total_records = 0
     skipped_count = 0
     start_time = time.time()
-    consecutive_failures = 0
-    MAX_CONSECUTIVE_FAILURES = 5  # Stop if 5 PDFs fail in a row (likely rate limited)
+    
+    # Downloads run ahead in a small thread pool (paced by the fetcher's adaptive pacer) and feed
+    # a process pool that parses PDFs and matches emails; results are written in input order
+    executor = ThreadPoolExecutor(max_workers=fetcher.max_in_flight,
+                                  thread_name_prefix=f"{threading.current_thread().name}-download")
+    own_parse_pool = parse_pool is None
+    if own_parse_pool:
+        parse_pool = make_parse_pool(settings)
+    pacer_stats = Counter(fetcher.pacer.stats) if fetcher.pacer is not None else Counter()
+    # Papers already extracted in another CSV or an earlier run come from the result cache
+    result_cache = open_result_cache(settings)
+    # Papers whose authors all have a known email (ACL, prior rounds, other CSVs) are not downloaded
+    if author_index is None:
+        author_index = build_author_index(settings)
+    if author_index is not None:
+        index_stats = Counter(author_index.stats)
+        log_expected_yield(papers, processed_urls, author_index)
+    if plan and not retry_failed and not pdf_sources:
+        # Download only enough papers to cover each unresolved author once, best first
+        papers = plan_downloads([p for p in papers if p.get('pdf_url', '') not in processed_urls],
+                                author_index, coverage_target)
+    # Speed and ETA count only papers finished in this run, over a recent window
+    progress = FileProgress(Path(input_csv).stem, sum(1 for p in papers if p.get('pdf_url', '') not in processed_urls),
+                            get_emitter(settings['progress_events_file']), batch_id)
+    progress.started(input=input_csv, output=output_csv)
+    if pdf_sources:
+        # Offline ingestion: no HTTP, so parsing runs as fast as the workers allow
+        prefetched = local_papers(papers, pdf_sources, processed_urls, result_cache, author_index, progress)
+    else:
+        prefetched = prefetch_papers(papers, processed_urls, fetcher, cache_dir, executor, first_page_only,
+                                     settings['first_page_range_bytes'], result_cache, author_index, progress)
+    depth = 2 * parse_pool.max_workers if parse_pool is not None else 1
+    pipeline = extract_pipeline(prefetched, processed_urls, fetcher, parse_pool, depth, result_cache, cache_dir)
     
     try:
-        for i, paper in enumerate(papers, 1):
+        for i, paper, outcome in pipeline:
+            if stop_event is not None and stop_event.is_set():
+                logger.warning(f"⏹  Stopping {input_csv}: another file in the batch asked to stop")
+                summary['outcome'] = RUN_STOPPED
+                break
+            
             # Skip if already processed
-            paper_url = paper.get('pdf_url', '')
-            if paper_url in processed_urls:
+            if outcome is None:
                 skipped_count += 1
                 continue
             
-            # Show progress more frequently and with more details
-            if (i - skipped_count) % 5 == 0:
-                elapsed = time.time() - start_time
-                processed_count = i - skipped_count
-                speed = processed_count / elapsed if elapsed > 0 else 0
-                remaining = len(papers) - i
-                eta_seconds = remaining / speed if speed > 0 else 0
-                eta_minutes = eta_seconds / 60
-                logger.info(f"  [{i}/{len(papers)}] {i/len(papers)*100:.1f}% | Processed: {processed_count} | Skipped: {skipped_count} | Records: {total_records} | Speed: {speed:.1f} papers/s | ETA: {eta_minutes:.1f} min")
+            results, status, download_seconds, parse_seconds = outcome
+            if status == STATUS_NO_AUTHORS:
+                logger.warning(f"No authors found for {paper['arxiv_id']}")
+            
+            is_captcha = status == STATUS_CAPTCHA
+            journal.record(paper, status, len(results), download_seconds, parse_seconds)
+            summary['statuses'][status] += 1
+            progress.paper_done(status, len(results))
             
-            results, pdf_success, is_captcha = process_paper(paper, temp_dir, max_retries, rate_limit_delay)
+            # Show progress more frequently and with more details
+            if progress.done % 5 == 0:
+                eta_seconds = progress.eta_seconds or 0
+                logger.info(f"  [{progress.done}/{progress.todo}] {progress.done / max(1, progress.todo) * 100:.1f}% | Skipped: {skipped_count} | Records: {total_records} | Speed: {progress.rate:.1f} papers/s | ETA: {eta_seconds / 60:.1f} min")
             
-            # If CAPTCHA detected, stop IMMEDIATELY (don't wait for 5 failures)
+            # If CAPTCHA detected, stop IMMEDIATELY (rate limits are handled by the fetcher's
+            # pacer, which slows down and cools off instead of giving up)
             if is_captcha:
+                summary['outcome'] = RUN_CAPTCHA
                 logger.error(f"")
                 logger.error(f"{'='*80}")
                 logger.error(f"⛔ CAPTCHA DETECTED - STOPPING ALL PROCESSING IMMEDIATELY")
@@ -674,35 +1747,55 @@ def process_csv_file(input_csv: str, output_csv: str):
                 logger.error(f"{'='*80}")
                 break
             
-            # Track consecutive PDF download failures (for non-CAPTCHA errors)
-            if not pdf_success:
-                consecutive_failures += 1
-                if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                    logger.error(f"⚠️  STOPPING: {consecutive_failures} consecutive PDF download failures - likely rate limited!")
-                    logger.error(f"⚠️  Processed {i - skipped_count}/{len(papers)} papers (skipped {skipped_count}), saved {total_records} records")
-                    logger.error(f"⚠️  Resume later or wait for rate limit to reset")
-                    break
-            else:
-                consecutive_failures = 0  # Reset counter on successful download
-            
             # Write results immediately
             if results:
+                if author_index is not None:
+                    author_index.add_results(results)
                 writer.writerows(results)
                 output_file.flush()  # Force write to disk
                 total_records += len(results)
     finally:
+        # Drop queued downloads/parses if we stopped early (in-flight ones finish on their own)
+        pipeline.close()
+        executor.shutdown(wait=True, cancel_futures=True)
+        if parse_pool is not None and own_parse_pool:
+            parse_pool.shutdown(wait=True, cancel_futures=True)
         output_file.close()
+        journal.close()
+        if fetcher.pacer is not None:
+            fetcher.pacer.save()
+        if result_cache is not None:
+            result_cache.close()
         elapsed = time.time() - start_time
         processed_count = len(papers) - skipped_count
+        summary.update(papers=len(papers), processed=sum(summary['statuses'].values()), skipped=skipped_count,
+                       records=total_records, elapsed_seconds=elapsed)
+        if fetcher.pacer is not None:
+            summary['throttled'] = fetcher.pacer.stats['trouble'] - pacer_stats['trouble']
+            summary['cooldowns'] = fetcher.pacer.stats['cooldowns'] - pacer_stats['cooldowns']
+        progress.finished(summary['outcome'], throttled=summary['throttled'], cooldowns=summary['cooldowns'])
         logger.info(f"✓ Completed: {len(papers)} papers in {elapsed/60:.1f} minutes")
         logger.info(f"   Processed: {processed_count} | Skipped: {skipped_count} | Records saved: {total_records}")
         logger.info(f"   Output: {output_csv}")
-    
-    # Clean up temp directory
-    try:
-        temp_dir.rmdir()
-    except:
-        pass  # Directory might not be empty if errors occurred
+        logger.info(f"   Journal: {journal_path}")
+        if author_index is not None:
+            stats = author_index.stats - index_stats
+            logger.info(f"   Author index: {stats['downloads_avoided']} downloads avoided "
+                        f"({stats['authors_covered']} known authors) | {stats['downloads_needed']} papers "
+                        f"still needed a download")
+        if result_cache is not None:
+            stats = result_cache.stats
+            logger.info(f"   Result cache: {stats['hits']} hits | {stats['rematched']} re-matched | "
+                        f"{stats['stored']} stored")
+        if parse_pool is not None and own_parse_pool and (parse_pool.stats['timeouts'] or parse_pool.stats['memory_kills']):
+            logger.info(f"   Parse workers killed: {parse_pool.stats['timeouts']} timeouts | "
+                        f"{parse_pool.stats['memory_kills']} over memory cap")
+        if fetcher.pacer is not None:
+            stats = fetcher.pacer.stats
+            logger.info(f"   Pace: {fetcher.pacer.delay:.2f}s per download | Throttled/failed: {stats['trouble']} | "
+                        f"Slow: {stats['slow']} | Cooldowns: {stats['cooldowns']}")
+    
+    return summary
 
 def main():
     import argparse
@@ -710,10 +1803,25 @@ def main():
     parser = argparse.ArgumentParser(description='Extract emails from arXiv PDFs and match to authors.')
     parser.add_argument('--input', type=str, required=True, help='Input CSV file (from 2.1-query_arxiv_papers.py)')
     parser.add_argument('--output', type=str, required=True, help='Output CSV file')
+    parser.add_argument('--first-page-only', action='store_true', default=None,
+                        help='Fetch only the first page of linearized PDFs via HTTP Range requests (falls back to full downloads)')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='Reprocess only papers whose journal status is http-error, captcha, parse-error or parse-timeout')
+    parser.add_argument('--plan', dest='plan', action='store_true', default=None,
+                        help='Download only a covering set of papers for the unresolved authors (skips papers '
+                             'whose authors another planned paper already covers; rerun to re-plan)')
+    parser.add_argument('--no-plan', dest='plan', action='store_false',
+                        help='Download every paper even if plan_downloads is on in the config')
+    parser.add_argument('--pdf-source', dest='pdf_sources', action='append', default=None,
+                        help='Read PDFs from a local directory or tar/zip archive (e.g. arXiv bulk tarballs) '
+                             'instead of downloading; files are matched to papers by arXiv ID. Repeatable')
+    parser.add_argument('--coverage-target', type=float, default=None,
+                        help='Stop planning once this fraction of unresolved authors is covered (default from config, 1.0)')
     
     args = parser.parse_args()
     
-    process_csv_file(args.input, args.output)
+    process_csv_file(args.input, args.output, first_page_only=args.first_page_only, retry_failed=args.retry_failed,
+                     plan=args.plan, coverage_target=args.coverage_target, pdf_sources=args.pdf_sources)
 
 if __name__ == "__main__":
     main()
@@ -12,18 +12,36 @@ Usage:
     
     # Custom directory (overrides round)
     python3.9 2.3-batch_extract_emails.py --input-dir data/arxiv/round2
+    
+    # Process 3 category files at once (they share one download rate and one parse pool)
+    python3.9 2.3-batch_extract_emails.py --jobs 3
 """
 
-import subprocess
+import importlib.util
 import logging
+import sys
+import threading
 import time
 import argparse
+import csv
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, Optional
+
+from progress_events import get_emitter, new_batch_id
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 2.2 runs in this process. It is registered under an importable name at import time so
+# spawned parse workers (macOS) can unpickle its functions after re-running this module.
+_spec = importlib.util.spec_from_file_location(
+    'extract_emails_from_papers', Path(__file__).parent / '2.2-extract_emails_from_papers.py')
+extract = importlib.util.module_from_spec(_spec)
+sys.modules['extract_emails_from_papers'] = extract
+_spec.loader.exec_module(extract)
+
 def load_config(config_file: str = 'arxiv_collection_config.json'):
     """Load configuration from JSON file."""
     config_path = Path(config_file)
@@ -38,16 +56,34 @@ def load_config(config_file: str = 'arxiv_collection_config.json'):
         logger.warning(f"Error loading config file: {e}")
         return None
 
-def extract_emails_for_file(input_csv: str, output_csv: str, log_file: str) -> tuple[bool, bool]:
+class ThreadLogFilter(logging.Filter):
+    """Pass records logged by one file's threads (its own thread and its download threads)."""
+    
+    def __init__(self, thread_name: str):
+        super().__init__()
+        self.thread_name = thread_name
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.threadName == self.thread_name or record.threadName.startswith(f"{self.thread_name}-")
+
+def extract_emails_for_file(input_csv: str, output_csv: str, log_file: str, parse_pool=None, author_index=None,
+                            stop_event: Optional[threading.Event] = None, batch_id: Optional[str] = None) -> Dict:
     """
-    Run email extraction for a single CSV file.
+    Run email extraction for a single CSV file in this process (2.2's process_csv_file).
+    
+    Runs on the calling thread, which is renamed after the category so its log lines
+    (and its download threads') also go to log_file.
     
     Returns:
-        (success, should_continue): 
-            - success: True if processing completed successfully
-            - should_continue: False if hit CAPTCHA/rate limit and should stop batch
+        process_csv_file's run summary - outcome is completed / captcha / stopped / error
     """
     category_name = Path(input_csv).stem
+    threading.current_thread().name = category_name
+    
+    handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    handler.addFilter(ThreadLogFilter(category_name))
+    logging.getLogger().addHandler(handler)
     
     logger.info(f"\n{'='*80}")
     logger.info(f"Processing {category_name}...")
@@ -56,43 +92,34 @@ def extract_emails_for_file(input_csv: str, output_csv: str, log_file: str) -> t
     logger.info(f"Output: {output_csv}")
     logger.info(f"Log:    {log_file}")
     
-    cmd = [
-        '/opt/homebrew/Caskroom/miniforge/base/bin/python3.9',
-        '2.2-extract_emails_from_papers.py',
-        '--input', input_csv,
-        '--output', output_csv
-    ]
-    
     try:
-        with open(log_file, 'w') as log_f:
-            result = subprocess.run(
-                cmd,
-                stdout=log_f,
-                stderr=subprocess.STDOUT,
-                text=True,
-                check=False
-            )
-        
-        # Check log for CAPTCHA/rate limit errors
-        with open(log_file, 'r') as log_f:
-            log_content = log_f.read()
-            if 'CAPTCHA DETECTED' in log_content or 'STOPPING: 5 consecutive' in log_content or '429' in log_content:
-                logger.error(f"⚠️  CAPTCHA/Rate limit detected in {category_name}")
-                logger.error(f"⚠️  STOPPING BATCH PROCESSING - refresh cookies and restart")
-                logger.error(f"⚠️  Check log: {log_file}\n")
-                return (False, False)  # Failed, and should stop batch
-        
-        if result.returncode == 0:
-            logger.info(f"✓ {category_name} completed successfully")
-        return (True, True)  # Success, continue
-        else:
-            logger.error(f"✗ {category_name} failed with exit code {result.returncode}")
-            return (False, True)  # Failed, but can continue to next file
-            
+        result = extract.process_csv_file(input_csv, output_csv, parse_pool=parse_pool, author_index=author_index,
+                                          stop_event=stop_event, batch_id=batch_id)
     except Exception as e:
-        logger.error(f"✗ {category_name} error: {e}")
+        logger.exception(f"✗ {category_name} error: {e}")
+        result = {'input': input_csv, 'output': output_csv, 'outcome': extract.RUN_ERROR, 'records': 0,
+                  'throttled': 0, 'cooldowns': 0, 'error': str(e)}
+    finally:
+        logging.getLogger().removeHandler(handler)
+        handler.close()
+    
+    if result['outcome'] == extract.RUN_CAPTCHA:
+        logger.error(f"⚠️  CAPTCHA detected in {category_name}")
+        logger.error(f"⚠️  STOPPING BATCH PROCESSING - refresh cookies and restart")
+        logger.error(f"⚠️  Check log: {log_file}\n")
+    elif result['outcome'] == extract.RUN_ERROR:
+        logger.error(f"✗ {category_name} failed: {result['error']}")
         logger.error(f"  Check log: {log_file}\n")
-        return (False, True)  # Failed, but can continue to next file
+    elif result['outcome'] == extract.RUN_STOPPED:
+        logger.warning(f"⏹  {category_name} stopped early (resumes from its journal next run)")
+    else:
+        logger.info(f"✓ {category_name} completed successfully ({result['records']} records)")
+    # Rate limits are absorbed by 2.2's adaptive pacer (slows down and cools off), so they
+    # are reported but don't stop the batch
+    if result.get('cooldowns'):
+        logger.warning(f"⏸  {category_name} hit rate limits: {result['throttled']} throttled requests, "
+                       f"{result['cooldowns']} cooldowns")
+    return result
 
 def main():
     parser = argparse.ArgumentParser(
@@ -115,6 +142,8 @@ Examples:
                        help='Round number (if not specified, reads from config file)')
     parser.add_argument('--input-dir', type=str, default=None,
                        help='Custom input directory (overrides --round)')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Category files processed at once (default: batch_concurrent_files in config, 2)')
     
     args = parser.parse_args()
     
@@ -159,13 +188,34 @@ Examples:
     # Ensure logs directory exists
     logs_dir.mkdir(parents=True, exist_ok=True)
     
-    # Process each file
+    # Process files concurrently in this process: they share 2.2's fetcher (one download
+    # rate and in-flight budget) and one supervised parse pool
+    config = load_config() or {}
+    jobs = args.jobs or config.get('email_extraction', {}).get('batch_concurrent_files', 2)
+    jobs = max(1, min(jobs, len(csv_files)))
+    logger.info(f"Running {jobs} file(s) at a time")
+    
     total_files = len(csv_files)
     completed = 0
     failed = 0
     stopped_early = False
+    results = []
     
     start_time = time.time()
+    stop_event = threading.Event()
+    settings = extract.load_extraction_settings()
+    parse_pool = extract.make_parse_pool(settings)
+    # One author index for the batch: loaded once and shared, so a file also skips authors
+    # another file of the batch has just resolved
+    author_index = extract.build_author_index(settings)
+    # Live progress for `python3.9 progress_events.py watch` (per file and for the whole batch)
+    batch_id = new_batch_id()
+    events = get_emitter(settings['progress_events_file'])
+    if events is not None:
+        events.emit('batch-start', batch=batch_id, input_dir=str(input_dir), files=len(csv_files), jobs=jobs)
+        logger.info(f"Progress events: {settings['progress_events_file']} (batch {batch_id})")
+    scheduler = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='batch')
+    futures = {}
     
     for i, input_csv in enumerate(csv_files, 1):
         category_name = input_csv.stem
@@ -177,27 +227,58 @@ Examples:
         else:
             log_file = logs_dir / f"{category_name}_round{args.round}_processing.log"
         
-        logger.info(f"\n[{i}/{total_files}] Processing {category_name}...")
-            
-        success, should_continue = extract_emails_for_file(str(input_csv), str(output_csv), str(log_file))
+        logger.info(f"[{i}/{total_files}] Queued {category_name}")
+        if events is not None:
+            # Lets watch count files still waiting for a slot in the batch ETA
+            try:
+                todo = extract.count_pending(str(input_csv), str(output_csv))
+                events.emit('file-queued', batch=batch_id, file=category_name, todo=todo)
+            except (OSError, csv.Error) as e:
+                logger.warning(f"Could not count pending papers in {input_csv}: {e}")
+        future = scheduler.submit(extract_emails_for_file, str(input_csv), str(output_csv), str(log_file),
+                                  parse_pool, author_index, stop_event, batch_id)
+        futures[future] = category_name
+    
+    try:
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            result = future.result()
+            results.append(result)
             
-            if success:
+            if result['outcome'] == extract.RUN_COMPLETED:
                 completed += 1
-            else:
+            elif result['outcome'] != extract.RUN_STOPPED:
                 failed += 1
             
-            # If we hit CAPTCHA/rate limit, stop the entire batch
-            if not should_continue:
+            # If we hit a CAPTCHA, stop the entire batch: running files stop after the
+            # paper in hand, queued files never start
+            if result['outcome'] == extract.RUN_CAPTCHA and not stopped_early:
                 stopped_early = True
+                stop_event.set()
+                for pending in futures:
+                    pending.cancel()
                 logger.error("="*80)
-                logger.error("⚠️  BATCH STOPPED DUE TO CAPTCHA/RATE LIMIT")
+                logger.error("⚠️  BATCH STOPPED DUE TO CAPTCHA")
                 logger.error("⚠️  To resume:")
                 logger.error("⚠️  1. Export fresh cookies from browser")
                 logger.error("⚠️  2. Save as arxiv.org_cookies.txt")
-            logger.error(f"⚠️  3. Run: python3.9 2.3-batch_extract_emails.py --round {args.round}")
+                logger.error(f"⚠️  3. Run: python3.9 2.3-batch_extract_emails.py --round {args.round}")
                 logger.error("="*80)
-                break
-            
+    except KeyboardInterrupt:
+        logger.warning("⏹  Interrupted - stopping running files after the paper in hand")
+        stop_event.set()
+        for pending in futures:
+            pending.cancel()
+        raise
+    finally:
+        scheduler.shutdown(wait=True, cancel_futures=True)
+        if parse_pool is not None:
+            parse_pool.shutdown(wait=True, cancel_futures=True)
+        if events is not None:
+            events.emit('batch-end', batch=batch_id, files=len(csv_files), completed=completed, failed=failed,
+                        stopped_early=stopped_early, elapsed_seconds=round(time.time() - start_time, 1))
+    
     # Summary
     elapsed_time = time.time() - start_time
     
@@ -207,7 +288,11 @@ Examples:
     logger.info(f"Total files:        {total_files}")
     logger.info(f"Completed:          {completed}")
     logger.info(f"Failed:             {failed}")
+    logger.info(f"Not run / stopped:  {total_files - completed - failed}")
     logger.info(f"Time elapsed:       {elapsed_time/60:.1f} minutes")
+    for result in sorted(results, key=lambda r: r['input']):
+        logger.info(f"  {Path(result['input']).stem:<28} {result['outcome']:<10} {result['records']:>6} records"
+                    f" | throttled {result['throttled']} | cooldowns {result['cooldowns']}")
     logger.info("="*80)
     
     if completed > 0:
@@ -26,51 +26,49 @@ The script automatically:
 """
 
 import argparse
+import copy
 import csv
 import glob
 import logging
 import json
-import pandas as pd
-import statistics
+import os
+import sqlite3
+import time
+import zlib
+from array import array
 from pathlib import Path
-from collections import Counter, defaultdict
-from typing import List, Dict, Set
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from domain_policy import DEFAULT_BLOCKED_DOMAINS, DomainPolicy, build_policy
+from round_stats import RoundStats, extract_year_from_url, parse_confidence
+from typing import Container, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Chinese email domains to filter
-CHINESE_DOMAINS = [
-    '.edu.cn', '.ac.cn', '.org.cn', '.gov.cn', '.net.cn', '.com.cn', '.cn',
-    '@163.com', '@126.com', '@qq.com', '@sina.com', '@sohu.com', 
-    '@yeah.net', '@139.com', '@aliyun.com'
-]
+# Chinese email domains to filter (post_processing.blocked_domains / allowed_domains override)
+CHINESE_POLICY = build_policy(DEFAULT_BLOCKED_DOMAINS)
 
 def is_chinese_email(email: str) -> bool:
     """Check if email is from a Chinese domain."""
-    email_lower = email.lower().strip()
-    return any(domain in email_lower for domain in CHINESE_DOMAINS)
+    return CHINESE_POLICY.is_denied(email)
 
-def parse_confidence(conf_str: str) -> float:
-    """Parse confidence string to float (e.g., '95%' -> 0.95)."""
-    try:
-        if isinstance(conf_str, str):
-            return float(conf_str.strip('%')) / 100.0
-        return float(conf_str)
-    except:
-        return 0.0
-
-def extract_year_from_url(paper_url: str) -> int:
-    """Extract year from arXiv paper URL or return 0 for non-arXiv."""
-    if '/pdf/' in paper_url:
-        arxiv_id = paper_url.split('/pdf/')[-1].replace('.pdf', '')
-        if len(arxiv_id) >= 2 and arxiv_id[:2].isdigit():
-            year_code = int(arxiv_id[:2])
-            return 2000 + year_code
-    return 0
-
-def combine_csv_files(input_pattern: str, deduplicate: bool = True) -> List[Dict]:
-    """Combine multiple CSV files matching the pattern."""
+def load_domain_policy(config: Optional[Dict]) -> DomainPolicy:
+    """Domain policy from the post_processing config (default: block Chinese domains)."""
+    post_processing = (config or {}).get('post_processing', {})
+    return build_policy(post_processing.get('blocked_domains', DEFAULT_BLOCKED_DOMAINS),
+                        post_processing.get('allowed_domains', []))
+
+def log_policy_hits(policy: DomainPolicy):
+    """Records decided by each domain rule in this run."""
+    hits = policy.rule_hits()
+    if hits:
+        logger.info(f"  Domain rule hits:")
+        for reason, count in hits.items():
+            logger.info(f"    {reason:<30} {count:>12,}")
+
+def find_csv_files(input_pattern: str) -> List[str]:
+    """Files matching the pattern (logged), or [] with an error if there are none."""
     logger.info(f"Finding files matching: {input_pattern}")
     
     csv_files = glob.glob(input_pattern, recursive=True)
@@ -81,46 +79,350 @@ def combine_csv_files(input_pattern: str, deduplicate: bool = True) -> List[Dict
     logger.info(f"Found {len(csv_files)} CSV files:")
     for f in csv_files:
         logger.info(f"  • {f}")
-    
-    all_records = []
-    email_to_record = {}  # For deduplication
-    
+    return csv_files
+
+def read_csv_rows(csv_file: str) -> Iterator[Dict]:
+    """Stream the rows of one CSV, stripping NUL bytes line by line (the file is never held in memory)."""
+    with open(csv_file, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        yield from csv.DictReader(line.replace('\x00', '') for line in f)
+
+def iter_round_rows(csv_files: List[str], counts: Counter) -> Iterator[Dict]:
+    """Stream the rows of every file in turn; a file that fails to read is logged and skipped."""
     for csv_file in csv_files:
         logger.info(f"\nReading {csv_file}...")
         
+        count = 0
         try:
-            with open(csv_file, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read().replace('\x00', '')
-                reader = csv.DictReader(content.splitlines())
-                
-                count = 0
-                for row in reader:
-                    count += 1
-                    
-                    if deduplicate:
-                        email = row.get('Email', '').strip().lower()
-                        if email:
-                            paper_url = row.get('Paper URL', '')
-                            year = extract_year_from_url(paper_url)
-                            
-                            # Keep record with most recent year
-                            if email not in email_to_record:
-                                email_to_record[email] = (year, row)
-                            else:
-                                existing_year = email_to_record[email][0]
-                                if year > existing_year:
-                                    email_to_record[email] = (year, row)
-                    else:
-                        all_records.append(row)
-                
-                logger.info(f"  Loaded {count:,} records")
-                
+            for row in read_csv_rows(csv_file):
+                count += 1
+                counts['read'] += 1
+                yield row
         except Exception as e:
             logger.error(f"  Error reading {csv_file}: {e}")
             continue
+        
+        logger.info(f"  Loaded {count:,} records")
+
+class EmailIndex:
+    """
+    Deduplication state: email -> (year, file id, byte offset) of the row to keep.
+    
+    The only stateful step of the pipeline. Rows themselves are not kept - the
+    winning row of each email is read back by offset when it is written - and the
+    three fields live in flat arrays (12 bytes per email) indexed by a slot number,
+    so a multi-million-row round needs little more than its unique email strings.
+    Slots are assigned in first-seen order, which is the output order.
+    """
+    __slots__ = ('slots', 'years', 'file_ids', 'offsets')
+    
+    def __init__(self):
+        self.slots: Dict[str, int] = {}
+        self.years = array('H')
+        self.file_ids = array('H')
+        self.offsets = array('q')
+    
+    def __len__(self) -> int:
+        return len(self.slots)
+    
+    def offer(self, email: str, year: int, file_id: int, offset: int) -> bool:
+        """Keep-most-recent-year rule (the first row wins a tie); False if the email was already indexed."""
+        slot = self.slots.get(email)
+        if slot is None:
+            self.slots[email] = len(self.years)
+            self.years.append(year)
+            self.file_ids.append(file_id)
+            self.offsets.append(offset)
+            return True
+        if year > self.years[slot]:
+            self.years[slot] = year
+            self.file_ids[slot] = file_id
+            self.offsets[slot] = offset
+        return False
+    
+    def merge(self, other: 'EmailIndex', counts: Counter):
+        """Fold in the index of a later file, counting emails both have as duplicates."""
+        for email, slot in other.slots.items():
+            if not self.offer(email, other.years[slot], other.file_ids[slot], other.offsets[slot]):
+                counts['duplicate'] += 1
+    
+    def locations(self) -> Iterator[Tuple[int, int]]:
+        """(file id, offset) of every winning row, in output order."""
+        return zip(self.file_ids, self.offsets)
+
+class TrackedLines:
+    """Lines of a CSV opened in binary mode, decoded and NUL-stripped; pos is the byte offset of the next line."""
+    
+    def __init__(self, f):
+        self.f = f
+        self.pos = f.tell()
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self) -> str:
+        line = self.f.readline()
+        if not line:
+            raise StopIteration
+        self.pos += len(line)
+        return line.decode('utf-8', errors='replace').replace('\x00', '')
+
+def scan_email_file(file_id: int, csv_file: str, policy: Optional[DomainPolicy] = None):
+    """
+    One file reduced to an EmailIndex (run in a worker process when combining in parallel).
+    
+    Applies the domain policy and the keep-most-recent-year rule within the file, and
+    returns (index, counts, policy hits, error) - rows read before an error are kept.
+    """
+    index = EmailIndex()
+    counts = Counter()
+    error = None
+    if policy is not None:
+        policy = copy.copy(policy)  # Same rules, hit counter of this file only
+        policy.hits = Counter()
+    try:
+        with open(csv_file, 'rb') as f:
+            lines = TrackedLines(f)
+            reader = csv.reader(lines)
+            header = next(reader, [])
+            columns = {name: i for i, name in reversed(list(enumerate(header)))}
+            email_col, url_col = columns.get('Email'), columns.get('Paper URL')
+            while True:
+                offset = lines.pos
+                row = next(reader, None)
+                if row is None:
+                    break
+                if not row:
+                    continue  # Blank line (DictReader skips these too)
+                counts['read'] += 1
+                raw_email = row[email_col] if email_col is not None and email_col < len(row) else ''
+                if policy is not None and policy.is_denied(raw_email):
+                    counts['chinese'] += 1
+                    continue
+                email = raw_email.strip().lower()
+                if not email:
+                    counts['no_email'] += 1
+                    continue
+                year = extract_year_from_url(row[url_col] if url_col is not None and url_col < len(row) else '')
+                if not index.offer(email, year, file_id, offset):
+                    counts['duplicate'] += 1
+    except Exception as e:
+        error = str(e)
+    return index, counts, (policy.hits if policy is not None else Counter()), error
+
+# Bump when scan_email_file changes what it indexes, so manifests from older runs are ignored
+MANIFEST_VERSION = 1
+
+class CombineManifest:
+    """
+    Per-file partial results of the last combine (round{N}/combine_manifest.sqlite).
+    
+    Each input file is recorded with its size and mtime (ns) next to its scan result -
+    the file's EmailIndex, counts and policy hits, i.e. the file already filtered and
+    deduplicated on its own. A rerun only scans files that are new or changed and merges
+    the stored partials of the others, so reprocessing a round after one category file
+    grew reads that one file. Partials are keyed by the domain policy too (the list
+    path, which filters domains later, uses 'all-domains'): changing blocked_domains /
+    allowed_domains rescans everything, and streaming and --no-streaming runs each
+    keep their own partials.
+    """
+    
+    def __init__(self, db_file: str, policy: Optional[DomainPolicy]):
+        self.db_file = Path(db_file)
+        self.key = f"v{MANIFEST_VERSION}:{policy.signature() if policy is not None else 'all-domains'}"
+        self.conn = sqlite3.connect(str(self.db_file), timeout=60)
+        columns = {row[1]: row[5] for row in self.conn.execute("PRAGMA table_info(partials)")}
+        if columns and not columns.get('key'):
+            # Older manifests were keyed by path alone; they only hold cached scans
+            self.conn.execute("DROP TABLE partials")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS partials (
+                path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                counts TEXT NOT NULL,
+                hits TEXT NOT NULL,
+                emails BLOB NOT NULL,
+                years BLOB NOT NULL,
+                offsets BLOB NOT NULL,
+                updated TEXT,
+                PRIMARY KEY (path, key)
+            )""")
+        self.conn.commit()
+    
+    def is_current(self, csv_file: str) -> bool:
+        """True if csv_file has a partial for this policy and is unchanged since."""
+        row = self.conn.execute("SELECT size, mtime_ns FROM partials WHERE path = ? AND key = ?",
+                                (csv_file, self.key)).fetchone()
+        if row is None:
+            return False
+        stat = os.stat(csv_file)
+        return row == (stat.st_size, stat.st_mtime_ns)
+    
+    def load(self, file_id: int, csv_file: str):
+        """The stored partial as scan_email_file returns it, with rows attributed to file_id."""
+        counts, hits, emails, years, offsets = self.conn.execute(
+            "SELECT counts, hits, emails, years, offsets FROM partials WHERE path = ? AND key = ?",
+            (csv_file, self.key)).fetchone()
+        index = EmailIndex()
+        emails = zlib.decompress(emails).decode('utf-8')
+        if emails:
+            # Emails cannot contain NUL (TrackedLines strips it), so it separates them
+            index.slots = {email: slot for slot, email in enumerate(emails.split('\x00'))}
+        index.years.frombytes(zlib.decompress(years))
+        index.offsets.frombytes(zlib.decompress(offsets))
+        index.file_ids = array('H', [file_id]) * len(index.years)
+        return index, Counter(json.loads(counts)), Counter(json.loads(hits)), None
+    
+    def store(self, csv_file: str, stat: os.stat_result, index: EmailIndex, counts: Counter, hits: Counter):
+        """Record a file's partial (stat taken before the scan, so a file growing meanwhile is rescanned)."""
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO partials VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                              (csv_file, stat.st_size, stat.st_mtime_ns, self.key,
+                               json.dumps(counts), json.dumps(hits),
+                               zlib.compress('\x00'.join(index.slots).encode('utf-8')),
+                               zlib.compress(index.years.tobytes()), zlib.compress(index.offsets.tobytes()),
+                               time.strftime('%Y-%m-%dT%H:%M:%S')))
+    
+    def prune(self, csv_files: List[str]):
+        """Forget files that are no longer part of the round."""
+        with self.conn:
+            stored = [row[0] for row in self.conn.execute("SELECT DISTINCT path FROM partials")]
+            current = set(csv_files)
+            self.conn.executemany("DELETE FROM partials WHERE path = ?",
+                                  ((path,) for path in stored if path not in current))
+    
+    def close(self):
+        self.conn.close()
+
+def open_manifest(manifest_file: Optional[str], policy: Optional[DomainPolicy]) -> Optional[CombineManifest]:
+    """The round's combine manifest, or None if it is turned off or cannot be opened (full rescan)."""
+    if not manifest_file:
+        return None
+    try:
+        manifest = CombineManifest(manifest_file, policy)
+        logger.info(f"\n🧾 Combine manifest: {manifest_file}")
+        return manifest
+    except sqlite3.Error as e:
+        logger.warning(f"Combine manifest disabled - could not open {manifest_file}: {e}")
+        return None
+
+def index_round_files(csv_files: List[str], policy: Optional[DomainPolicy], workers: int,
+                      counts: Counter, manifest: Optional[CombineManifest] = None) -> EmailIndex:
+    """
+    EmailIndex over all files.
+    
+    With workers > 1 the files are scanned in worker processes; either way the
+    per-file indexes are merged in file order with the keep-most-recent-year rule, so
+    the result - including its order - is the same as one pass over all rows. With a
+    manifest, unchanged files are not scanned: their stored partials are merged instead.
+    """
+    merged = EmailIndex()
+    cached = set()
+    stats = {}
+    if manifest is not None:
+        manifest.prune(csv_files)
+        for file_id, csv_file in enumerate(csv_files):
+            if manifest.is_current(csv_file):
+                cached.add(file_id)
+            else:
+                stats[file_id] = os.stat(csv_file)
+        logger.info(f"  ♻️  {len(cached)} of {len(csv_files)} files unchanged since the last run")
+    todo = [file_id for file_id in range(len(csv_files)) if file_id not in cached]
+    
+    def merge(scanned):
+        for file_id, csv_file in enumerate(csv_files):
+            if file_id in cached:
+                index, file_counts, hits, error = manifest.load(file_id, csv_file)
+                source = 'cached'
+            else:
+                index, file_counts, hits, error = next(scanned)
+                source = 'scanned'
+                if manifest is not None and not error:
+                    manifest.store(csv_file, stats[file_id], index, file_counts, hits)
+            if error:
+                logger.error(f"  Error reading {csv_file}: {error}")
+            else:
+                logger.info(f"  {csv_file}: {file_counts['read']:,} records, {len(index):,} unique emails ({source})")
+            counts.update(file_counts)
+            if policy is not None:
+                policy.hits.update(hits)
+            merged.merge(index, counts)
+    
+    todo_files = [csv_files[file_id] for file_id in todo]
+    workers = min(workers, len(todo))
+    if workers > 1:
+        logger.info(f"\n⚡ Reading {len(todo)} files with {workers} worker processes...")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            merge(iter(executor.map(scan_email_file, todo, todo_files, [policy] * len(todo))))
+    else:
+        if todo:
+            logger.info(f"\nReading {len(todo)} files...")
+        # Lazily, so only one file's index exists besides the merged one
+        merge(scan_email_file(file_id, csv_file, policy) for file_id, csv_file in zip(todo, todo_files))
+    logger.info(f"  📇 {len(merged):,} unique emails indexed")
+    return merged
+
+class RowReader:
+    """Reads single rows back from CSV files by byte offset (one open handle per file)."""
+    
+    def __init__(self, csv_files: List[str]):
+        self.csv_files = csv_files
+        self.files = {}
+        self.headers = {}
+    
+    def read(self, file_id: int, offset: int) -> Dict:
+        f = self.files.get(file_id)
+        if f is None:
+            f = self.files[file_id] = open(self.csv_files[file_id], 'rb')
+            self.headers[file_id] = next(csv.reader(TrackedLines(f)), [])
+        f.seek(offset)
+        return next(csv.DictReader(TrackedLines(f), fieldnames=self.headers[file_id]))
+    
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+def iter_deduped(csv_files: List[str], policy: Optional[DomainPolicy], workers: int,
+                 counts: Counter, manifest: Optional[CombineManifest] = None) -> Iterator[Dict]:
+    """
+    One record per email (the one with the most recent paper year), domain policy applied.
+    
+    Builds the EmailIndex, then reads each winning row back by offset as it is
+    consumed - downstream filters and writers see one row at a time.
+    """
+    index = index_round_files(csv_files, policy, workers, counts, manifest)
+    reader = RowReader(csv_files)
+    try:
+        for file_id, offset in index.locations():
+            yield reader.read(file_id, offset)
+    finally:
+        reader.close()
+
+def combine_workers(workers: Optional[int], csv_files: List[str]) -> int:
+    """Worker processes for combining (None = CPU count), at most one per file."""
+    return max(1, min(workers or os.cpu_count() or 1, len(csv_files)))
+
+def combine_csv_files(input_pattern: str, deduplicate: bool = True, workers: Optional[int] = 1,
+                      manifest_file: Optional[str] = None) -> List[Dict]:
+    """
+    Combine multiple CSV files matching the pattern (deduplication in parallel if workers > 1,
+    only new or changed files scanned if there is a manifest file).
+    """
+    csv_files = find_csv_files(input_pattern)
+    if not csv_files:
+        return []
+    
+    counts = Counter()
+    if deduplicate:
+        manifest = open_manifest(manifest_file, None)
+        all_records = list(iter_deduped(csv_files, None, combine_workers(workers, csv_files), counts, manifest))
+        if manifest is not None:
+            manifest.close()
+    else:
+        all_records = list(iter_round_rows(csv_files, counts))
     
     if deduplicate:
-        all_records = [record for year, record in email_to_record.values()]
         logger.info(f"\n✓ Combined: {len(all_records):,} unique emails after deduplication")
     else:
         logger.info(f"\n✓ Combined: {len(all_records):,} total records (no deduplication)")
@@ -145,9 +447,10 @@ def filter_by_confidence(records: List[Dict], min_confidence: float) -> List[Dic
     
     return filtered
 
-def remove_chinese_emails(records: List[Dict]) -> List[Dict]:
-    """Remove records with Chinese email domains."""
+def remove_chinese_emails(records: List[Dict], policy: Optional[DomainPolicy] = None) -> List[Dict]:
+    """Remove records with Chinese email domains (or any domain the policy denies)."""
     logger.info(f"\nRemoving Chinese emails...")
+    policy = policy or CHINESE_POLICY
     
     non_chinese = []
     chinese_count = 0
@@ -155,39 +458,30 @@ def remove_chinese_emails(records: List[Dict]) -> List[Dict]:
     for record in records:
         email = record.get('Email', '').strip()
         
-        if is_chinese_email(email):
+        if policy.is_denied(email):
             chinese_count += 1
         else:
             non_chinese.append(record)
     
     logger.info(f"  Kept: {len(non_chinese):,} non-Chinese emails")
-    logger.info(f"  Removed: {chinese_count:,} Chinese emails ({100*chinese_count/len(records):.1f}%)")
+    logger.info(f"  Removed: {chinese_count:,} Chinese emails ({100*chinese_count/max(len(records), 1):.1f}%)")
+    log_policy_hits(policy)
     
     return non_chinese
 
-def load_prior_emails(round_num: int, base_dir: Path) -> Set[str]:
+def prior_source_files(round_num: int, base_dir: Path) -> List[Tuple[int, str, Path]]:
     """
-    Load emails from ACL and all prior rounds.
-    Returns a set of email addresses (lowercase, stripped).
+    (round, label, file) for ACL (round 0) and the final file of every prior round.
+    Missing files are logged and left out.
     """
-    prior_emails = set()
+    sources = []
     
-    # Load ACL emails
     acl_file = base_dir / 'acl' / 'acl_high_confidence.csv'
     if acl_file.exists():
-        logger.info(f"\n📂 Loading ACL emails: {acl_file}")
-        try:
-            acl_df = pd.read_csv(acl_file, encoding='utf-8')
-            acl_emails = set(acl_df['Email'].str.lower().str.strip())
-            prior_emails.update(acl_emails)
-            logger.info(f"   ✓ Loaded {len(acl_df):,} ACL records")
-            logger.info(f"   ✓ Found {len(acl_emails):,} unique ACL emails")
-        except Exception as e:
-            logger.warning(f"   ⚠️  Error loading ACL file: {e}")
+        sources.append((0, 'ACL', acl_file))
     else:
         logger.warning(f"   ⚠️  ACL file not found: {acl_file}")
     
-    # Load emails from all prior rounds
     for prev_round in range(1, round_num):
         prev_round_dir = base_dir / 'arxiv' / f'round{prev_round}'
         
@@ -200,114 +494,228 @@ def load_prior_emails(round_num: int, base_dir: Path) -> Set[str]:
             prev_round_dir / 'arxiv_high_confidence_non_chinese.csv',  # Intermediate
         ]
         
-        final_file = None
-        for possible_file in possible_files:
-            if possible_file.exists():
-                final_file = possible_file
-                break
-        
+        final_file = next((f for f in possible_files if f.exists()), None)
         if final_file:
-            logger.info(f"\n📂 Loading Round {prev_round} emails: {final_file}")
-            try:
-                prev_df = pd.read_csv(final_file, encoding='utf-8')
-                prev_emails = set(prev_df['Email'].str.lower().str.strip())
-                prior_emails.update(prev_emails)
-                logger.info(f"   ✓ Loaded {len(prev_df):,} Round {prev_round} records")
-                logger.info(f"   ✓ Found {len(prev_emails):,} unique Round {prev_round} emails")
-            except Exception as e:
-                logger.warning(f"   ⚠️  Error loading Round {prev_round} file: {e}")
+            sources.append((prev_round, f'Round {prev_round}', final_file))
         else:
             logger.warning(f"   ⚠️  Round {prev_round} final file not found in {prev_round_dir}")
     
+    return sources
+
+def load_prior_emails(round_num: int, base_dir: Path) -> Set[str]:
+    """
+    Load emails from ACL and all prior rounds.
+    Returns a set of email addresses (lowercase, stripped).
+    
+    Re-reads every historical CSV; with a suppression index (see SuppressionIndex)
+    only files that are new or changed since the last run are read.
+    """
+    import pandas as pd
+    
+    prior_emails = set()
+    
+    for _, label, source_file in prior_source_files(round_num, base_dir):
+        logger.info(f"\n📂 Loading {label} emails: {source_file}")
+        try:
+            df = pd.read_csv(source_file, encoding='utf-8')
+            emails = set(df['Email'].str.lower().str.strip())
+            prior_emails.update(emails)
+            logger.info(f"   ✓ Loaded {len(df):,} {label} records")
+            logger.info(f"   ✓ Found {len(emails):,} unique {label} emails")
+        except Exception as e:
+            logger.warning(f"   ⚠️  Error loading {label} file: {e}")
+    
     return prior_emails
 
-def remove_prior_round_emails(records: List[Dict], prior_emails: Set[str]) -> List[Dict]:
-    """Remove records with emails that exist in prior rounds."""
-    logger.info(f"\n🔍 Removing emails from prior rounds...")
+class SuppressionIndex:
+    """
+    Persistent set of already-used emails (ACL = round 0, then every round's final output).
+    
+    An SQLite table keyed by (email, round), so "was this email used before round N"
+    is one primary-key lookup and no historical CSV has to be loaded. Each source file
+    is recorded with its size and mtime: sync() only reads files that are new or changed,
+    and add_round() appends a round's final output when the round completes. Emails of
+    a source stay suppressed even if its CSV is later moved away.
+    """
+    
+    def __init__(self, db_file: str):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_file), timeout=60)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS suppressed (
+                email TEXT NOT NULL,
+                round INTEGER NOT NULL,
+                PRIMARY KEY (email, round)
+            ) WITHOUT ROWID""")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS sources (
+                round INTEGER PRIMARY KEY,
+                path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                emails INTEGER NOT NULL,
+                updated TEXT
+            )""")
+        self.conn.commit()
+    
+    def add_round(self, round_num: int, csv_file: Path) -> int:
+        """Replace a round's emails with those in csv_file; returns the number of unique emails."""
+        stat = csv_file.stat()
+        emails = set()
+        for row in read_csv_rows(str(csv_file)):
+            email = (row.get('Email') or '').strip().lower()
+            if email:
+                emails.add(email)
+        
+        with self.conn:
+            self.conn.execute("DELETE FROM suppressed WHERE round = ?", (round_num,))
+            self.conn.executemany("INSERT INTO suppressed VALUES (?, ?)", ((e, round_num) for e in emails))
+            self.conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?)",
+                              (round_num, str(csv_file), stat.st_size, stat.st_mtime, len(emails),
+                               time.strftime('%Y-%m-%dT%H:%M:%S')))
+        return len(emails)
     
-    prior_emails_lower = {email.lower().strip() for email in prior_emails}
+    def is_current(self, round_num: int, csv_file: Path) -> bool:
+        """True if csv_file is already indexed for this round and unchanged since."""
+        row = self.conn.execute("SELECT path, size, mtime FROM sources WHERE round = ?", (round_num,)).fetchone()
+        if row is None:
+            return False
+        stat = csv_file.stat()
+        return row == (str(csv_file), stat.st_size, stat.st_mtime)
+    
+    def sync(self, round_num: int, base_dir: Path):
+        """Index ACL and prior-round files that are new or changed (unchanged ones are not read)."""
+        for source_round, label, source_file in prior_source_files(round_num, base_dir):
+            if self.is_current(source_round, source_file):
+                logger.info(f"   ✓ {label}: up to date in index ({source_file})")
+                continue
+            logger.info(f"\n📂 Indexing {label} emails: {source_file}")
+            try:
+                count = self.add_round(source_round, source_file)
+                logger.info(f"   ✓ Indexed {count:,} unique {label} emails")
+            except Exception as e:
+                logger.warning(f"   ⚠️  Error indexing {label} file: {e}")
+    
+    def before(self, round_num: int) -> 'PriorEmails':
+        """Emails used by ACL or any round before round_num."""
+        return PriorEmails(self.conn, round_num)
+    
+    def close(self):
+        self.conn.close()
+
+class PriorEmails:
+    """Read-only set view of a SuppressionIndex: `email in prior` is one indexed lookup."""
+    
+    def __init__(self, conn: sqlite3.Connection, round_num: int):
+        self.conn = conn
+        self.round_num = round_num
+    
+    def __contains__(self, email: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM suppressed WHERE email = ? AND round < ? LIMIT 1",
+                                 (email, self.round_num)).fetchone() is not None
+    
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(DISTINCT email) FROM suppressed WHERE round < ?",
+                                 (self.round_num,)).fetchone()[0]
+
+def open_prior_emails(round_num: int, base_dir: Path, index_file: Optional[str]):
+    """
+    (prior_emails, index): emails to exclude for this round and the suppression index
+    they come from. Without an index file (or if it cannot be opened), the historical
+    CSVs are loaded into a set and index is None.
+    """
+    if index_file:
+        try:
+            index = SuppressionIndex(index_file)
+            logger.info(f"\n🗂  Suppression index: {index_file}")
+            try:
+                index.sync(round_num, base_dir)
+            except sqlite3.Error:
+                index.close()
+                raise
+            return index.before(round_num), index
+        except sqlite3.Error as e:
+            logger.warning(f"Suppression index disabled - could not open {index_file}: {e}")
+    return load_prior_emails(round_num, base_dir), None
+
+def record_round(index: Optional[SuppressionIndex], round_num: int, final_csv: Path):
+    """Append the completed round's final output to the suppression index."""
+    if index is None or not final_csv.exists():
+        return
+    count = index.add_round(round_num, final_csv)
+    logger.info(f"🗂  Suppression index: recorded {count:,} Round {round_num} emails")
+
+def remove_prior_round_emails(records: List[Dict], prior_emails: Container[str]) -> List[Dict]:
+    """Remove records with emails that exist in prior rounds (prior_emails lowercase and stripped)."""
+    logger.info(f"\n🔍 Removing emails from prior rounds...")
     
     filtered = []
     removed = 0
     
     for record in records:
         email = record.get('Email', '').strip().lower()
-        if email not in prior_emails_lower:
+        if email not in prior_emails:
             filtered.append(record)
         else:
             removed += 1
     
     logger.info(f"  Kept: {len(filtered):,} new emails")
-    logger.info(f"  Removed: {removed:,} duplicate emails from prior rounds ({100*removed/len(records):.1f}%)")
+    logger.info(f"  Removed: {removed:,} duplicate emails from prior rounds ({100*removed/max(len(records), 1):.1f}%)")
     
     return filtered
 
-def generate_statistics(records: List[Dict]) -> Dict:
-    """Generate comprehensive statistics."""
+def iter_above_confidence(records: Iterable[Dict], min_confidence: float, counts: Counter) -> Iterator[Dict]:
+    """Streaming filter_by_confidence."""
+    for record in records:
+        if parse_confidence(record.get('Confidence', '0%')) >= min_confidence:
+            yield record
+        else:
+            counts['low_confidence'] += 1
+
+def iter_non_chinese(records: Iterable[Dict], policy: DomainPolicy, counts: Counter) -> Iterator[Dict]:
+    """Streaming remove_chinese_emails."""
+    for record in records:
+        if policy.is_denied(record.get('Email', '')):
+            counts['chinese'] += 1
+        else:
+            yield record
+
+def iter_new_emails(records: Iterable[Dict], prior_emails: Container[str], counts: Counter) -> Iterator[Dict]:
+    """Streaming remove_prior_round_emails (prior_emails must already be lowercase and stripped)."""
+    for record in records:
+        if record.get('Email', '').strip().lower() in prior_emails:
+            counts['prior_round'] += 1
+        else:
+            yield record
+
+def generate_statistics(records: Iterable[Dict]) -> Dict:
+    """Generate comprehensive statistics (records may be a list or a stream; memory stays flat)."""
     logger.info(f"\nGenerating statistics...")
+    return RoundStats().add_all(records).summary()
+
+def clear_csv(output_file: str):
+    """
+    Cut a previous run's output down to its header line.
     
-    if not records:
-        return {}
-    
-    unique_emails = set()
-    unique_papers = set()
-    unique_authors = set()
-    confidence_scores = []
-    email_domains = Counter()
-    year_stats = defaultdict(int)
-    
-    for record in records:
-        email = record.get('Email', '').strip().lower()
-        paper_url = record.get('Paper URL', '').strip()
-        author = record.get('Author', '').strip()
-        conf_str = record.get('Confidence', '0%')
-        
-        conf = parse_confidence(conf_str)
-        confidence_scores.append(conf)
-        
-        if email:
-            unique_emails.add(email)
-            if '@' in email:
-                domain = email.split('@')[1]
-                email_domains[domain] += 1
-        
-        if paper_url:
-            unique_papers.add(paper_url)
-            year = extract_year_from_url(paper_url)
-            if year > 0:
-                year_stats[year] += 1
-        
-        if author:
-            unique_authors.add(author)
-    
-    conf_sorted = sorted(confidence_scores)
-    percentiles = {
-        'min': min(confidence_scores) if confidence_scores else 0,
-        'p25': conf_sorted[len(conf_sorted)//4] if conf_sorted else 0,
-        'p50': conf_sorted[len(conf_sorted)//2] if conf_sorted else 0,
-        'p75': conf_sorted[3*len(conf_sorted)//4] if conf_sorted else 0,
-        'p90': conf_sorted[9*len(conf_sorted)//10] if conf_sorted else 0,
-        'p95': conf_sorted[95*len(conf_sorted)//100] if conf_sorted else 0,
-        'max': max(confidence_scores) if confidence_scores else 0,
-        'mean': statistics.mean(confidence_scores) if confidence_scores else 0,
-    }
-    
-    stats = {
-        'total_records': len(records),
-        'unique_emails': len(unique_emails),
-        'unique_papers': len(unique_papers),
-        'unique_authors': len(unique_authors),
-        'confidence_percentiles': percentiles,
-        'top_domains': email_domains.most_common(20),
-        'year_distribution': dict(year_stats),
-    }
-    
-    return stats
+    Called when no records pass the filters, so the old rows are not mistaken for this
+    run's (record_round would otherwise index them as the round's final emails).
+    """
+    path = Path(output_file)
+    if not path.exists():
+        return
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), None)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        if header:
+            csv.writer(f).writerow(header)
+    logger.warning(f"  Cleared the previous run's records from {output_file}")
 
 def save_csv(records: List[Dict], output_file: str):
     """Save records to CSV file."""
     if not records:
         logger.warning("No records to save")
+        clear_csv(output_file)
         return
     
     Path(output_file).parent.mkdir(parents=True, exist_ok=True)
@@ -322,6 +730,30 @@ def save_csv(records: List[Dict], output_file: str):
     
     logger.info(f"✓ Saved {len(records):,} records to {output_file}")
 
+def save_csv_stream(records: Iterable[Dict], output_file: str) -> Iterator[Dict]:
+    """Streaming save_csv: write each record as it passes through and yield it on."""
+    f = None
+    count = 0
+    try:
+        for record in records:
+            if f is None:
+                Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+                f = open(output_file, 'w', newline='', encoding='utf-8')
+                writer = csv.DictWriter(f, fieldnames=list(record.keys()))
+                writer.writeheader()
+            writer.writerow(record)
+            count += 1
+            yield record
+    finally:
+        if f is not None:
+            f.close()
+    
+    if f is None:
+        logger.warning("No records to save")
+        clear_csv(output_file)
+    else:
+        logger.info(f"✓ Saved {count:,} records to {output_file}")
+
 def save_summary(stats: Dict, output_file: str, round_num: int):
     """Save statistics summary to text file."""
     with open(output_file, 'w') as f:
@@ -331,10 +763,15 @@ def save_summary(stats: Dict, output_file: str, round_num: int):
         
         f.write("## OVERALL STATISTICS\n")
         f.write("-"*80 + "\n")
+        if not stats:
+            f.write("No records passed the filters (final CSV holds only its header)\n")
+            return
         f.write(f"Total Records:           {stats['total_records']:>15,}\n")
         f.write(f"Unique Emails:           {stats['unique_emails']:>15,}\n")
         f.write(f"Unique Papers:           {stats['unique_papers']:>15,}\n")
         f.write(f"Unique Authors:          {stats['unique_authors']:>15,}\n")
+        if not stats.get('distinct_counts_exact', True):
+            f.write("(unique counts estimated with HyperLogLog, about 1% error)\n")
         f.write("\n")
         
         perc = stats['confidence_percentiles']
@@ -365,6 +802,88 @@ def save_summary(stats: Dict, output_file: str, round_num: int):
     
     logger.info(f"✓ Summary saved to {output_file}")
 
+def process_round_streaming(round_num: int, round_dir: Path, base_dir: Path, min_confidence: float,
+                            policy: Optional[DomainPolicy], deduplicate: bool, index_file: Optional[str] = None,
+                            workers: Optional[int] = 1, manifest_file: Optional[str] = None):
+    """
+    Same steps and outputs as the list-based path in main(), in a single pass.
+    
+    Rows flow from a NUL-stripping reader through a chain of generators; deduplication
+    is the only step that holds state, so peak memory is bounded by the unique-email
+    index (see EmailIndex) rather than by copies of every file and every intermediate
+    list. The domain filter (policy, None to keep every domain) only looks at the
+    email, so it runs before dedup and shrinks the index. With a manifest file only
+    new or changed files are scanned (see CombineManifest).
+    """
+    csv_files = find_csv_files(str(round_dir / '*_email.csv'))
+    if not csv_files:
+        logger.error("No records found!")
+        return
+    
+    # Prior emails are needed before the pass starts (ACL + all previous rounds)
+    prior_emails, index = open_prior_emails(round_num, base_dir, index_file)
+    manifest = None
+    try:
+        logger.info(f"\n📊 Total prior emails to exclude: {len(prior_emails):,}")
+        
+        intermediate_file = round_dir / 'arxiv_high_confidence_non_chinese.csv'
+        final_csv = round_dir / 'arxiv_high_confidence_non_chinese_no_acl_no_prior_rounds.csv'
+        summary_txt = round_dir / f'ROUND{round_num}_EMAIL_SUMMARY.txt'
+        
+        counts = Counter()
+        if deduplicate:
+            # Files are indexed (in worker processes if workers > 1, unchanged ones from the
+            # manifest); winning rows are read back by offset
+            manifest = open_manifest(manifest_file, policy)
+            records = iter_deduped(csv_files, policy, combine_workers(workers, csv_files), counts, manifest)
+        else:
+            records = iter_round_rows(csv_files, counts)
+            if policy is not None:
+                records = iter_non_chinese(records, policy, counts)
+        records = iter_above_confidence(records, min_confidence, counts)
+        records = save_csv_stream(records, str(intermediate_file))
+        records = iter_new_emails(records, prior_emails, counts)
+        records = save_csv_stream(records, str(final_csv))
+        
+        logger.info(f"\n🌊 Streaming {len(csv_files)} files through the pipeline...")
+        stats = generate_statistics(records)
+        
+        if not counts['read']:
+            logger.error("No records found!")
+            return
+        
+        record_round(index, round_num, final_csv)
+    finally:
+        # Every return path (and an error mid-stream) releases the SQLite connections
+        if manifest is not None:
+            manifest.close()
+        if index is not None:
+            index.close()
+    
+    logger.info(f"\n📊 Pipeline summary:")
+    logger.info(f"  Read:                       {counts['read']:>12,}")
+    if policy is not None:
+        logger.info(f"  Removed Chinese emails:     {counts['chinese']:>12,}")
+        log_policy_hits(policy)
+    if deduplicate:
+        logger.info(f"  Removed duplicates:         {counts['duplicate']:>12,}")
+        logger.info(f"  Removed without email:      {counts['no_email']:>12,}")
+    logger.info(f"  Removed below confidence:   {counts['low_confidence']:>12,}")
+    logger.info(f"  Removed from prior rounds:  {counts['prior_round']:>12,}")
+    
+    save_summary(stats, str(summary_txt), round_num)
+    
+    # Final summary
+    logger.info("\n" + "="*80)
+    logger.info("PROCESSING COMPLETE!")
+    logger.info("="*80)
+    logger.info(f"Final records: {stats.get('total_records', 0):,}")
+    logger.info(f"Unique emails: {stats.get('unique_emails', 0):,}")
+    logger.info(f"Final CSV: {final_csv}")
+    logger.info(f"Summary: {summary_txt}")
+    logger.info("="*80)
+    logger.info(f"\n✅ Use this file for email campaigns: {final_csv}")
+
 def main():
     parser = argparse.ArgumentParser(
         description='Universal arXiv Round Processing Script',
@@ -392,6 +911,14 @@ Examples:
                        help='Do not remove Chinese email domains (default: remove)')
     parser.add_argument('--no-deduplicate', action='store_true',
                        help='Disable email deduplication (default: deduplicate)')
+    parser.add_argument('--no-streaming', action='store_true',
+                       help='Load all records into lists between steps instead of streaming them (default: stream)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Processes reading the round files in parallel (default: config, else CPU count; 1 = sequential)')
+    parser.add_argument('--no-suppression-index', action='store_true',
+                       help='Load ACL and prior-round CSVs instead of using the suppression index (default: use index)')
+    parser.add_argument('--no-incremental', action='store_true',
+                       help='Rescan every round file instead of only new or changed ones (default: incremental)')
     
     args = parser.parse_args()
     
@@ -434,6 +961,7 @@ Examples:
         remove_chinese = config['post_processing'].get('remove_chinese', True)
     else:
         remove_chinese = True
+    policy = load_domain_policy(config) if remove_chinese else None
     
     if args.no_deduplicate:
         deduplicate = False
@@ -441,16 +969,49 @@ Examples:
         deduplicate = config['post_processing'].get('deduplicate', True)
     else:
         deduplicate = True
+    
+    if args.no_streaming:
+        streaming = False
+    elif config and 'post_processing' in config:
+        streaming = config['post_processing'].get('streaming', True)
+    else:
+        streaming = True
+    
+    if args.workers is not None:
+        workers = args.workers
+    elif config and 'post_processing' in config:
+        workers = config['post_processing'].get('combine_workers', None)
+    else:
+        workers = None
+    
     base_dir = Path(args.data_dir)
+    if args.no_suppression_index:
+        index_file = None
+    elif config and 'post_processing' in config:
+        index_file = config['post_processing'].get('suppression_index_file', str(base_dir / 'suppression_index.sqlite'))
+    else:
+        index_file = str(base_dir / 'suppression_index.sqlite')
     round_dir = base_dir / 'arxiv' / f'round{round_num}'
     
+    if args.no_incremental:
+        incremental = False
+    elif config and 'post_processing' in config:
+        incremental = config['post_processing'].get('incremental', True)
+    else:
+        incremental = True
+    manifest_file = str(round_dir / 'combine_manifest.sqlite') if incremental and deduplicate else None
+    
     logger.info("="*80)
     logger.info(f"ARXIV ROUND {round_num} PROCESSING")
     logger.info("="*80)
     logger.info(f"Round directory: {round_dir}")
     logger.info(f"Min confidence: {min_confidence:.0%}")
-    logger.info(f"Remove Chinese: {remove_chinese}")
+    logger.info(f"Remove Chinese: {remove_chinese}" + (f" ({policy.rules} domain rules)" if policy else ""))
     logger.info(f"Deduplicate: {deduplicate}")
+    logger.info(f"Streaming: {streaming}")
+    logger.info(f"Workers: {workers or 'CPU count'}")
+    logger.info(f"Suppression index: {index_file or 'off'}")
+    logger.info(f"Incremental: {bool(manifest_file)}")
     if config:
         logger.info(f"Config file: arxiv_collection_config.json")
     logger.info("="*80)
@@ -460,9 +1021,14 @@ Examples:
         logger.error(f"Round directory does not exist: {round_dir}")
         return
     
+    if streaming:
+        process_round_streaming(round_num, round_dir, base_dir, min_confidence, policy, deduplicate,
+                                index_file, workers, manifest_file)
+        return
+    
     # Step 1: Combine and post-process email CSV files
     input_pattern = str(round_dir / '*_email.csv')
-    records = combine_csv_files(input_pattern, deduplicate=deduplicate)
+    records = combine_csv_files(input_pattern, deduplicate=deduplicate, workers=workers, manifest_file=manifest_file)
     
     if not records:
         logger.error("No records found!")
@@ -475,7 +1041,7 @@ Examples:
     
     # Step 3: Remove Chinese emails (if requested)
     if remove_chinese:
-        records = remove_chinese_emails(records)
+        records = remove_chinese_emails(records, policy)
     
     # Save intermediate file (before excluding prior rounds)
     intermediate_file = round_dir / 'arxiv_high_confidence_non_chinese.csv'
@@ -483,28 +1049,34 @@ Examples:
     logger.info(f"\n💾 Intermediate file saved: {intermediate_file}")
     
     # Step 4: Load emails from prior rounds (ACL + all previous rounds)
-    prior_emails = load_prior_emails(round_num, base_dir)
-    logger.info(f"\n📊 Total prior emails to exclude: {len(prior_emails):,}")
-    
-    # Step 5: Remove prior round emails
-    records = remove_prior_round_emails(records, prior_emails)
-    
-    # Step 6: Generate statistics
-    stats = generate_statistics(records)
-    
-    # Step 7: Save final outputs
-    final_csv = round_dir / 'arxiv_high_confidence_non_chinese_no_acl_no_prior_rounds.csv'
-    summary_txt = round_dir / f'ROUND{round_num}_EMAIL_SUMMARY.txt'
-    
-    save_csv(records, str(final_csv))
-    save_summary(stats, str(summary_txt), round_num)
+    prior_emails, index = open_prior_emails(round_num, base_dir, index_file)
+    try:
+        logger.info(f"\n📊 Total prior emails to exclude: {len(prior_emails):,}")
+        
+        # Step 5: Remove prior round emails
+        records = remove_prior_round_emails(records, prior_emails)
+        
+        # Step 6: Generate statistics
+        stats = generate_statistics(records)
+        
+        # Step 7: Save final outputs
+        final_csv = round_dir / 'arxiv_high_confidence_non_chinese_no_acl_no_prior_rounds.csv'
+        summary_txt = round_dir / f'ROUND{round_num}_EMAIL_SUMMARY.txt'
+        
+        save_csv(records, str(final_csv))
+        save_summary(stats, str(summary_txt), round_num)
+        
+        record_round(index, round_num, final_csv)
+    finally:
+        if index is not None:
+            index.close()
     
     # Final summary
     logger.info("\n" + "="*80)
     logger.info("PROCESSING COMPLETE!")
     logger.info("="*80)
     logger.info(f"Final records: {len(records):,}")
-    logger.info(f"Unique emails: {stats['unique_emails']:,}")
+    logger.info(f"Unique emails: {stats.get('unique_emails', 0):,}")
     logger.info(f"Final CSV: {final_csv}")
     logger.info(f"Summary: {summary_txt}")
     logger.info("="*80)
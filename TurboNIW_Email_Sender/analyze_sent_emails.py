@@ -16,7 +16,7 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
 import base64
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 # Gmail API imports
 try:
@@ -32,6 +32,10 @@ except ImportError:
     print("Install with: pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client")
     sys.exit(1)
 
+# domain_policy.py lives in the repository root (shared with the senders and the arXiv pipeline)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from domain_policy import build_policy
+
 # Gmail API scopes
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
 
@@ -51,6 +55,23 @@ def load_history(history_file='sent_history.json'):
         return json.load(f)
 
 
+def load_blacklist_policy(config):
+    """Domain policy for the config's blacklist (same rules the senders apply)."""
+    blacklist = config.get('blacklist', {})
+    return build_policy(blacklist.get('domains', []), blocked_addresses=blacklist.get('emails', []))
+
+
+def policy_hits_by_category(policy, categories):
+    """{rule: Counter(category -> recipients)} for recipients the policy now denies."""
+    hits = defaultdict(Counter)
+    for label, recipients in categories.items():
+        for recipient in recipients:
+            allowed, reason = policy.check(recipient['email'])
+            if not allowed:
+                hits[reason][label] += 1
+    return hits
+
+
 def authenticate_account(account_id, config, config_file_path='config.json'):
     """Authenticate and get Gmail API service for an account."""
     print(f"\n{'='*80}")
@@ -381,8 +402,9 @@ def search_inbox_for_bounces(service, recipient_email, sent_date, days_back=90):
     return all_bounces
 
 
-def analyze_sent_emails(account_id, account_email, history, service, output_file, limit=None, json_output_dir=None):
-    """Analyze all sent emails and categorize recipients."""
+def analyze_sent_emails(account_id, account_email, history, service, output_file, limit=None, json_output_dir=None,
+                        policy=None):
+    """Analyze all sent emails and categorize recipients (and report blacklist policy hits if a policy is given)."""
     print(f"\n{'='*80}")
     print(f"📊 ANALYZING SENT EMAILS")
     print(f"   Account: {account_email}")
@@ -721,6 +743,15 @@ def analyze_sent_emails(account_id, account_email, history, service, output_file
     print(f"Total Analyzed: {total}")
     if limit:
         print(f"Total Available: {original_count} (limited to {limit} for testing)")
+    policy_hits = {}
+    if policy is not None:
+        policy_hits = policy_hits_by_category(policy, {
+            'replied': category_1_replied, 'no_reply': category_2_no_reply, 'failed': category_3_failed})
+        if policy_hits:
+            print(f"\nBlacklisted by current policy (sent before the rule was added):")
+            for reason, by_category in policy_hits.items():
+                counts = ', '.join(f"{label} {count}" for label, count in by_category.items())
+                print(f"   {reason}: {sum(by_category.values())} ({counts})")
     print(f"\n📄 Detailed report saved to: {output_file}")
     print(f"{'='*80}\n")
     sys.stdout.flush()
@@ -730,7 +761,8 @@ def analyze_sent_emails(account_id, account_email, history, service, output_file
         'category_2_no_reply': category_2_no_reply,
         'category_3_failed': category_3_failed,
         'total_analyzed': total,
-        'total_available': original_count if limit else total
+        'total_available': original_count if limit else total,
+        'policy_hits': {reason: dict(by_category) for reason, by_category in policy_hits.items()}
     }
 
 
@@ -791,6 +823,7 @@ def main():
     sys.stdout.flush()
     config = load_config(args.config)
     history = load_history(args.history)
+    policy = load_blacklist_policy(config)
     
     if args.all_accounts:
         # Analyze all Gmail API accounts
@@ -851,7 +884,8 @@ def main():
                     service,
                     account_output,
                     limit=args.limit,
-                    json_output_dir=None  # Don't save individual account JSONs
+                    json_output_dir=None,  # Don't save individual account JSONs
+                    policy=policy
                 )
                 
                 # Accumulate results
@@ -1075,7 +1109,8 @@ def main():
             service,
             args.output,
             limit=args.limit,
-            json_output_dir=args.json_dir
+            json_output_dir=args.json_dir,
+            policy=policy
         )
         
         print("✅ Analysis complete!")
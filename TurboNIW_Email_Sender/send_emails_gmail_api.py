@@ -35,11 +35,110 @@ except ImportError:
 
 from email_templates_variants import format_email
 
+# domain_policy.py lives in the repository root (shared with the arXiv pipeline)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from domain_policy import build_policy
+
 # Gmail API scopes
 # gmail.readonly: Read emails to check for bounce/rate limit messages
 # gmail.send: Send emails
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly', 'https://www.googleapis.com/auth/gmail.send']
 
+# Cached tokens are refreshed in the background this long before they expire
+TOKEN_REFRESH_MARGIN = 300  # seconds
+TOKEN_REFRESH_INTERVAL = 60  # seconds between background expiry checks
+
+
+def token_expires_within(creds, seconds):
+    """True if the credentials expire within seconds (False if they have no expiry)."""
+    if creds is None or not getattr(creds, 'expiry', None):
+        return False
+    if creds.expired:  # google-auth already counts the last few minutes as expired
+        return True
+    return creds.expiry - datetime.utcnow() <= timedelta(seconds=seconds)  # expiry is naive UTC
+
+
+class SharedTokens:
+    """
+    Gmail credentials shared by every GmailAPISender in the process, one per token file.
+    
+    The web app creates a new sender for every send run, so credentials, locks and the
+    background refresher live here rather than on the sender: one lock per token file
+    means two senders never refresh or rewrite the same .secrets/{id}_token.json at
+    once, and there is a single refresher thread. Tokens are only refreshed in the
+    background while a sender uses them (acquire / release); the thread exits when
+    no sender does and is started again on the next acquire.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.credentials = {}  # token file -> Credentials (refreshed in place)
+        self.token_locks = {}  # token file -> Lock: one thread loads / refreshes it at a time
+        self.users = {}  # token file -> number of senders using it
+        self.refresher = None
+    
+    def token_lock(self, token_file):
+        with self.lock:
+            if token_file not in self.token_locks:
+                self.token_locks[token_file] = threading.Lock()
+            return self.token_locks[token_file]
+    
+    def acquire(self, token_file):
+        with self.lock:
+            self.users[token_file] = self.users.get(token_file, 0) + 1
+            if self.refresher is None:
+                self.refresher = threading.Thread(target=self.refresh_loop, name='gmail-token-refresher', daemon=True)
+                self.refresher.start()
+    
+    def release(self, token_file):
+        with self.lock:
+            self.users[token_file] = self.users.get(token_file, 0) - 1
+            if self.users[token_file] <= 0:
+                del self.users[token_file]
+    
+    def refresh(self, token_file, label):
+        """
+        Refresh a token in place and save it (call with its token_lock held). Returns the
+        credentials, or None if the refresh failed and they are no longer usable.
+        """
+        creds = self.credentials.get(token_file)
+        if creds is None:
+            return None
+        try:
+            creds.refresh(Request())
+            token_path = Path(token_file)
+            token_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(token_path, 'w') as token:
+                token.write(creds.to_json())
+            print(f"  ⟳ [{label}] Token refreshed (expires {creds.expiry})")
+        except Exception as e:
+            print(f"  ⚠️  [{label}] Token refresh failed: {e}")
+            if not creds.valid:
+                # Forget them: the next authenticate_account starts over from the token file
+                del self.credentials[token_file]
+                creds = None
+        sys.stdout.flush()
+        return creds
+    
+    def refresh_loop(self):
+        while True:
+            time.sleep(TOKEN_REFRESH_INTERVAL)
+            with self.lock:
+                if not self.users:
+                    self.refresher = None
+                    return
+                token_files = list(self.users)
+            for token_file in token_files:
+                creds = self.credentials.get(token_file)
+                if not token_expires_within(creds, TOKEN_REFRESH_MARGIN):
+                    continue
+                with self.token_lock(token_file):
+                    if self.credentials.get(token_file) is creds and token_expires_within(creds, TOKEN_REFRESH_MARGIN):
+                        self.refresh(token_file, Path(token_file).stem)
+
+
+SHARED_TOKENS = SharedTokens()
+
 
 class GmailAPISender:
     def __init__(self, config_file='config.json'):
@@ -56,6 +155,8 @@ class GmailAPISender:
         self.history = self.load_history()
         self.today = str(date.today())
         self.services = {}  # Cache for authenticated services
+        self.credentials = {}  # Shared credentials each cached service was built with
+        self.token_files = {}  # Token files this sender holds in SHARED_TOKENS (released by close())
         self.failed_accounts = set()  # Track accounts that fail authentication
         self.stop_check = None  # Function to check if should stop
         self.progress_callback = None  # Callback for real-time progress updates
@@ -65,6 +166,7 @@ class GmailAPISender:
         self.last_bounce_check = {}  # Track last bounce check time per account
         self.emails_sent_since_check = {}  # Track emails sent since last bounce check per account
         self.emails_sent_since_check = {}  # Track emails sent since last bounce check per account
+        self.blacklist_policy = self.load_blacklist_policy()  # Blacklisted addresses and domains
     
     def load_config(self, config_file):
         """Load configuration."""
@@ -169,7 +271,53 @@ class GmailAPISender:
         return False, None
     
     def authenticate_account(self, account):
-        """Authenticate and get Gmail API service for an account."""
+        """
+        Get the Gmail API service for an account (authenticated on first use, then cached).
+        
+        The cached path takes no lock and does no file I/O, so it can be called before
+        every send. Credentials are shared with other senders in the process (see
+        SharedTokens) and refreshed in the background shortly before they expire; if
+        one is expired anyway (e.g. the machine slept), the calling thread refreshes it,
+        and authenticates from scratch if that fails. Only one thread loads or refreshes
+        a token at a time - the others wait and reuse its result.
+        """
+        account_id = account['id']
+        service = self.services.get(account_id)
+        if service is not None and not token_expires_within(self.credentials.get(account_id), 0):
+            return service
+        
+        token_file = self.token_file_for(account_id)
+        with SHARED_TOKENS.token_lock(token_file):
+            creds = SHARED_TOKENS.credentials.get(token_file)
+            if token_expires_within(creds, 0):  # Not refreshed by another thread meanwhile
+                creds = SHARED_TOKENS.refresh(token_file, account_id)
+            if creds is None:  # First use in this process, or the refresh failed
+                creds = self.load_credentials(account)
+                SHARED_TOKENS.credentials[token_file] = creds
+            if self.credentials.get(account_id) is not creds:
+                self.services[account_id] = build('gmail', 'v1', credentials=creds)
+                self.credentials[account_id] = creds
+                print(f"   ✓ [{account_id} ({account.get('email', 'Unknown')})] Gmail API service ready")
+                sys.stdout.flush()
+            if account_id not in self.token_files:
+                self.token_files[account_id] = token_file
+                SHARED_TOKENS.acquire(token_file)
+        return self.services[account_id]
+    
+    def close(self):
+        """Drop this sender's services; tokens no other sender uses stop being refreshed."""
+        for token_file in self.token_files.values():
+            SHARED_TOKENS.release(token_file)
+        self.token_files.clear()
+        self.services.clear()
+        self.credentials.clear()
+    
+    def token_file_for(self, account_id):
+        config_dir = Path(self.config_file).parent if hasattr(self, 'config_file') else Path.cwd()
+        return str(config_dir / '.secrets' / f"{account_id}_token.json")
+    
+    def load_credentials(self, account):
+        """Load the account's token (checking scopes), refresh it or run the OAuth flow; returns credentials."""
         account_id = account['id']
         account_email = account.get('email', 'Unknown')
         
@@ -181,12 +329,6 @@ class GmailAPISender:
         import sys
         sys.stdout.flush()  # Force flush to ensure logs appear immediately
         
-        # Return cached service if available
-        if account_id in self.services:
-            print(f"   ✓ Using cached service for {account_id} ({account_email})")
-            sys.stdout.flush()
-            return self.services[account_id]
-        
         credentials_file = account.get('credentials_file')
         if not credentials_file:
             raise Exception(f"No credentials file for account {account_id}")
@@ -198,8 +340,7 @@ class GmailAPISender:
             credentials_file = str(config_dir / credentials_file)
         
         # Resolve token file path similarly
-        config_dir = Path(self.config_file).parent if hasattr(self, 'config_file') else Path.cwd()
-        token_file = str(config_dir / '.secrets' / f"{account_id}_token.json")
+        token_file = self.token_file_for(account_id)
         
         creds = None
         needs_reauth = False
@@ -392,14 +533,7 @@ class GmailAPISender:
                     sys.stdout.flush()
                     # Don't raise - continue anyway, but log the error
         
-        # Build service
-        service = build('gmail', 'v1', credentials=creds)
-        self.services[account_id] = service
-        print(f"   ✓ [{account_id} ({account_email})] Gmail API service ready")
-        import sys
-        sys.stdout.flush()
-        
-        return service
+        return creds
     
     def create_message(self, account, to_email, to_name, subject, body):
         """Create email message with both plain text and HTML versions."""
@@ -723,11 +857,15 @@ class GmailAPISender:
         pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         return bool(re.match(pattern, email.strip()))
     
+    def load_blacklist_policy(self):
+        """Domain policy for the blacklist: 'emails' are single addresses, 'domains' use
+        domain_policy rules ('.example.edu' = domain and subdomains, 'example.com' = that domain)."""
+        blacklist = self.config.get('blacklist', {})
+        return build_policy(blacklist.get('domains', []), blocked_addresses=blacklist.get('emails', []))
+    
     def is_blacklisted(self, email):
         """Check if email is in blacklist (should never receive emails)."""
-        email_lower = email.lower()
-        blacklist = self.config.get('blacklist', {}).get('emails', [])
-        return email_lower in [e.lower() for e in blacklist]
+        return self.blacklist_policy.is_denied(email)
     
     def is_already_sent(self, email):
         """Check if already sent. Returns False for whitelisted test emails."""
@@ -794,7 +932,13 @@ class GmailAPISender:
                 print(f"⚠️  Progress callback error: {e}")
     
     def process_csv(self, csv_file, test_mode=False, max_emails=None):
-        """Process CSV and send emails."""
+        """Process CSV and send emails (the sender is closed when the run ends)."""
+        try:
+            return self.send_from_csv(csv_file, test_mode, max_emails)
+        finally:
+            self.close()
+    
+    def send_from_csv(self, csv_file, test_mode=False, max_emails=None):
         print(f"\n{'='*80}")
         print(f"GMAIL API SENDER - {'TEST MODE' if test_mode else 'LIVE MODE'}")
         print(f"{'='*80}\n")
@@ -823,6 +967,8 @@ class GmailAPISender:
             to_send.append(recipient)
         
         print(f"Blacklisted (skipped): {blacklisted}")
+        for reason, count in self.blacklist_policy.rule_hits().items():
+            print(f"   {reason}: {count}")
         print(f"Ready to send: {len(to_send)}")
         
         if max_emails:
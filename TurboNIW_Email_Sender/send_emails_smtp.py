@@ -10,6 +10,7 @@ import smtplib
 import json
 import re
 import argparse
+import sys
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.utils import formataddr
@@ -23,6 +24,10 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from email_templates_variants import format_email
 
+# domain_policy.py lives in the repository root (shared with the arXiv pipeline)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from domain_policy import build_policy
+
 
 class EmailSender:
     def __init__(self, config_file='config.json'):
@@ -37,6 +42,7 @@ class EmailSender:
         self.progress_callback = None  # Callback for real-time progress updates
         self.history_lock = threading.Lock()  # Thread-safe history updates
         self.account_targets = {}  # Optional: per-account target counts (for auto-send)
+        self.blacklist_policy = self.load_blacklist_policy()  # Blacklisted addresses and domains
         
     def load_config(self, config_file):
         """Load configuration from JSON."""
@@ -127,11 +133,15 @@ class EmailSender:
         pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         return bool(re.match(pattern, email.strip()))
     
+    def load_blacklist_policy(self):
+        """Domain policy for the blacklist: 'emails' are single addresses, 'domains' use
+        domain_policy rules ('.example.edu' = domain and subdomains, 'example.com' = that domain)."""
+        blacklist = self.config.get('blacklist', {})
+        return build_policy(blacklist.get('domains', []), blocked_addresses=blacklist.get('emails', []))
+    
     def is_blacklisted(self, email):
         """Check if email is in blacklist (should never receive emails)."""
-        email_lower = email.lower()
-        blacklist = self.config.get('blacklist', {}).get('emails', [])
-        return email_lower in [e.lower() for e in blacklist]
+        return self.blacklist_policy.is_denied(email)
     
     def is_already_sent(self, email):
         """Check if email was already sent. Returns False for whitelisted test emails."""
@@ -344,6 +354,8 @@ class EmailSender:
             to_send.append(recipient)
         
         print(f"Blacklisted (skipped): {blacklisted}")
+        for reason, count in self.blacklist_policy.rule_hits().items():
+            print(f"   {reason}: {count}")
         print(f"Already sent: {skipped}")
         print(f"Ready to send: {len(to_send)}")
         
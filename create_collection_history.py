@@ -5,33 +5,125 @@ Create arXiv Collection History File
 Scans existing round1 and round2 directories to create a simple history JSON file
 that tracks which category+year combinations have already been collected.
 Format: {category: {year: {stats}}}
+
+Per-file counts are cached in data/arxiv/history_count_cache.json by path, size and
+mtime, so a rebuild only reads files that changed since the last one:
+
+    python3.9 create_collection_history.py
+    python3.9 create_collection_history.py --no-cache    # Recount every file
 """
 
+import argparse
 import csv
 import json
+import mmap
+import os
 from pathlib import Path
 import re
 
-def count_papers_and_authors(csv_file):
+COUNT_CACHE_FILE = Path('data/arxiv/history_count_cache.json')
+
+# count_rows_fast reads the file in chunks of about this size (ending at a newline)
+_CHUNK_SIZE = 1 << 22
+# bytes.translate deletion table keeping only quotes and newlines
+_NOT_QUOTE_OR_NEWLINE = bytes(b for b in range(256) if b not in b'"\n')
+# A line with an odd number of quotes (after translate): a quoted field continues on the next line
+_ODD_QUOTES_LINE = re.compile(rb'(?:^|\n)(?:"")*"(?=\n|\Z)')
+
+class CountCache:
+    """Per-file counts keyed by path, size and mtime; a file is only read again when it changes."""
+    
+    def __init__(self, cache_file=None):
+        self.cache_file = cache_file
+        self.entries = {}
+        self.used = {}
+        self.read = 0
+        self.cached = 0
+        if cache_file and cache_file.exists():
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+    
+    def get(self, kind, path, count):
+        """count(path) for this kind of file ('papers' / 'emails'), or the cached value if unchanged."""
+        stat = os.stat(path)  # Before counting, so a file growing meanwhile is recounted next time
+        key = f"{kind}:{path}"
+        entry = self.entries.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            self.cached += 1
+        else:
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'counts': count(path)}
+            self.read += 1
+        self.used[key] = entry
+        return entry['counts']
+    
+    def save(self):
+        """Write the entries used in this run (files that are gone drop out)."""
+        if not self.cache_file:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.used, f)
+
+def count_rows_fast(csv_file):
+    """
+    Data rows of a CSV as its newline count (over an mmap), or None when that could be
+    wrong - a quoted field spanning lines, a blank line or a bare \\r - and csv has to count.
+    """
+    with open(csv_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:1] in (b'\n', b'\r') or mm.find(b'\n\n') != -1 or mm.find(b'\n\r\n') != -1:
+                return None
+            newlines = 0
+            start = 0
+            while start < size:
+                end = mm.find(b'\n', start + _CHUNK_SIZE)
+                end = size if end == -1 else end + 1
+                chunk = mm[start:end]
+                if chunk.count(b'\r') != chunk.count(b'\r\n'):
+                    return None
+                if _ODD_QUOTES_LINE.search(chunk.translate(None, _NOT_QUOTE_OR_NEWLINE)):
+                    return None
+                newlines += chunk.count(b'\n')
+                start = end
+            lines = newlines + (mm[size - 1:] != b'\n')
+    return max(0, lines - 1)  # Header
+
+def _count_papers_and_authors(csv_file):
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        paper_count = author_count = 0
+        for p in csv.DictReader(f):
+            paper_count += 1
+            author_count += int(p.get('num_authors', 0) or 0)
+        return [paper_count, author_count]
+
+def _count_emails(email_file):
+    rows = count_rows_fast(email_file)
+    if rows is not None:
+        return rows
+    with open(email_file, 'r', encoding='utf-8', newline='') as f:
+        return sum(1 for _ in csv.DictReader(f))
+
+def count_papers_and_authors(csv_file, cache=None):
     """Count papers and authors in a CSV file."""
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            papers = list(reader)
-            paper_count = len(papers)
-            author_count = sum(int(p.get('num_authors', 0) or 0) for p in papers)
-            return paper_count, author_count
+        cache = cache or CountCache()
+        paper_count, author_count = cache.get('papers', str(csv_file), _count_papers_and_authors)
+        return paper_count, author_count
     except Exception as e:
         print(f"  Error reading {csv_file}: {e}")
         return 0, 0
 
-def count_emails(email_file):
+def count_emails(email_file, cache=None):
     """Count emails in an email CSV file."""
     try:
-        with open(email_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            emails = list(reader)
-            return len(emails)
+        cache = cache or CountCache()
+        return cache.get('emails', str(email_file), _count_emails)
     except:
         return 0
 
@@ -44,6 +136,12 @@ def parse_filename(filename):
     return None, None
 
 def main():
+    parser = argparse.ArgumentParser(description='Create arXiv collection history from round1/round2 files')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Recount every file instead of reusing counts of unchanged ones ({COUNT_CACHE_FILE})')
+    args = parser.parse_args()
+    
+    cache = CountCache(None if args.no_cache else COUNT_CACHE_FILE)
     history = {}
     
     # Process Round 1
@@ -59,10 +157,10 @@ def main():
                 continue
             
             print(f"  Found: {category_short} {year}")
-            paper_count, author_count = count_papers_and_authors(csv_file)
+            paper_count, author_count = count_papers_and_authors(csv_file, cache)
             
             email_file = round1_dir / f'{category_short}_{year}_email.csv'
-            email_count = count_emails(email_file)
+            email_count = count_emails(email_file, cache)
             
             # Initialize category if needed
             if category_short not in history:
@@ -102,10 +200,10 @@ def main():
                 continue
             
             print(f"  Found: {category_short} {year}")
-            paper_count, author_count = count_papers_and_authors(csv_file)
+            paper_count, author_count = count_papers_and_authors(csv_file, cache)
             
             email_file = round2_dir / f'{category_short}_{year}_email.csv'
-            email_count = count_emails(email_file)
+            email_count = count_emails(email_file, cache)
             
             # Initialize category if needed
             if category_short not in history:
@@ -153,8 +251,11 @@ def main():
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(history, f, indent=2, ensure_ascii=False)
     
+    cache.save()
+    
     print(f"\n✓ History file created: {output_file}")
     print(f"  Total categories: {len(history)}")
+    print(f"  Files counted: {cache.read} (unchanged, from cache: {cache.cached})")
     
     # Print summary
     print("\nSummary:")
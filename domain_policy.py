@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Email domain policy (used by 2.4-process_arxiv_round.py, the senders and the analyzer).
+
+Rules are kept in a trie over reversed domain labels (mail.tsinghua.edu.cn is looked
+up as cn -> edu -> tsinghua -> mail), so checking an email costs one step per label
+however many rules there are, and a rule only ever matches whole labels of the domain -
+'.cn' no longer matches cnn.com or the local part of li.cn@gmail.com.
+
+Rule patterns:
+    '.cn'  or '*.cn'         suffix: cn and every domain under it
+    'qq.com' or '@qq.com'    exact: that domain only (not mail.qq.com)
+    'name@example.edu'       one address
+
+The most specific rule wins (address > exact domain > longest suffix), so an allow
+rule can carve an exception out of a deny rule:
+
+    policy = DomainPolicy()
+    policy.add_rules(['.cn', 'qq.com'], 'deny')
+    policy.add_rules(['.nottingham.edu.cn'], 'allow')
+    policy.check('li@cs.nottingham.edu.cn')   # (True, 'allow .nottingham.edu.cn')
+"""
+
+import hashlib
+import logging
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ALLOW = 'allow'
+DENY = 'deny'
+
+# Chinese email domains removed by 2.4 (post_processing.blocked_domains overrides)
+DEFAULT_BLOCKED_DOMAINS = [
+    '.cn',
+    '163.com', '126.com', 'qq.com', 'sina.com', 'sohu.com',
+    'yeah.net', '139.com', 'aliyun.com',
+]
+
+
+def split_email(email: str) -> Tuple[str, str]:
+    """(address, domain) of an email, both lowercase and stripped ('' domain if there is no @)."""
+    address = (email or '').strip().lower()
+    return address, address.rpartition('@')[2] if '@' in address else ''
+
+
+class _Node:
+    __slots__ = ('children', 'exact', 'suffix')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.exact: Optional[Tuple[str, str]] = None   # (action, reason)
+        self.suffix: Optional[Tuple[str, str]] = None
+
+
+class DomainPolicy:
+    """
+    Allow/deny decisions for email addresses from suffix, exact-domain and address rules.
+
+    check() returns (allowed, reason) and counts a hit for the deciding rule in
+    self.hits ('default' when no rule matched).
+    """
+
+    def __init__(self, default: str = ALLOW):
+        self.default = default
+        self.root = _Node()
+        self.addresses: Dict[str, Tuple[str, str]] = {}
+        self.rules = 0
+        self.patterns = []  # (action, pattern) as added, for signature()
+        self.hits = Counter()
+
+    def add_rule(self, pattern: str, action: str = DENY):
+        """Add one rule (see the module docstring for pattern syntax)."""
+        if action not in (ALLOW, DENY):
+            raise ValueError(f"Unknown policy action: {action}")
+        pattern = pattern.strip().lower()
+        self.patterns.append((action, pattern))
+        rule = (action, f"{action} {pattern}")
+        if '@' in pattern and not pattern.startswith('@'):
+            self.addresses[pattern] = rule
+            self.rules += 1
+            return
+
+        domain = pattern.lstrip('@')
+        suffix = domain.startswith('.') or domain.startswith('*.')
+        labels = [label for label in domain.lstrip('*').strip('.').split('.') if label]
+        if not labels:
+            raise ValueError(f"Empty domain rule: {pattern!r}")
+        node = self.root
+        for label in reversed(labels):
+            node = node.children.setdefault(label, _Node())
+        if suffix:
+            node.suffix = rule
+        else:
+            node.exact = rule
+        self.rules += 1
+
+    def add_rules(self, patterns: Iterable[str], action: str = DENY):
+        for pattern in patterns:
+            self.add_rule(pattern, action)
+
+    def add_address(self, address: str, action: str = DENY) -> bool:
+        """
+        Add a rule for one local@domain address. Anything else (blank, a bare domain)
+        is skipped with a warning rather than widened into a domain rule; returns
+        whether the rule was added.
+        """
+        address = (address or '').strip().lower()
+        local, _, domain = address.rpartition('@')
+        if not local or not domain or '.' not in domain:
+            logger.warning(f"Ignoring blacklist entry {address!r}: not an email address")
+            return False
+        self.add_rule(address, action)
+        return True
+
+    def match(self, email: str) -> Optional[Tuple[str, str]]:
+        """(action, reason) of the most specific matching rule, or None."""
+        address, domain = split_email(email)
+        if address in self.addresses:
+            return self.addresses[address]
+
+        best = None
+        node = self.root
+        labels = domain.split('.')
+        for i in range(len(labels) - 1, -1, -1):
+            node = node.children.get(labels[i])
+            if node is None:
+                return best
+            if node.suffix is not None:
+                best = node.suffix
+        return node.exact or best
+
+    def check(self, email: str) -> Tuple[bool, str]:
+        """(allowed, reason) for an email; the deciding rule's hit counter is incremented."""
+        rule = self.match(email)
+        if rule is None:
+            self.hits['default'] += 1
+            return (self.default == ALLOW, f"default {self.default}")
+        action, reason = rule
+        self.hits[reason] += 1
+        return (action == ALLOW, reason)
+
+    def is_denied(self, email: str) -> bool:
+        return not self.check(email)[0]
+
+    def signature(self) -> str:
+        """Stable hash of the default and the rules (to tell whether cached results still apply)."""
+        rules = '\n'.join(f"{action} {pattern}" for action, pattern in sorted(self.patterns))
+        return hashlib.sha1(f"{self.default}\n{rules}".encode('utf-8')).hexdigest()
+
+    def rule_hits(self) -> Dict[str, int]:
+        """Hits per rule (most hit first), without the 'default' entry."""
+        return {reason: count for reason, count in self.hits.most_common() if reason != 'default'}
+
+
+def _add_config_rules(policy: DomainPolicy, patterns: Iterable[str], action: str):
+    """add_rules for patterns read from a config file: bad entries are skipped with a warning."""
+    for pattern in patterns:
+        try:
+            policy.add_rule(pattern, action)
+        except (ValueError, AttributeError):
+            logger.warning(f"Ignoring {action} rule {pattern!r}: not a domain or address pattern")
+
+
+def build_policy(blocked: Iterable[str] = (), allowed: Iterable[str] = (),
+                 blocked_addresses: Iterable[str] = ()) -> DomainPolicy:
+    """
+    Default-allow policy from deny lists and allow exceptions (usually straight from a
+    config file, so invalid entries are skipped with a warning instead of raising).
+    blocked and allowed take any pattern; blocked_addresses only single addresses.
+    """
+    policy = DomainPolicy(ALLOW)
+    _add_config_rules(policy, blocked, DENY)
+    for address in blocked_addresses:
+        policy.add_address(address, DENY)
+    _add_config_rules(policy, allowed, ALLOW)
+    return policy
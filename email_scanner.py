@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Shared email scanner for first-page PDF text (ACL and arXiv pipelines).
+
+One precompiled pattern, one left-to-right pass over the text. Handles:
+  - plain addresses, with stray whitespace around '@' ("name @ mit.edu")
+  - brace groups, LaTeX style: {alice, bob}@mit.edu and \\{alice,bob\\}@mit.edu
+  - obfuscations: "name [at] cs [dot] mit [dot] edu", "(at)", "{at}", "<dot>" ...
+  - addresses wrapped across lines after '@' or after a '.' in the domain (a line
+    break after a '.' is only joined while the domain before it is not complete,
+    so "x@mit.edu.\nwe show" stays x@mit.edu)
+  - trailing superscript markers glued to the TLD ("mit.edu1", "mit.edu∗")
+
+Used by 1-acl_info.py and 2.2-extract_emails_from_papers.py.
+
+Benchmark against the previous per-script implementations:
+    python3.9 email_scanner.py --benchmark
+    python3.9 email_scanner.py --benchmark --corpus my_corpus.txt --repeat 500
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+DEFAULT_CORPUS = Path(__file__).parent / 'data' / 'fixtures' / 'email_corpus.txt'
+
+# Building blocks (kept as strings so the brace and plain branches share them)
+_OPEN = r'[\[(<{]'
+_CLOSE = r'[\])>}]'
+_AT = rf'\s*(?:[@＠]|{_OPEN}\s*(?i:at)\s*{_CLOSE})\s*'
+# A '.' may be followed by a line break only when the next line continues in
+# lowercase, so "a@b.com.\nAbstract" does not swallow the next word.
+_DOT = rf'(?:\.(?:[ \t]*\r?\n[ \t]*(?=[a-z0-9]))?|\s*{_OPEN}\s*(?i:dot)\s*{_CLOSE}\s*)'
+# Labels may also wrap after a hyphen ("uni-\nfreiburg.de"); the hyphen is kept.
+_LABEL = r'[A-Za-z0-9-]+(?:(?<=-)[ \t]*\r?\n[ \t]*[a-z0-9][A-Za-z0-9-]*)*'
+# TLD is letters only; digits or markers right after it are superscripts.
+_DOMAIN = rf'{_LABEL}(?:{_DOT}{_LABEL})*{_DOT}[A-Za-z]{{2,}}(?![A-Za-z])'
+_LOCAL_CHARS = r'A-Za-z0-9._%+-'
+
+# Top-level domains that end an address: generic ones seen in papers and every
+# ISO 3166 country code. Used to decide whether a '.' at a line end closes the domain.
+KNOWN_TLDS = frozenset(
+    'com org net edu gov mil int info biz name pro aero coop museum mobi asia jobs tel travel '
+    'app dev ai io tech online site xyz science cloud academy institute research email me '
+    'ac ad ae af ag al am ao aq ar as at au aw ax az ba bb bd be bf bg bh bi bj bm bn bo br bs '
+    'bt bw by bz ca cc cd cf cg ch ci ck cl cm cn co cr cu cv cw cx cy cz de dj dk dm do dz ec ee '
+    'eg er es et eu fi fj fk fm fo fr ga gd ge gf gg gh gi gl gm gn gp gq gr gs gt gu gw gy hk hm '
+    'hn hr ht hu id ie il im in iq ir is it je jm jo jp ke kg kh ki km kn kp kr kw ky kz la lb lc '
+    'li lk lr ls lt lu lv ly ma mc md mg mh mk ml mm mn mo mp mq mr ms mt mu mv mw mx my mz na nc '
+    'ne nf ng ni nl no np nr nu nz om pa pe pf pg ph pk pl pm pn pr ps pt pw py qa re ro rs ru rw '
+    'sa sb sc sd se sg sh si sk sl sm sn so sr ss st su sv sx sy sz tc td tf tg th tj tk tl tm tn '
+    'to tr tt tv tw tz ua ug uk us uy uz va vc ve vg vi vn vu wf ws ye yt za zm zw'.split()
+)
+
+# Both branches share one leading lookbehind, so positions inside a word are
+# rejected before either branch is tried. The local part is matched atomically
+# (lookahead + backreference): a word not followed by '@' fails once instead of
+# backtracking per character.
+EMAIL_RE = re.compile(
+    rf'''
+    (?<![{_LOCAL_CHARS}])
+    (?:
+        (?=(?P<local>[{_LOCAL_CHARS}]+)) (?P=local) {_AT} (?P<domain>{_DOMAIN})
+        |
+        \\?\{{ (?P<names>[^{{}}@]{{1,300}}?) \\?\}} {_AT} (?P<brace_domain>{_DOMAIN})
+    )
+    ''',
+    re.VERBOSE,
+)
+
+_LOCAL_RE = re.compile(rf'[{_LOCAL_CHARS}]+')
+_NAME_SPLIT_RE = re.compile(r'[,;|\s]+')
+_PLAIN_DOMAIN_RE = re.compile(r'[A-Za-z0-9.-]+')
+_DOMAIN_NOISE_RE = re.compile(rf'\s+|{_OPEN}\s*(?i:dot)\s*{_CLOSE}')
+_DOT_WRAP_RE = re.compile(r'\.[ \t]*\r?\n[ \t]*')
+_DOMAIN_SHAPE_RE = re.compile(r'[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}')
+
+
+def _clean_domain(raw: str) -> str:
+    """Collapse obfuscated separators and line breaks out of a matched domain."""
+    if _PLAIN_DOMAIN_RE.fullmatch(raw):
+        return raw
+    return _DOMAIN_NOISE_RE.sub(lambda m: '' if m.group().isspace() else '.', raw)
+
+
+def _ends_on_tld(domain: str, min_labels: int = 1) -> bool:
+    labels = domain.split('.')
+    return len(labels) >= min_labels and labels[-1].lower() in KNOWN_TLDS
+
+
+def _unwrapped_length(raw: str) -> int:
+    """How much of a matched domain to keep when it contains '.'+line break joins.
+
+    A join is undone where the domain before the break is already complete
+    (two or more labels ending on a known TLD) - the next line is prose, as in
+    "x@mit.edu.\nwe show". If every join was needed, the result must still end on
+    a known TLD, otherwise the last join is undone.
+    """
+    breaks = list(_DOT_WRAP_RE.finditer(raw))
+    if not breaks:
+        return len(raw)
+    for wrap in breaks:
+        if _ends_on_tld(_clean_domain(raw[:wrap.start()]), min_labels=2):
+            return wrap.start()
+    if _ends_on_tld(_clean_domain(raw)):
+        return len(raw)
+    return breaks[-1].start()
+
+
+def find_emails(text: str) -> List[str]:
+    """Return unique email addresses in text, in order of first appearance.
+
+    Duplicates are detected case-insensitively; the first spelling is kept.
+    """
+    if not text:
+        return []
+
+    emails = []
+    seen = set()
+
+    def add(local: str, domain: str):
+        local = local.strip('.')
+        if not local or not _LOCAL_RE.fullmatch(local):
+            return
+        email = f"{local}@{domain}"
+        key = email.lower()
+        if key not in seen:
+            seen.add(key)
+            emails.append(email)
+
+    pos = 0
+    while True:
+        match = EMAIL_RE.search(text, pos)
+        if match is None:
+            break
+        names = match.group('names')
+        group = 'brace_domain' if names is not None else 'domain'
+        raw = match.group(group)
+        keep = _unwrapped_length(raw)
+        # Resume after the kept domain: an undone join's next line is scanned again
+        pos = match.start(group) + keep if keep < len(raw) else match.end()
+        domain = _clean_domain(raw[:keep])
+        if keep < len(raw) and not _DOMAIN_SHAPE_RE.fullmatch(domain):
+            continue
+        if names is not None:
+            for name in _NAME_SPLIT_RE.split(names):
+                add(name, domain)
+        else:
+            add(match.group('local'), domain)
+
+    return emails
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def _legacy_arxiv_find_emails(text: str) -> List[str]:
+    """find_emails_in_text as it was in 2.2 before the shared scanner."""
+    emails = []
+    multi_name_pattern = r'\{([^}]+)\}@([A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
+    for match in re.finditer(multi_name_pattern, text):
+        for name in match.group(1).split(','):
+            name = name.strip()
+            if name:
+                emails.append(f"{name}@{match.group(2)}")
+    text_cleaned = text.replace('{', ' ').replace('}', ' ').replace('\\', ' ')
+    text_cleaned = re.sub(r'\s+@\s*', '@', text_cleaned)
+    text_cleaned = re.sub(r'\s*@\s+', '@', text_cleaned)
+    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    emails.extend(re.findall(email_pattern, text_cleaned))
+    return list(set(emails))
+
+
+def _legacy_acl_find_emails(text: str) -> List[str]:
+    """Address part of extract_emails in 1-acl_info.py before the shared scanner
+    (author-section detection and placeholder filtering are not included)."""
+    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    emails = re.findall(email_pattern, text)
+    brace_pattern = r'\{([^}]+)\}@([A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
+    for usernames, domain in re.findall(brace_pattern, text):
+        for username in usernames.split(','):
+            username = username.strip()
+            if username:
+                emails.append(f"{username}@{domain}")
+    seen = set()
+    unique_emails = []
+    for email in emails:
+        if email.lower() not in seen:
+            seen.add(email.lower())
+            unique_emails.append(email)
+    return unique_emails
+
+
+def load_corpus(corpus_file: Path) -> List[Dict]:
+    """Load a fixture corpus: documents separated by '=====' lines.
+
+    A document may start with '# expect: a@x.org, b@y.org' listing the
+    addresses it contains; that line is not part of the scanned text.
+    """
+    documents = []
+    for chunk in re.split(r'^=====\s*$', corpus_file.read_text(encoding='utf-8'), flags=re.MULTILINE):
+        lines = chunk.strip('\n').split('\n')
+        expected = []
+        if lines and lines[0].startswith('# expect:'):
+            expected = [e.strip() for e in lines.pop(0)[len('# expect:'):].split(',') if e.strip()]
+        text = '\n'.join(lines)
+        if text.strip():
+            documents.append({'text': text, 'expected': expected})
+    return documents
+
+
+def run_benchmark(corpus_file: Path = DEFAULT_CORPUS, repeat: int = 200):
+    """Time each implementation over the corpus and report recall/precision
+    against the '# expect:' annotations."""
+    documents = load_corpus(corpus_file)
+    implementations: Dict[str, Callable[[str], List[str]]] = {
+        'email_scanner': find_emails,
+        'legacy 2.2': _legacy_arxiv_find_emails,
+        'legacy 1-acl': _legacy_acl_find_emails,
+    }
+    total_chars = sum(len(d['text']) for d in documents)
+    expected_total = sum(len(d['expected']) for d in documents)
+
+    print(f"Corpus: {corpus_file} ({len(documents)} documents, {total_chars:,} chars, "
+          f"{expected_total} expected addresses), {repeat} repetitions")
+    print(f"{'implementation':<16}{'ms/pass':>10}{'MB/s':>8}{'found':>8}{'correct':>9}{'wrong':>7}")
+
+    for name, func in implementations.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for doc in documents:
+                func(doc['text'])
+        elapsed = time.perf_counter() - start
+
+        found = correct = 0
+        for doc in documents:
+            result = {e.lower() for e in func(doc['text'])}
+            expected = {e.lower() for e in doc['expected']}
+            found += len(result)
+            correct += len(result & expected)
+        per_pass = elapsed / repeat
+        print(f"{name:<16}{per_pass * 1000:>10.3f}{total_chars / per_pass / 1e6:>8.1f}"
+              f"{found:>8}{correct:>9}{found - correct:>7}")
+
+    misses = []
+    for i, doc in enumerate(documents, 1):
+        result = {e.lower() for e in find_emails(doc['text'])}
+        for email in doc['expected']:
+            if email.lower() not in result:
+                misses.append((i, email))
+    for i, email in misses:
+        print(f"  email_scanner missed {email} (document {i})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared email scanner for paper first pages')
+    parser.add_argument('file', nargs='?', help='Text file to scan (prints one address per line)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare against the previous 1-acl / 2.2 implementations')
+    parser.add_argument('--corpus', type=str, default=str(DEFAULT_CORPUS),
+                        help=f'Fixture corpus for --benchmark (default: {DEFAULT_CORPUS})')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='Passes over the corpus per implementation (default: 200)')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(Path(args.corpus), args.repeat)
+    elif args.file:
+        for email in find_emails(Path(args.file).read_text(encoding='utf-8', errors='replace')):
+            print(email)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
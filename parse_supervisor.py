@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Supervised worker processes for PDF parsing (used by 1-acl_info.py and 2.2).
+
+Unlike ProcessPoolExecutor, every task runs under a wall-clock timeout and a
+resident-memory cap. A worker that breaches either is killed and replaced, and
+the task's future fails with ParseTimeout / ParseMemoryExceeded, so one
+pathological PDF cannot stall or exhaust a long unattended run.
+
+RSS is read with psutil when it is installed, otherwise from /proc (Linux);
+without either the memory cap is not enforced.
+
+Workers are started with forkserver (spawn where it is unavailable), never a
+plain fork: callers run download threads, and a fork taken while one of them
+holds a lock (logging, SSL, the allocator) can deadlock the child. Task
+functions must therefore be importable from the main script or a module.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from multiprocessing import resource_tracker
+from multiprocessing.connection import wait
+from typing import Callable, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+class ParseTimeout(Exception):
+    """A task ran longer than the pool's task_timeout; its worker was killed."""
+
+
+class ParseMemoryExceeded(Exception):
+    """A task's worker grew past the pool's max_rss_mb; it was killed."""
+
+
+def rss_mb(pid: int) -> Optional[float]:
+    """Resident set size of a process in MB (None if it cannot be read)."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss / 2 ** 20
+        except psutil.Error:
+            return None
+    try:
+        with open(f'/proc/{pid}/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def rss_supported() -> bool:
+    return psutil is not None or os.path.exists(f'/proc/{os.getpid()}/statm')
+
+
+def _worker_main(conn):
+    """Worker loop: run (fn, args) tasks until told to stop (None) or the pipe closes."""
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if task is None:
+            return
+        fn, args = task
+        try:
+            reply = (True, fn(*args))
+        except Exception as e:
+            # Send the error as text: library exceptions are not always picklable
+            reply = (False, f"{type(e).__name__}: {e}")
+        try:
+            conn.send(reply)
+        except (BrokenPipeError, EOFError):
+            return
+        except Exception as e:
+            conn.send((False, f"Unpicklable result: {e}"))
+
+
+class _Worker:
+    """One worker process and the task it is running (future is None when idle)."""
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.future: Optional[Future] = None
+        self.started = 0.0
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class SupervisedPool:
+    """
+    Process pool where each task gets a timeout and a memory cap.
+
+    submit() returns a concurrent.futures.Future. A supervisor thread hands queued
+    tasks to idle workers, collects results, and kills and replaces any worker whose
+    task exceeds task_timeout seconds or max_rss_mb. Either limit may be None.
+    """
+
+    def __init__(self, max_workers: int, task_timeout: Optional[float] = None,
+                 max_rss_mb: Optional[float] = None, check_interval: float = 0.2):
+        self.max_workers = max(1, max_workers)
+        self.task_timeout = task_timeout
+        self.max_rss_mb = max_rss_mb if max_rss_mb and rss_supported() else None
+        if max_rss_mb and self.max_rss_mb is None:
+            logger.warning("Cannot read worker memory on this system (install psutil) - RSS cap disabled")
+        self.check_interval = check_interval
+        self.stats = Counter()
+
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        # Workers must share the parent's resource tracker: one started by a worker
+        # would report shared memory blocks the parent hands over as leaked
+        resource_tracker.ensure_running()
+        self._workers = [_Worker(self._ctx) for _ in range(self.max_workers)]
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._wake_recv, self._wake_send = self._ctx.Pipe(duplex=False)
+        self._shutdown = False
+        self._thread = threading.Thread(target=self._supervise, name='parse-supervisor', daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Queue fn(*args) for a worker (fn and args must be picklable)."""
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            self._queue.append((future, fn, args))
+            self._wake_send.send(None)
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop accepting tasks; optionally drop queued ones and wait for running ones."""
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while self._queue:
+                    self._queue.popleft()[0].cancel()
+            self._wake_send.send(None)
+        if wait:
+            self._thread.join()
+
+    # ------------------------------------------------------------------
+
+    def _dispatch(self):
+        """Hand queued tasks to idle workers (lock held)."""
+        for worker in self._workers:
+            while worker.future is None and self._queue:
+                future, fn, args = self._queue.popleft()
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    worker.conn.send((fn, args))
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+                worker.future = future
+                worker.started = time.monotonic()
+
+    def _replace(self, worker: _Worker, error: Exception):
+        """Kill a worker, fail its task and start a fresh worker in its place."""
+        worker.kill()
+        future, worker.future = worker.future, None
+        if future is not None:
+            future.set_exception(error)
+        self._workers[self._workers.index(worker)] = _Worker(self._ctx)
+
+    def _fail_all(self, error: Exception):
+        """Fail running and queued tasks and refuse new ones (the supervisor cannot go on)."""
+        with self._lock:
+            self._shutdown = True
+            pending = [w.future for w in self._workers if w.future is not None]
+            pending += [future for future, _, _ in self._queue]
+            self._queue.clear()
+            for worker in self._workers:
+                worker.future = None
+        for future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError(f"Parse supervisor failed: {error}"))
+
+    def _supervise(self):
+        try:
+            self._supervise_tasks()
+        except Exception as e:
+            logger.exception(f"Parse supervisor failed: {e}")
+            self.stats['supervisor_errors'] += 1
+            self._fail_all(e)
+
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except Exception:
+                pass
+            worker.process.join(timeout=2)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+            worker.conn.close()
+
+    def _supervise_tasks(self):
+        while True:
+            with self._lock:
+                self._dispatch()
+                busy = [w for w in self._workers if w.future is not None]
+                if self._shutdown and not busy and not self._queue:
+                    break
+
+            ready = wait([w.conn for w in busy] + [self._wake_recv], timeout=self.check_interval)
+            for conn in ready:
+                if conn is self._wake_recv:
+                    while self._wake_recv.poll():
+                        self._wake_recv.recv()
+                    continue
+                worker = next(w for w in busy if w.conn is conn)
+                try:
+                    ok, value = conn.recv()
+                except (EOFError, OSError):
+                    self.stats['crashed'] += 1
+                    self._replace(worker, RuntimeError(f"Parse worker exited (code {worker.process.exitcode})"))
+                    continue
+                future, worker.future = worker.future, None
+                self.stats['completed'] += 1
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(RuntimeError(value))
+
+            now = time.monotonic()
+            for worker in busy:
+                if worker.future is None:
+                    continue
+                elapsed = now - worker.started
+                if self.task_timeout and elapsed > self.task_timeout:
+                    self.stats['timeouts'] += 1
+                    self._replace(worker, ParseTimeout(f"Parsing took longer than {self.task_timeout:g}s"))
+                elif self.max_rss_mb:
+                    rss = rss_mb(worker.process.pid)
+                    if rss is not None and rss > self.max_rss_mb:
+                        self.stats['memory_kills'] += 1
+                        self._replace(worker, ParseMemoryExceeded(
+                            f"Parse worker used {rss:.0f} MB (limit {self.max_rss_mb:.0f} MB)"))
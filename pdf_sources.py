@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Local PDF sources for offline ingestion (used by 1-acl_info.py and 2.2).
+
+A source is a directory (searched recursively for *.pdf) or a tar / zip
+archive. Archive members are streamed one at a time straight into memory -
+nothing is extracted to disk - so an arXiv bulk tarball or an ACL Anthology
+dump can be fed to the parse stage without an HTTP request per paper.
+
+Filenames map to paper IDs:
+    arXiv:  2301.00001v2.pdf -> 2301.00001,  hep-th9901001v1.pdf -> hep-th/9901001
+    ACL:    2024.acl-long.1.pdf -> 2024.acl-long.1 (the Anthology ID)
+"""
+
+import logging
+import re
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz', '.zip')
+
+_ARXIV_NEW_ID_RE = re.compile(r'^(\d{4}\.\d{4,5})(?:v\d+)?$')
+_ARXIV_OLD_ID_RE = re.compile(r'^([a-z-]+(?:\.[A-Z]{2})?)(\d{7})(?:v\d+)?$')
+
+
+def _is_pdf_name(name: str) -> bool:
+    path = PurePosixPath(name)
+    # Skip macOS resource forks that ride along in zips made on a Mac
+    return (path.suffix.lower() == '.pdf' and not path.name.startswith('._')
+            and '__MACOSX' not in path.parts)
+
+
+def is_archive(path: Union[str, Path]) -> bool:
+    return str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def iter_pdf_source(source: Union[str, Path]) -> Iterator[Tuple[str, Union[bytes, Path]]]:
+    """
+    Yield (filename, pdf) for every PDF in a directory or archive.
+
+    Directory PDFs are yielded as their Path (parse workers open the file themselves);
+    archive members are read into memory one at a time and yielded as bytes.
+    """
+    source = Path(source)
+    if source.is_dir():
+        for pdf_path in sorted(source.rglob('*')):
+            if pdf_path.is_file() and _is_pdf_name(pdf_path.name):
+                yield (pdf_path.name, pdf_path)
+    elif source.suffix.lower() == '.zip':
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and _is_pdf_name(info.filename):
+                    yield (PurePosixPath(info.filename).name, archive.read(info))
+    elif is_archive(source):
+        # Stream mode ('r|*'): members are read in order without seeking, any compression
+        with tarfile.open(source, mode='r|*') as archive:
+            for member in archive:
+                if member.isfile() and _is_pdf_name(member.name):
+                    yield (PurePosixPath(member.name).name, archive.extractfile(member).read())
+    elif source.is_file() and _is_pdf_name(source.name):
+        yield (source.name, source)
+    else:
+        logger.warning(f"⚠️  Not a PDF, directory or tar/zip archive: {source}")
+
+
+def iter_pdf_sources(sources: Iterable[Union[str, Path]]) -> Iterator[Tuple[str, Union[bytes, Path]]]:
+    """iter_pdf_source over several sources in turn."""
+    for source in sources:
+        logger.info(f"📦 Reading PDFs from {source}")
+        yield from iter_pdf_source(source)
+
+
+def arxiv_id_from_name(filename: str) -> Optional[str]:
+    """arXiv ID (without version) for a bulk-download filename, or None if it is not one."""
+    stem = PurePosixPath(filename).stem
+    match = _ARXIV_NEW_ID_RE.match(stem)
+    if match:
+        return match.group(1)
+    match = _ARXIV_OLD_ID_RE.match(stem)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+    return None
+
+
+def acl_id_from_name(filename: str) -> str:
+    """ACL Anthology ID for a filename from an Anthology dump (the name without .pdf)."""
+    return PurePosixPath(filename).stem
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Structured progress events for email extraction (2.2 / 2.3).
+
+Running extractions append one JSON object per line to a shared events file
+(progress_events_file in the config, default data/arxiv/logs/progress.jsonl):
+
+    {"event": "batch-start", "batch": "...", "files": 12, "jobs": 2, ...}
+    {"event": "file-queued", "batch": "...", "file": "cs_lg_2024", "todo": 812, ...}
+    {"event": "file-start",  "batch": "...", "file": "cs_lg_2024", "todo": 812, ...}
+    {"event": "progress",    "batch": "...", "file": "cs_lg_2024", "done": 140, "todo": 812,
+     "in_flight": 3, "bytes": 91234567, "rate": 0.41, "eta_seconds": 1639, ...}
+    {"event": "file-end",    "batch": "...", "file": "cs_lg_2024", "outcome": "completed", ...}
+    {"event": "batch-end",   "batch": "...", ...}
+
+Rates are measured over a sliding window of recently finished papers, so papers
+skipped on resume do not distort speed or ETA. Any number of processes may append
+to the same file; once it grows past MAX_EVENTS_BYTES it is rotated to
+{name}.1 (one old generation is kept). A consumer (the web app, or `watch`
+below) tails it, starting near the end:
+
+    python3.9 progress_events.py watch
+    python3.9 progress_events.py watch --events data/arxiv/logs/progress.jsonl --once
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_EVENTS_FILE = 'data/arxiv/logs/progress.jsonl'
+
+# A file with no event for this long is shown as stale (its process probably died)
+STALE_SECONDS = 300
+
+# The events file is rotated once it is larger than this; watch starts this far from its end
+MAX_EVENTS_BYTES = 16 * 2 ** 20
+WATCH_TAIL_BYTES = 2 * 2 ** 20
+
+
+class ProgressEmitter:
+    """Thread-safe appender for one events file (one short write per event)."""
+
+    def __init__(self, events_file: str, max_bytes: int = MAX_EVENTS_BYTES):
+        self.events_file = Path(events_file)
+        self.rotated_file = self.events_file.with_name(self.events_file.name + '.1')
+        self.max_bytes = max_bytes
+        self.events_file.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.file = open(self.events_file, 'a', encoding='utf-8')
+
+    def emit(self, event: str, **fields):
+        record = {'ts': round(time.time(), 3), 'event': event, 'pid': os.getpid(), **fields}
+        line = json.dumps(record, default=str) + '\n'
+        with self.lock:
+            self._check_rotation()
+            # O_APPEND + a single write keeps lines from concurrent processes whole
+            self.file.write(line)
+            self.file.flush()
+
+    def _check_rotation(self):
+        """Rotate the file once it is too large; reopen it if another process rotated it (lock held)."""
+        try:
+            current = os.stat(self.events_file)
+        except OSError:
+            current = None
+        mine = os.fstat(self.file.fileno())
+        if current is not None and (current.st_dev, current.st_ino) == (mine.st_dev, mine.st_ino):
+            if current.st_size <= self.max_bytes:
+                return
+            try:
+                os.replace(self.events_file, self.rotated_file)
+            except OSError:
+                pass  # Another process rotated it first (or the platform refuses): just reopen
+        self.file.close()
+        self.file = open(self.events_file, 'a', encoding='utf-8')
+
+
+_emitters: Dict[str, ProgressEmitter] = {}
+_emitters_lock = threading.Lock()
+
+
+def get_emitter(events_file: Optional[str]) -> Optional[ProgressEmitter]:
+    """Shared emitter per events file (None if events are turned off or the file is unusable)."""
+    if not events_file:
+        return None
+    with _emitters_lock:
+        if events_file not in _emitters:
+            try:
+                _emitters[events_file] = ProgressEmitter(events_file)
+            except OSError:
+                return None
+        return _emitters[events_file]
+
+
+def new_batch_id() -> str:
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+class FileProgress:
+    """
+    Progress of one input file: papers done, downloads in flight, bytes, windowed rate, ETA.
+
+    Works without an emitter (2.2's log line uses rate / eta_seconds too); with one,
+    a 'progress' event is written at most every emit_interval seconds.
+    """
+
+    def __init__(self, file: str, todo: int, emitter: Optional[ProgressEmitter] = None,
+                 batch: Optional[str] = None, emit_interval: float = 2.0, window_seconds: float = 120.0):
+        self.file = file
+        self.todo = todo
+        self.emitter = emitter
+        self.batch = batch
+        self.emit_interval = emit_interval
+        self.window_seconds = window_seconds
+        self.lock = threading.Lock()
+        self.start = time.time()
+        self.done = 0
+        self.records = 0
+        self.in_flight = 0
+        self.bytes = 0
+        self.statuses = Counter()
+        self.samples = deque([(self.start, 0)])  # (time, done) for the rate window
+        self.last_emit = 0.0
+
+    def _emit(self, event: str, **fields):
+        if self.emitter is not None:
+            self.emitter.emit(event, batch=self.batch, file=self.file, **fields)
+
+    def started(self, **fields):
+        self._emit('file-start', todo=self.todo, **fields)
+
+    def download_started(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def download_finished(self, nbytes: int = 0):
+        with self.lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self.bytes += nbytes
+
+    def paper_done(self, status: str, records: int = 0):
+        with self.lock:
+            self.done += 1
+            self.records += records
+            self.statuses[status] += 1
+            now = time.time()
+            self.samples.append((now, self.done))
+            while len(self.samples) > 2 and self.samples[1][0] < now - self.window_seconds:
+                self.samples.popleft()
+            due = now - self.last_emit >= self.emit_interval
+            if due:
+                self.last_emit = now
+        if due:
+            self._emit('progress', **self.snapshot())
+
+    @property
+    def rate(self) -> float:
+        """Papers per second over the recent window (0.0 until something finished)."""
+        with self.lock:
+            (t0, d0), (t1, d1) = self.samples[0], self.samples[-1]
+        return (d1 - d0) / (t1 - t0) if t1 > t0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        rate = self.rate
+        return max(0, self.todo - self.done) / rate if rate > 0 else None
+
+    def snapshot(self) -> Dict:
+        rate, eta = self.rate, self.eta_seconds
+        return {'done': self.done, 'todo': self.todo, 'records': self.records, 'in_flight': self.in_flight,
+                'bytes': self.bytes, 'rate': round(rate, 4), 'eta_seconds': round(eta) if eta is not None else None,
+                'elapsed_seconds': round(time.time() - self.start, 1), 'statuses': dict(self.statuses)}
+
+    def finished(self, outcome: str, **fields):
+        self._emit('file-end', outcome=outcome, **self.snapshot(), **fields)
+
+
+# ============================================================================
+# watch: live view of every running extraction
+# ============================================================================
+
+def _format_eta(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return '-'
+    if seconds >= 3600:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 60:.0f}m"
+
+
+def apply_event(state: Dict, event: Dict):
+    """Fold one event into {batch: {'info': {...}, 'files': {file: latest fields}}}."""
+    batch = event.get('batch') or f"pid-{event.get('pid')}"
+    entry = state.setdefault(batch, {'info': {}, 'files': {}})
+    kind = event.get('event')
+    if kind in ('batch-start', 'batch-end'):
+        entry['info'].update(event)
+    elif event.get('file'):
+        file_state = entry['files'].setdefault(event['file'], {})
+        file_state.update(event)
+        if kind == 'file-queued':
+            file_state['outcome'] = 'queued'
+        elif kind == 'file-start' or (kind == 'progress' and file_state.get('outcome', 'queued') == 'queued'):
+            # watch may start after a file's file-start line (tail or rotation): progress implies running
+            file_state['outcome'] = 'running'
+
+
+def render(state: Dict, show_finished: bool = False) -> str:
+    now = time.time()
+    lines = [f"{'file':<30}{'status':<11}{'done/todo':>14}{'papers/min':>12}{'MB':>9}{'in-flight':>11}{'ETA':>8}"]
+    for batch, entry in sorted(state.items(), key=lambda item: item[1]['info'].get('ts', 0)):
+        files = entry['files']
+        running = {f: s for f, s in files.items() if s.get('outcome') == 'running'}
+        if not running and not show_finished:
+            continue
+        info = entry['info']
+        queued = [f for f, s in files.items() if s.get('outcome') == 'queued']
+        started = len(files) - len(queued)
+        label = 'finished' if info.get('event') == 'batch-end' else f"{len(running)} running, {len(queued)} queued"
+        lines.append(f"\n{batch} ({label}, {started}/{info.get('files', len(files))} files started)")
+        total_rate = total_left = 0.0
+        for name, s in sorted(files.items()):
+            status = s.get('outcome', '?')
+            if status == 'running' and now - s.get('ts', now) > STALE_SECONDS:
+                status = 'stale'
+            if status in ('running', 'queued'):
+                # The batch ETA covers files still waiting for a slot, at the running files' rate
+                total_left += max(0, s.get('todo', 0) - s.get('done', 0))
+            if status not in ('running', 'stale') and not show_finished:
+                continue
+            rate = s.get('rate', 0.0) or 0.0
+            if status == 'running':
+                total_rate += rate
+            lines.append(f"  {name[:28]:<28}{status:<11}{s.get('done', 0):>7}/{s.get('todo', 0):<6}"
+                         f"{rate * 60:>12.1f}{s.get('bytes', 0) / 2 ** 20:>9.1f}{s.get('in_flight', 0):>11}"
+                         f"{_format_eta(s.get('eta_seconds')):>8}")
+        if total_rate:
+            lines.append(f"  {'batch':<28}{'':<11}{'':>14}{total_rate * 60:>12.1f}{'':>9}{'':>11}"
+                         f"{_format_eta(total_left / total_rate):>8}")
+    if len(lines) == 1:
+        lines.append("(no running extractions)")
+    return '\n'.join(lines)
+
+
+def watch(events_file: str, interval: float = 2.0, once: bool = False, show_finished: bool = False,
+          tail_bytes: int = WATCH_TAIL_BYTES):
+    """
+    Follow the events file and redraw the table every interval seconds.
+
+    Reading starts tail_bytes from the end (earlier events are of finished runs) and
+    restarts from the top when the file is rotated.
+    """
+    path = Path(events_file)
+    state: Dict = {}
+    position = None
+    inode = None
+    while True:
+        if path.exists():
+            with open(path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if position is None:
+                    position = max(0, stat.st_size - tail_bytes)
+                    if position:
+                        f.seek(position - 1)
+                        position += len(f.readline()) - 1  # Start at the first whole line
+                elif stat.st_ino != inode or stat.st_size < position:
+                    position = 0  # Rotated: a new file
+                inode = stat.st_ino
+                f.seek(position)
+                for raw in f:
+                    if not raw.endswith(b'\n'):
+                        break  # Half-written last line: read it next time
+                    position += len(raw)
+                    try:
+                        apply_event(state, json.loads(raw))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+        table = render(state, show_finished or once)
+        if once:
+            print(table)
+            return
+        print('\033[2J\033[H' + time.strftime('%H:%M:%S') + f"  {events_file}\n" + table, flush=True)
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Progress events for email extraction')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    watch_parser = subparsers.add_parser('watch', help='Live throughput of running extractions')
+    watch_parser.add_argument('--events', type=str, default=DEFAULT_EVENTS_FILE,
+                              help=f'Events file (default: {DEFAULT_EVENTS_FILE})')
+    watch_parser.add_argument('--interval', type=float, default=2.0, help='Refresh interval in seconds (default: 2)')
+    watch_parser.add_argument('--once', action='store_true', help='Print one snapshot (including finished files) and exit')
+    watch_parser.add_argument('--all', action='store_true', help='Also show finished files and batches')
+    args = parser.parse_args()
+
+    try:
+        watch(args.events, args.interval, args.once, args.all)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
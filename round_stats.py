@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Constant-memory statistics for email CSVs (2.4 round summaries and cross-round summaries).
+
+RoundStats keeps only mergeable sketches:
+- confidence: a fixed 0.1%-bucket histogram (exact for the whole-percent values 2.2
+  writes) plus exact count / sum / min / max
+- unique emails, papers and authors: DistinctCounter, an exact set of up to
+  exact_limit values that turns into a HyperLogLog (about 0.8% error) above it
+- email domains and paper years: plain counters (small)
+
+Stats of separate files can be computed in parallel and merged, so a summary over
+every round reads each file once in its own process:
+
+    python3.9 round_stats.py 'data/arxiv/round*/arxiv_high_confidence_non_chinese_no_acl_no_prior_rounds.csv'
+    python3.9 round_stats.py 'data/arxiv/round3/*_email.csv' --workers 8 --json
+"""
+
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+CONFIDENCE_BUCKETS = 1000          # 0.1% steps over 0-100%
+DEFAULT_EXACT_LIMIT = 100_000      # Distinct values counted exactly before switching to HyperLogLog
+HLL_PRECISION = 14                 # 2^14 registers (16 KB), ~0.8% standard error
+
+
+def parse_confidence(conf_str: str) -> float:
+    """Parse confidence string to float (e.g., '95%' -> 0.95)."""
+    try:
+        if isinstance(conf_str, str):
+            return float(conf_str.strip('%')) / 100.0
+        return float(conf_str)
+    except:
+        return 0.0
+
+
+def extract_year_from_url(paper_url: str) -> int:
+    """Extract year from arXiv paper URL or return 0 for non-arXiv."""
+    if '/pdf/' in paper_url:
+        arxiv_id = paper_url.split('/pdf/')[-1].replace('.pdf', '')
+        if len(arxiv_id) >= 2 and arxiv_id[:2].isdigit():
+            year_code = int(arxiv_id[:2])
+            return 2000 + year_code
+    return 0
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter over 64-bit hashes; merge() is a register-wise max."""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add_hash(self, h: int):
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: 'HyperLogLog'):
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))  # Linear counting for small cardinalities
+        return round(raw)
+
+
+class DistinctCounter:
+    """Distinct count that is exact up to exact_limit values, then a HyperLogLog."""
+
+    def __init__(self, exact_limit: int = DEFAULT_EXACT_LIMIT):
+        self.exact_limit = exact_limit
+        self.values = set()
+        self.hll: Optional[HyperLogLog] = None
+
+    def add(self, value: str):
+        if self.hll is not None:
+            self.hll.add_hash(_hash64(value))
+            return
+        self.values.add(value)
+        if len(self.values) > self.exact_limit:
+            self._to_hll()
+
+    def _to_hll(self):
+        self.hll = HyperLogLog()
+        for value in self.values:
+            self.hll.add_hash(_hash64(value))
+        self.values = set()
+
+    def merge(self, other: 'DistinctCounter'):
+        if self.hll is None and other.hll is None:
+            self.values |= other.values
+            if len(self.values) > self.exact_limit:
+                self._to_hll()
+            return
+        if self.hll is None:
+            self._to_hll()
+        if other.hll is not None:
+            self.hll.merge(other.hll)
+        else:
+            for value in other.values:
+                self.hll.add_hash(_hash64(value))
+
+    @property
+    def exact(self) -> bool:
+        return self.hll is None
+
+    def count(self) -> int:
+        return len(self.values) if self.hll is None else self.hll.estimate()
+
+
+class ConfidenceHistogram:
+    """Confidence scores in 0.1% buckets, with exact count, sum, min and max."""
+
+    def __init__(self):
+        self.buckets = [0] * (CONFIDENCE_BUCKETS + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value: float):
+        self.buckets[min(CONFIDENCE_BUCKETS, max(0, round(value * CONFIDENCE_BUCKETS)))] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: 'ConfidenceHistogram'):
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def value_at(self, rank: int) -> float:
+        """The rank-th smallest score (0-based), as its bucket value."""
+        seen = 0
+        for bucket, n in enumerate(self.buckets):
+            seen += n
+            if seen > rank:
+                return bucket / CONFIDENCE_BUCKETS
+        return self.max or 0
+
+    def percentiles(self) -> Dict[str, float]:
+        n = self.count
+        if not n:
+            return {key: 0 for key in ('min', 'p25', 'p50', 'p75', 'p90', 'p95', 'max', 'mean')}
+        return {
+            'min': self.min,
+            'p25': self.value_at(n // 4),
+            'p50': self.value_at(n // 2),
+            'p75': self.value_at(3 * n // 4),
+            'p90': self.value_at(9 * n // 10),
+            'p95': self.value_at(95 * n // 100),
+            'max': self.max,
+            'mean': self.total / n,
+        }
+
+
+class RoundStats:
+    """Mergeable statistics over email records (see generate_statistics in 2.4)."""
+
+    def __init__(self, exact_limit: int = DEFAULT_EXACT_LIMIT):
+        self.total_records = 0
+        self.emails = DistinctCounter(exact_limit)
+        self.papers = DistinctCounter(exact_limit)
+        self.authors = DistinctCounter(exact_limit)
+        self.confidence = ConfidenceHistogram()
+        self.email_domains = Counter()
+        self.years = Counter()
+
+    def add(self, record: Dict):
+        self.total_records += 1
+        email = record.get('Email', '').strip().lower()
+        paper_url = record.get('Paper URL', '').strip()
+        author = record.get('Author', '').strip()
+
+        self.confidence.add(parse_confidence(record.get('Confidence', '0%')))
+
+        if email:
+            self.emails.add(email)
+            if '@' in email:
+                self.email_domains[email.split('@')[1]] += 1
+
+        if paper_url:
+            self.papers.add(paper_url)
+            year = extract_year_from_url(paper_url)
+            if year > 0:
+                self.years[year] += 1
+
+        if author:
+            self.authors.add(author)
+
+    def add_all(self, records: Iterable[Dict]) -> 'RoundStats':
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: 'RoundStats') -> 'RoundStats':
+        self.total_records += other.total_records
+        self.emails.merge(other.emails)
+        self.papers.merge(other.papers)
+        self.authors.merge(other.authors)
+        self.confidence.merge(other.confidence)
+        self.email_domains.update(other.email_domains)
+        self.years.update(other.years)
+        return self
+
+    def summary(self) -> Dict:
+        """The statistics dict 2.4 writes to ROUND{N}_EMAIL_SUMMARY.txt ({} if there were no records)."""
+        if not self.total_records:
+            return {}
+        return {
+            'total_records': self.total_records,
+            'unique_emails': self.emails.count(),
+            'unique_papers': self.papers.count(),
+            'unique_authors': self.authors.count(),
+            'confidence_percentiles': self.confidence.percentiles(),
+            'top_domains': self.email_domains.most_common(20),
+            'year_distribution': dict(self.years),
+            'distinct_counts_exact': self.emails.exact and self.papers.exact and self.authors.exact,
+        }
+
+
+def file_stats(csv_file: str, exact_limit: int = DEFAULT_EXACT_LIMIT) -> RoundStats:
+    """Statistics of one CSV (NUL bytes stripped line by line)."""
+    with open(csv_file, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        return RoundStats(exact_limit).add_all(csv.DictReader(line.replace('\x00', '') for line in f))
+
+
+def stats_for_files(csv_files: List[str], workers: Optional[int] = None,
+                    exact_limit: int = DEFAULT_EXACT_LIMIT) -> RoundStats:
+    """Per-file statistics computed in worker processes, merged in file order."""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(csv_files) or 1))
+    merged = RoundStats(exact_limit)
+    if workers == 1:
+        for csv_file in csv_files:
+            merged.merge(file_stats(csv_file, exact_limit))
+        return merged
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for stats in executor.map(file_stats, csv_files, [exact_limit] * len(csv_files)):
+            merged.merge(stats)
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Statistics over email CSVs (several files or rounds merged)')
+    parser.add_argument('patterns', nargs='+', help='CSV files or glob patterns')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--exact-limit', type=int, default=DEFAULT_EXACT_LIMIT,
+                        help=f'Distinct values counted exactly before estimating (default: {DEFAULT_EXACT_LIMIT:,})')
+    parser.add_argument('--json', action='store_true', help='Print the statistics as JSON')
+    args = parser.parse_args()
+
+    csv_files = sorted({f for pattern in args.patterns for f in glob.glob(pattern, recursive=True)})
+    if not csv_files:
+        parser.error("No files match the given patterns")
+
+    stats = stats_for_files(csv_files, args.workers, args.exact_limit).summary()
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return
+    if not stats:
+        print("No records found")
+        return
+
+    estimated = '' if stats['distinct_counts_exact'] else ' (estimated)'
+    perc = stats['confidence_percentiles']
+    print(f"Files:              {len(csv_files):>12,}")
+    print(f"Total Records:      {stats['total_records']:>12,}")
+    print(f"Unique Emails:      {stats['unique_emails']:>12,}{estimated}")
+    print(f"Unique Papers:      {stats['unique_papers']:>12,}{estimated}")
+    print(f"Unique Authors:     {stats['unique_authors']:>12,}{estimated}")
+    print(f"Confidence:         mean {perc['mean']:.1%} | p25 {perc['p25']:.1%} | p50 {perc['p50']:.1%} | "
+          f"p75 {perc['p75']:.1%} | p95 {perc['p95']:.1%}")
+    for year in sorted(stats['year_distribution']):
+        print(f"{year}:               {stats['year_distribution'][year]:>12,}")
+    for i, (domain, count) in enumerate(stats['top_domains'][:10], 1):
+        print(f"{i:2}. {domain:<40} {count:>10,}")
+
+
+if __name__ == "__main__":
+    main()